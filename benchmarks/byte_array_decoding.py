@@ -0,0 +1,68 @@
+"""
+Benchmarks decoding replies whose result data is a json list of integers, as sent by old
+servers: the standard json decoder followed by converting the list to bytes, compared to
+the numpy based decoder in utspclient.decoding.
+
+Run it from the repository root:
+
+    python -m benchmarks.byte_array_decoding
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Callable
+
+from utspclient.datastructures import CalculationStatus, RestReply
+from utspclient.decoding import parse_rest_reply
+
+
+def parse_with_json(document: str) -> RestReply:
+    """Decodes a reply like the client did before the numpy based decoder existed"""
+    return RestReply(**json.loads(document))
+
+
+def measure(
+    parse: Callable[[str], RestReply], document: str, repetitions: int
+) -> float:
+    """
+    Measures the time for decoding a reply
+
+    :param parse: the function that decodes the reply
+    :type parse: Callable[[str], RestReply]
+    :param document: the json reply
+    :type document: str
+    :param repetitions: number of times the reply is decoded
+    :type repetitions: int
+    :return: the mean time per reply in seconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        parse(document)
+    return (time.perf_counter() - start) / repetitions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, default=4_000_000, help="result bytes")
+    parser.add_argument("--repetitions", type=int, default=5)
+    args = parser.parse_args()
+    data = os.urandom(args.size)
+    document = json.dumps(
+        {
+            "result_delivery": list(data),
+            "status": CalculationStatus.INDATABASE.value,
+            "request_hash": "benchmark",
+        }
+    )
+    assert parse_rest_reply(document) == parse_with_json(document)
+    print(f"Reply: {len(document)} characters for {args.size} bytes of result data")
+    for name, parse in [("json", parse_with_json), ("numpy", parse_rest_reply)]:
+        duration = measure(parse, document, args.repetitions)
+        print(f"{name:>6}: {duration:.3f} s per reply")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmarks building the JSON of many variants of an LPG config: changing the config and
+serializing it with dataclasses_json or with the generated serializers of
+utspclient.helpers.lpg_serialization, compared to rendering the variants from a
+ConfigTemplate.
+
+dataclasses_json is slow, so it only serializes a part of the configs by default and
+its time is extrapolated. Run it from the repository root:
+
+    python -m benchmarks.lpg_serialization
+"""
+
+import argparse
+import copy
+import time
+from typing import Callable, List, Tuple
+
+from utspclient.helpers import lpg_helper, lpg_serialization, lpgdata
+from utspclient.helpers.lpgpythonbindings import (
+    HouseCreationAndCalculationJob,
+    JsonReference,
+)
+
+Variant = Tuple[JsonReference, int]
+
+
+def create_variants(count: int) -> List[Variant]:
+    """
+    Creates the values that differ between the configs
+
+    :param count: number of variants
+    :type count: int
+    :return: a household and a random seed for each variant
+    :rtype: List[Variant]
+    """
+    households = list(lpg_helper.collect_lpg_households().values())
+    return [(households[i % len(households)], i) for i in range(count)]
+
+
+def build_configs(
+    base_config: HouseCreationAndCalculationJob,
+    variants: List[Variant],
+    serialize: Callable[[HouseCreationAndCalculationJob], str],
+) -> List[str]:
+    """Changes a copy of the base config for each variant and serializes it"""
+    results = []
+    for household, seed in variants:
+        config = copy.deepcopy(base_config)
+        assert config.House is not None and config.CalcSpec is not None
+        name_spec = config.House.Households[0].HouseholdNameSpec
+        assert name_spec is not None
+        name_spec.HouseholdReference = household
+        config.CalcSpec.RandomSeed = seed
+        results.append(serialize(config))
+    return results
+
+
+def render_configs(
+    base_config: HouseCreationAndCalculationJob, variants: List[Variant]
+) -> List[str]:
+    """Renders the variants from a template of the base config"""
+    template = lpg_serialization.ConfigTemplate(
+        base_config, ["HouseholdReference", "RandomSeed"]
+    )
+    return [
+        template.render(HouseholdReference=household, RandomSeed=seed)
+        for household, seed in variants
+    ]
+
+
+def measure(build: Callable[[], List[str]]) -> Tuple[float, List[str]]:
+    """
+    Measures the time for building the configs
+
+    :param build: the function that builds the configs
+    :type build: Callable[[], List[str]]
+    :return: the duration in seconds and the JSON of the configs
+    :rtype: Tuple[float, List[str]]
+    """
+    start = time.perf_counter()
+    results = build()
+    return time.perf_counter() - start, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=100_000, help="configs to build")
+    parser.add_argument(
+        "--baseline-count",
+        type=int,
+        default=5_000,
+        help="configs to serialize with dataclasses_json",
+    )
+    args = parser.parse_args()
+    base_config = lpg_helper.create_basic_lpg_config(
+        lpgdata.Households.CHR01_Couple_both_at_Work,
+        lpgdata.HouseTypes.HT06_Normal_house_with_15_000_kWh_Heating_Continuous_Flow_Gas_Heating,
+        "2021-01-01",
+        "2021-12-31",
+        "00:15:00",
+        calc_options=[lpgdata.CalcOption.SumProfileExternalIndividualHouseholdsAsJson],
+    )
+    variants = create_variants(args.count)
+    baseline_variants = variants[: args.baseline_count]
+    duration, baseline = measure(
+        lambda: build_configs(base_config, baseline_variants, lambda c: c.to_json())  # type: ignore
+    )
+    print(
+        f"{'dataclasses_json':>16}: {duration * args.count / len(baseline):.2f} s"
+        f" for {args.count} configs (extrapolated from {len(baseline)})"
+    )
+    duration, generated = measure(
+        lambda: build_configs(base_config, variants, lpg_serialization.to_json)
+    )
+    print(f"{'generated':>16}: {duration:.2f} s for {args.count} configs")
+    duration, rendered = measure(lambda: render_configs(base_config, variants))
+    print(f"{'template':>16}: {duration:.2f} s for {args.count} configs")
+    assert generated[: len(baseline)] == baseline
+    assert rendered == generated
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmarks importing the LPG helpers. Importing utspclient.helpers.lpg_helper neither
+loads the catalog data file nor imports the LPG bindings; both happen when the first
+catalog entry or LPG object is used. The benchmark compares the import of the working
+tree with the import of a baseline revision, e.g. the commit before the catalog
+entries were made lazy.
+
+Each measurement runs in a new interpreter, so that nothing is imported yet. Run it
+from the repository root:
+
+    python -m benchmarks.lpgdata_import --baseline <revision>
+"""
+
+import argparse
+import io
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from typing import List
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+#: modules whose import is measured, each one in a new interpreter
+MODULES = ["utspclient.helpers.lpg_helper", "utspclient"]
+
+
+def measure_once(module: str, directory: str) -> float:
+    """
+    Measures importing a module in a new interpreter
+
+    :param module: the module to import
+    :type module: str
+    :param directory: directory containing the utspclient package to import
+    :type directory: str
+    :return: the time for the import in seconds
+    :rtype: float
+    """
+    output = subprocess.check_output(
+        [sys.executable, "-c", SCRIPT.format(module=module)], cwd=directory
+    )
+    return float(output)
+
+
+def measure(module: str, directory: str, repetitions: int) -> float:
+    """Returns the median time of importing a module in a new interpreter"""
+    return statistics.median(
+        measure_once(module, directory) for _ in range(repetitions)
+    )
+
+
+def extract_revision(revision: str, directory: str) -> None:
+    """Extracts the utspclient package of a git revision into a directory"""
+    archive = subprocess.check_output(
+        ["git", "archive", "--format=tar", revision, "utspclient"]
+    )
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(directory)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repetitions", type=int, default=15)
+    parser.add_argument("--baseline", required=True, help="git revision to compare with")
+    args = parser.parse_args()
+    baseline = args.baseline
+    with tempfile.TemporaryDirectory() as baseline_directory:
+        extract_revision(baseline, baseline_directory)
+        for module in MODULES:
+            times: List[float] = [
+                measure(module, directory, args.repetitions)
+                for directory in [baseline_directory, os.getcwd()]
+            ]
+            print(
+                f"import {module}: {times[1] * 1000:.2f} ms "
+                f"(baseline {baseline[:10]}: {times[0] * 1000:.2f} ms)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmarks the transfer of result data from the server to the client in the different
+result transports: the json list of integers sent by old servers, a base64 string in the
+json reply and the raw response body.
+
+Uses the stand-in server from the tests, so the times include encoding the replies on
+the server. Run it from the repository root:
+
+    python -m benchmarks.result_transport
+"""
+
+import argparse
+import time
+
+from tests.stand_in_server import StandInServer, create_delivery
+from utspclient.client import UTSPClient
+from utspclient.datastructures import TimeSeriesRequest
+
+TRANSPORTS = {
+    "json list": (),
+    "base64": ("base64",),
+    "octet-stream": ("octet-stream", "base64"),
+}
+
+
+def measure(transports: tuple, result_size: int, repetitions: int) -> float:
+    """
+    Measures the time for requesting a finished result from the stand-in server
+
+    :param transports: result transports supported by the server
+    :type transports: tuple
+    :param result_size: size of the result file in bytes
+    :type result_size: int
+    :param repetitions: number of requests to send
+    :type repetitions: int
+    :return: the mean time per request in seconds
+    :rtype: float
+    """
+    server = StandInServer(ready_after=0, result_transports=transports)
+    server.result_size = result_size
+    server.start()
+    request = TimeSeriesRequest("benchmark", "provider")
+    try:
+        with UTSPClient(server.url) as client:
+            # the first request also creates the delivery on the server
+            client.send_request(request)
+            start = time.perf_counter()
+            for _ in range(repetitions):
+                client.send_request(request)
+            return (time.perf_counter() - start) / repetitions
+    finally:
+        server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, default=4_000_000, help="result bytes")
+    parser.add_argument("--repetitions", type=int, default=5)
+    args = parser.parse_args()
+    request = TimeSeriesRequest("benchmark", "provider")
+    compressed_size = len(create_delivery(request.to_json(), args.size))  # type: ignore
+    print(
+        f"Result file: {args.size} bytes, compressed delivery: {compressed_size} bytes"
+    )
+    for name, transports in TRANSPORTS.items():
+        duration = measure(transports, args.size, args.repetitions)
+        print(f"{name:>12}: {duration:.3f} s per request")
+
+
+if __name__ == "__main__":
+    main()
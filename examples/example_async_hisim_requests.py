@@ -0,0 +1,45 @@
+"""Sends multiple requests to HiSim concurrently using the asynchronous client and collects all results."""
+
+import asyncio
+import os
+from typing import List
+
+from utspclient.async_client import AsyncUTSPClient
+from utspclient.datastructures import TimeSeriesRequest
+
+# load a HiSim system configuration
+example_folder = os.path.dirname(os.path.abspath(__file__))
+system_config_path = os.path.join(example_folder, "input data\\hisim_config.json")
+with open(system_config_path, "r") as config_file:
+    example_system_config = config_file.read()
+
+# Define URL to time Series request
+URL = "http://134.94.131.167:443/api/v1/profilerequest"
+API_KEY = ""
+
+
+async def main() -> List[str]:
+    # Define all hisim system configurations here (in this case 10 configs with different guids)
+    all_requests = [
+        TimeSeriesRequest(
+            example_system_config,
+            "hisim",
+            guid=str(i),
+            required_result_files=dict.fromkeys(["KPIs.csv"]),
+        )
+        for i in range(10)
+    ]
+    # At most 20 HTTP requests are sent to the UTSP at the same time
+    async with AsyncUTSPClient(URL, API_KEY, max_concurrency=20) as client:
+        # Send all requests and wait for all of them concurrently
+        results = await asyncio.gather(
+            *[
+                client.request_time_series_and_wait_for_delivery(request)
+                for request in all_requests
+            ]
+        )
+    return [result.data["KPIs.csv"].decode() for result in results]
+
+
+kpis = asyncio.run(main())
+print(f"Retrieved results from {len(kpis)} HiSim requests")
@@ -1,14 +1,15 @@
+import dataclasses
 import json
-import time
 from datetime import datetime, timedelta
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 import numpy as np
 import pandas as pd
 from utspclient import datastructures
-from utspclient.helpers import lpg_helper
+from utspclient.helpers import lpg_helper, lpg_serialization
 from utspclient import result_file_filters
-from utspclient.client import get_result, send_request
+from utspclient.campaign import Campaign
+from utspclient.client import UTSPClient, count_statuses, get_result
 from utspclient.datastructures import (
     CalculationStatus,
     ResultDelivery,
@@ -19,6 +20,8 @@ from utspclient.helpers.lpgpythonbindings import EnergyIntensityType
 from utspclient.helpers.lpgpythonbindings import CalcOption
 
 API_KEY = ""
+# manifest that stores the request hashes returned by the server between the runs
+CAMPAIGN_PATH = "./lpg_mean_profiles_campaign.sqlite"
 
 
 def get_hh_id(hh_name: str) -> str:
@@ -31,86 +34,99 @@ def request_all_profiles(
 ) -> Tuple[bool, Dict[str, Dict[str, ResultDelivery]]]:
     base_url = f"http://{server_address}/api/v1/"
     new_request_url = base_url + "profilerequest"
-    status_url = base_url + "requeststatus"
-    request_statuses = {}
+    client = UTSPClient(new_request_url, API_KEY)
     results: Dict[str, Dict[str, ResultDelivery]] = {}
-    new_requests = 0
-    start_time = time.time()
+    # create multiple identical requests for each household with different guids
+    requests: List[TimeSeriesRequest] = []
+    request_hashes: List[str] = []
+    request_ids: List[Tuple[str, str]] = []
+    # the requests only differ in the household, so the config is serialized only once
+    lpg_request = lpg_helper.create_basic_lpg_config(
+        next(iter(households.values())),
+        HouseTypes.HT06_Normal_house_with_15_000_kWh_Heating_Continuous_Flow_Gas_Heating,
+        "2021-01-04",
+        "2022-01-09",
+        "01:00:00",
+        energy_intensity=EnergyIntensityType.EnergySaving,
+        calc_options=[CalcOption.SumProfileExternalIndividualHouseholdsAsJson],
+    )
+    config_template = lpg_serialization.ConfigTemplate(
+        lpg_request, ["HouseholdReference"]
+    )
     for hh_name, hh_ref in households.items():
-        hh_id = get_hh_id(hh_name)
-
         # create the request for this household
-        lpg_request = lpg_helper.create_basic_lpg_config(
-            hh_ref,
-            HouseTypes.HT06_Normal_house_with_15_000_kWh_Heating_Continuous_Flow_Gas_Heating,
-            "2021-01-04",
-            "2022-01-09",
-            "01:00:00",
-            energy_intensity=EnergyIntensityType.EnergySaving,
-            calc_options=[CalcOption.SumProfileExternalIndividualHouseholdsAsJson],
+        lpg_request_str = config_template.render(HouseholdReference=hh_ref)
+        base_request = TimeSeriesRequest(
+            lpg_request_str,
+            "lpg",
+            required_result_files={
+                result_file_filters.LPGFilters.sum_hh1_ext_res(
+                    "Electricity", 3600
+                ): datastructures.ResultFileRequirement.REQUIRED
+            },
         )
-        lpg_request_str = lpg_request.to_json()  # type: ignore
-
-        # create multiple identical request for each household with different guids
         results[hh_name] = {}
         for i in range(repetitions_per_household):
-            # check time and print a progress report
-            if time.time() - start_time > 10:
-                start_time = time.time()
-                print(f"Sending requests for household {hh_id}, repetition {i}")
             guid = str(i)
-            request = TimeSeriesRequest(
-                lpg_request_str,
-                "lpg",
-                guid,
-                {
-                    result_file_filters.LPGFilters.sum_hh1_ext_res(
-                        "Electricity", 3600
-                    ): datastructures.ResultFileRequirement.REQUIRED
-                },
-            )
-            url = new_request_url if retrieve_data else status_url
-            # check the status of this request
-            reply = send_request(url, request, API_KEY)
-            if reply.status == CalculationStatus.UNKNOWN:
-                # The request was not sent before, so it is sent now. Only when a request
-                # is sent to this url it can be added to the calculation queue
-                reply = send_request(new_request_url, request, API_KEY)
-                assert reply.status == CalculationStatus.CALCULATIONSTARTED
-                new_requests += 1
-
-            # check if the request calculation failed
-            request_statuses[(hh_id, guid)] = reply.status
-            if reply.status == CalculationStatus.CALCULATIONFAILED:
-                print(
-                    f"{hh_id}, {guid} failed: {reply.info}",
-                )
-            # retrieve the result data
+            requests.append(dataclasses.replace(base_request, guid=guid))
+            # only the guid has to be hashed for each repetition
+            request_hashes.append(base_request.get_cache_key_with_guid(guid))
+            request_ids.append((hh_name, guid))
+
+    new_requests = 0
+    if retrieve_data:
+        # send all requests in batches to retrieve the results
+        replies = client.send_requests(requests)
+        statuses = np.array([reply.status.value for reply in replies], dtype=np.int8)
+        for (hh_name, guid), reply in zip(request_ids, replies):
             if reply.status == CalculationStatus.INDATABASE and reply.result_delivery:
                 result = get_result(reply)
                 assert result is not None, "Delivered time series was None"
                 results[hh_name][guid] = result
+    else:
+        # the server identifies the requests by the hashes it returned when they were
+        # submitted, which are stored in the campaign manifest
+        campaign = Campaign(CAMPAIGN_PATH)
+        campaign.add_many(requests, request_hashes=request_hashes)
+        server_hashes = campaign.get_server_hashes(request_hashes)
+        statuses = np.full(len(requests), CalculationStatus.UNKNOWN.value, np.int8)
+        submitted = [j for j, server_hash in enumerate(server_hashes) if server_hash]
+        if submitted:
+            # check the statuses of all submitted requests at once
+            statuses[submitted] = client.get_statuses(
+                server_hash for server_hash in server_hashes if server_hash
+            )
+            campaign.record_statuses(
+                [request_hashes[j] for j in submitted], statuses[submitted]
+            )
+        # Requests that were not sent before are sent now. Only when a request is sent
+        # to the profile request url it can be added to the calculation queue
+        unknown = np.flatnonzero(statuses == CalculationStatus.UNKNOWN.value)
+        if len(unknown) > 0:
+            replies = client.send_requests(requests[j] for j in unknown)
+            campaign.record_replies([request_hashes[j] for j in unknown], replies)
+            statuses[unknown] = [reply.status.value for reply in replies]
+            new_requests = len(unknown)
+        campaign.close()
+
+    # print the failed requests
+    for index in np.flatnonzero(statuses == CalculationStatus.CALCULATIONFAILED.value):
+        hh_name, guid = request_ids[index]
+        print(f"{get_hh_id(hh_name)}, {guid} failed")
 
     # calculate the number of completed and failed requests
-    completed_requests = sum(
-        1
-        for _, status in request_statuses.items()
-        if status == CalculationStatus.INDATABASE
-    )
-    failed_requests = sum(
-        1
-        for _, status in request_statuses.items()
-        if status == CalculationStatus.CALCULATIONFAILED
-    )
+    counts = count_statuses(statuses)
+    completed_requests = counts[CalculationStatus.INDATABASE]
+    failed_requests = counts[CalculationStatus.CALCULATIONFAILED]
     if not retrieve_data:
         # print an overview of the request statuses
         print(f"Sent {new_requests or 'no'} new requests.")
         print(
-            f"Completion: {100 * completed_requests // len(request_statuses)} %  ({completed_requests} of {len(request_statuses)})"
+            f"Completion: {100 * completed_requests // len(statuses)} %  ({completed_requests} of {len(statuses)})"
         )
-        print(f"Failed requests: {failed_requests} of {len(request_statuses)}")
+        print(f"Failed requests: {failed_requests} of {len(statuses)}")
     # determine whether all requests have been calculated already
-    all_finished = completed_requests == len(request_statuses)
+    all_finished = completed_requests == len(statuses)
     return all_finished, results
 
 
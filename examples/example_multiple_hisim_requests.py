@@ -3,8 +3,8 @@
 import os
 from typing import List
 
-from utspclient.client import request_time_series_and_wait_for_delivery, send_request
-from utspclient.datastructures import CalculationStatus, TimeSeriesRequest
+from utspclient.client import as_completed, submit_many
+from utspclient.datastructures import TimeSeriesRequest
 
 # load a HiSim system configuration
 example_folder = os.path.dirname(os.path.abspath(__file__))
@@ -30,21 +30,16 @@ all_requests = [
     for config in all_hisim_configs
 ]
 
-# Send all requests to the UTSP
-for request in all_requests:
-    # This function just sends the request and immediately returns so the other requests don't have to wait
-    reply = send_request(URL, request, API_KEY)
+# Send all requests to the UTSP. This function just sends the requests and immediately
+# returns futures, so the requests are calculated in parallel.
+futures = submit_many(URL, all_requests, API_KEY)
 
-# Collect the results
+# Collect the results in the order in which they are finished
 results: List[str] = []
-for request in all_requests:
-    # This function waits until the request has been processed and the results are available
-    result = request_time_series_and_wait_for_delivery(URL, request, API_KEY)
-    assert (
-        reply.status != CalculationStatus.CALCULATIONFAILED
-    ), f"The calculation failed: {reply.info}"
+for future in as_completed(futures):
+    # Raises an exception if the calculation failed
+    result = future.result()
     kpi = result.data["KPIs.csv"].decode()
     results.append(kpi)
 
-
 print(f"Retrieved results from {len(results)} HiSim requests")
@@ -18,8 +18,9 @@ setuptools.setup(
     url="https://github.com/FZJ-IEK3-VSA/UTSP_Client",
     include_package_data=True,
     packages=setuptools.find_packages(),
-    package_data={"utspclient": ["py.typed"]},
+    package_data={"utspclient": ["py.typed"], "utspclient.helpers": ["lpgdata.json"]},
     install_requires=required_packages,
+    extras_require={"async": ["aiohttp"]},
     setup_requires=["setuptools-git"],
     license="MIT license",
     classifiers=[
@@ -0,0 +1,47 @@
+import base64
+import json
+import zlib
+from typing import Iterator, List
+
+import pytest
+
+from tests.stand_in_server import StandInServer
+from utspclient.datastructures import TimeSeriesRequest
+from utspclient.polling import PollingPolicy
+
+#: Polling policy that checks the status every 10 ms, so that tests do not have to wait
+FAST_POLLING = PollingPolicy(initial_delay=0.01, max_delay=0.01, learn_durations=False)
+
+#: Original request of the deliveries created by create_delivery_data
+DELIVERY_REQUEST = {"simulation_config": "config", "providername": "provider"}
+
+
+def create_request(index: int = 0) -> TimeSeriesRequest:
+    return TimeSeriesRequest(f"config {index}", "provider")
+
+
+def create_requests(count: int) -> List[TimeSeriesRequest]:
+    return [create_request(i) for i in range(count)]
+
+
+def create_request_with_input_files(
+    index: int = 0, **contents: bytes
+) -> TimeSeriesRequest:
+    input_files = {
+        name: base64.b64encode(content).decode() for name, content in contents.items()
+    }
+    return TimeSeriesRequest(f"config {index}", "provider", input_files=input_files)
+
+
+def create_delivery_data(data: dict) -> bytes:
+    """Creates a compressed result delivery with the specified result files, each one
+    as json list of integers"""
+    document = {"original_request": DELIVERY_REQUEST, "data": data}
+    return zlib.compress(json.dumps(document).encode("utf-8"))
+
+
+@pytest.fixture
+def server() -> Iterator[StandInServer]:
+    stand_in = StandInServer().start()
+    yield stand_in
+    stand_in.stop()
@@ -0,0 +1,330 @@
+"""
+Minimal stand-in for a UTSP server, so that the clients can be tested without a real
+server. Each request is reported as being calculated for a configurable number of
+status checks before its result is delivered. The calculation of requests whose
+simulation config starts with "fail" fails.
+"""
+
+import base64
+import functools
+import hashlib
+import json
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from utspclient.protocol import CONTENT_HASH_HEADER, REQUEST_HASH_HEADER, STATUS_HEADER
+from utspclient.datastructures import CalculationStatus
+
+
+@functools.lru_cache(maxsize=16)
+def create_delivery(request: str, result_size: int = 0) -> bytes:
+    """
+    Creates the compressed result delivery for a request. It contains a single result
+    file whose content depends on the request.
+
+    :param request: the request as json string
+    :type request: str
+    :param result_size: number of random bytes appended to the result file, defaults
+        to 0
+    :type result_size: int, optional
+    :return: the compressed result delivery
+    :rtype: bytes
+    """
+    content = b"result of " + hashlib.sha256(request.encode("utf-8")).digest()
+    content += random.Random(request).randbytes(result_size)
+    delivery = {
+        "original_request": json.loads(request),
+        "data": {"out.txt": list(content)},
+    }
+    return zlib.compress(json.dumps(delivery).encode("utf-8"))
+
+
+class StandInServer:
+    """
+    A UTSP server running in a background thread on a free local port. The supported
+    endpoints can be switched on and off, and the server records how often each endpoint
+    was called and how many requests it handled at the same time.
+    """
+
+    def __init__(
+        self,
+        ready_after: int = 2,
+        status_by_hash: bool = True,
+        bulk_status: bool = False,
+        batch: bool = True,
+        result_transports: Tuple[str, ...] = (),
+        input_file_store: bool = False,
+        delay: float = 0,
+        content_encodings: Tuple[str, ...] = ("gzip", "deflate"),
+        encoding_error_code: int = 415,
+    ) -> None:
+        """
+        Creates a new stand-in server. It is started with :meth:`start`.
+
+        :param ready_after: number of times a request has to be sent or polled before its
+            result is delivered, defaults to 2
+        :type ready_after: int, optional
+        :param status_by_hash: whether the server supports status requests by hash,
+            defaults to True
+        :type status_by_hash: bool, optional
+        :param bulk_status: whether the server supports bulk status requests, defaults to
+            False
+        :type bulk_status: bool, optional
+        :param batch: whether the server supports batches of requests, defaults to True
+        :type batch: bool, optional
+        :param result_transports: binary formats for result data the server sends if the
+            client asks for them, "octet-stream" for a raw response body and "base64" for
+            a base64 string in the json reply. Without them, result data is sent as json
+            list of integers like on old servers. Defaults to none.
+        :type result_transports: Tuple[str, ...], optional
+        :param input_file_store: whether the server provides an input file store, defaults
+            to False
+        :type input_file_store: bool, optional
+        :param delay: time in seconds the server waits before answering each request,
+            defaults to 0
+        :type delay: float, optional
+        :param content_encodings: content encodings of request bodies the server can
+            decode, defaults to gzip and deflate
+        :type content_encodings: Tuple[str, ...], optional
+        :param encoding_error_code: status code for rejecting a request body with another
+            content encoding, defaults to 415
+        :type encoding_error_code: int, optional
+        """
+        self.ready_after = ready_after
+        self.status_by_hash = status_by_hash
+        # whether replies to status requests by hash contain the results of finished
+        # requests, or only their status
+        self.status_by_hash_results = True
+        self.bulk_status = bulk_status
+        # if set, the next bulk status request forgets all submitted requests first, as if
+        # the server was restarted
+        self.forget_requests = False
+        # if set, bulk status requests report this status code for all requests
+        self.bulk_status_code: Optional[int] = None
+        self.batch = batch
+        self.result_transports = result_transports
+        self.input_file_store = input_file_store
+        # contents of the uploaded input files by sha256 hash
+        self.input_files: Dict[str, bytes] = {}
+        # number of random bytes appended to each result file
+        self.result_size = 0
+        # if set, the server drops replies from each batch beyond this number
+        self.max_batch_replies: Optional[int] = None
+        self.delay = delay
+        # number of following HTTP requests that are answered with 502 Bad Gateway, to
+        # simulate failing connections
+        self.failures = 0
+        self.content_encodings = content_encodings
+        self.encoding_error_code = encoding_error_code
+        # number of HTTP requests for each endpoint
+        self.calls: Counter = Counter()
+        # number of decoded request bodies for each content encoding
+        self.encodings: Counter = Counter()
+        # number of replies with result data for each result transport
+        self.transports: Counter = Counter()
+        # number of requests in each received batch
+        self.batch_sizes: List[int] = []
+        # submitted requests by request hash, and how often each one was sent or polled
+        self.requests: Dict[str, str] = {}
+        self.checks: Counter = Counter()
+        # number of HTTP requests handled at the moment and the maximum of it
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        """URL of the profile request endpoint"""
+        assert self._server is not None, "The server was not started"
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}/api/v1/profilerequest"
+
+    def start(self) -> "StandInServer":
+        """Starts the server in a background thread"""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.stand_in = self  # type: ignore
+        threading.Thread(
+            target=self._server.serve_forever, args=(0.01,), daemon=True
+        ).start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the server"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def handle(
+        self, endpoint: str, headers: Any, body: bytes
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Handles a single HTTP request
+
+        :param endpoint: the last part of the request path, e.g. profilerequest
+        :type endpoint: str
+        :param headers: the headers of the HTTP request
+        :type headers: Any
+        :param body: the body of the HTTP request
+        :type body: bytes
+        :return: the status code, headers and body of the response
+        :rtype: Tuple[int, Dict[str, str], bytes]
+        """
+        with self._lock:
+            self.calls[endpoint] += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            fail = self.failures > 0
+            if fail:
+                self.failures -= 1
+        try:
+            if fail:
+                return 502, {}, b""
+            if self.delay:
+                time.sleep(self.delay)
+            encoding = headers.get("Content-Encoding")
+            if encoding is not None:
+                if encoding not in self.content_encodings:
+                    return self.encoding_error_code, {}, b""
+                body = zlib.decompress(body, 31 if encoding == "gzip" else 15)
+                with self._lock:
+                    self.encodings[encoding] += 1
+            if endpoint == "inputfilecheck" and self.input_file_store:
+                with self._lock:
+                    missing = [h for h in json.loads(body) if h not in self.input_files]
+                return self._reply(missing, headers)
+            if endpoint == "inputfileupload" and self.input_file_store:
+                content_hash = headers.get(CONTENT_HASH_HEADER)
+                if hashlib.sha256(body).hexdigest() != content_hash:
+                    return 400, {}, b""
+                with self._lock:
+                    self.input_files[content_hash] = body
+                return 200, {}, b""
+            if endpoint == "profilerequest":
+                return self._reply(self._submit(json.loads(body)), headers)
+            if endpoint == "profilerequestbatch" and self.batch:
+                return self._reply(self._submit_batch(json.loads(body)), headers)
+            if endpoint == "requeststatusbyhash" and self.status_by_hash:
+                reply = self._check(json.loads(body))
+                if not self.status_by_hash_results:
+                    reply.pop("result_delivery", None)
+                return self._reply(reply, headers)
+            if endpoint == "requeststatusbulk" and self.bulk_status:
+                return self._reply(self._check_bulk(json.loads(body)), headers)
+            return 404, {}, b""
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def _submit(self, request: str) -> Dict[str, Any]:
+        references = json.loads(request).get("input_file_references", {})
+        with self._lock:
+            if any(h not in self.input_files for h in references.values()):
+                return {
+                    "status": CalculationStatus.CALCULATIONFAILED.value,
+                    "info": "unknown input file",
+                }
+        request_hash = hashlib.sha256(request.encode("utf-8")).hexdigest()
+        with self._lock:
+            self.requests[request_hash] = request
+        return self._check(request_hash)
+
+    def _submit_batch(self, requests: List[str]) -> List[Dict[str, Any]]:
+        with self._lock:
+            self.batch_sizes.append(len(requests))
+        replies = [self._submit(request) for request in requests]
+        return replies[: self.max_batch_replies]
+
+    def _check_bulk(self, request_hashes: List[str]) -> List[int]:
+        with self._lock:
+            if self.forget_requests:
+                self.forget_requests = False
+                self.requests.clear()
+                self.checks.clear()
+        if self.bulk_status_code is not None:
+            return [self.bulk_status_code] * len(request_hashes)
+        return [self._check(request_hash)["status"] for request_hash in request_hashes]
+
+    def _check(self, request_hash: str) -> Dict[str, Any]:
+        with self._lock:
+            request = self.requests.get(request_hash)
+            if request is None:
+                return {"status": CalculationStatus.UNKNOWN.value}
+            self.checks[request_hash] += 1
+            count = self.checks[request_hash]
+        reply: Dict[str, Any] = {"request_hash": request_hash}
+        if count > self.ready_after and request.startswith(
+            '{"simulation_config": "fail'
+        ):
+            reply["status"] = CalculationStatus.CALCULATIONFAILED.value
+            reply["info"] = "failed on purpose"
+        elif count > self.ready_after:
+            reply["status"] = CalculationStatus.INDATABASE.value
+            reply["result_delivery"] = create_delivery(request, self.result_size)
+        elif count == 1:
+            reply["status"] = CalculationStatus.CALCULATIONSTARTED.value
+        else:
+            reply["status"] = CalculationStatus.INCALCULATION.value
+        return reply
+
+    def _reply(self, value: Any, headers: Any) -> Tuple[int, Dict[str, str], bytes]:
+        """Encodes a reply in the result transport the client asked for"""
+        if (
+            isinstance(value, dict)
+            and "result_delivery" in value
+            and "octet-stream" in self.result_transports
+            and "application/octet-stream" in headers.get("Accept", "")
+        ):
+            with self._lock:
+                self.transports["octet-stream"] += 1
+            reply_headers = {
+                "Content-Type": "application/octet-stream",
+                STATUS_HEADER: str(value["status"]),
+                REQUEST_HASH_HEADER: value["request_hash"],
+            }
+            return 200, reply_headers, value["result_delivery"]
+        transport = "list"
+        if (
+            "base64" in self.result_transports
+            and headers.get("UTSP-Result-Encoding") == "base64"
+        ):
+            transport = "base64"
+
+        def encode_bytes(data: bytes) -> Any:
+            with self._lock:
+                self.transports[transport] += 1
+            if transport == "base64":
+                return base64.b64encode(data).decode()
+            return list(data)
+
+        content = json.dumps(value, default=encode_bytes).encode()
+        return 200, {"Content-Type": "application/json"}, content
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        endpoint = self.path.rstrip("/").rsplit("/", 1)[-1]
+        status, headers, content = self.server.stand_in.handle(  # type: ignore
+            endpoint, self.headers, body
+        )
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
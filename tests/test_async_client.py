@@ -0,0 +1,190 @@
+import asyncio
+import gc
+import zlib
+
+import pytest
+
+from tests.conftest import (
+    FAST_POLLING,
+    create_request,
+    create_request_with_input_files,
+)
+from tests.stand_in_server import StandInServer
+from utspclient.async_client import AsyncUTSPClient
+from utspclient.cache import ResultCache
+from utspclient.datastructures import CalculationStatus, RestReply, TimeSeriesRequest
+
+
+def test_concurrency_limit(server: StandInServer):
+    server.delay = 0.05
+
+    async def send_all():
+        async with AsyncUTSPClient(server.url, max_concurrency=3) as client:
+            return await asyncio.gather(
+                *[client.send_request(create_request(i)) for i in range(12)]
+            )
+
+    replies = asyncio.run(send_all())
+    assert all(r.status == CalculationStatus.CALCULATIONSTARTED for r in replies)
+    assert server.max_active == 3
+
+
+def test_wait_for_delivery_polls_by_hash(server: StandInServer):
+    async def wait():
+        async with AsyncUTSPClient(server.url, polling_policy=FAST_POLLING) as client:
+            return await asyncio.gather(
+                *[
+                    client.request_time_series_and_wait_for_delivery(create_request())
+                    for _ in range(3)
+                ]
+            )
+
+    results = asyncio.run(wait())
+    assert all(result.original_request == create_request() for result in results)
+    # identical requests are only sent once and then polled by their hash
+    assert server.calls["profilerequest"] == 1
+    assert server.calls["requeststatusbyhash"] == server.ready_after
+
+
+def test_poll_resends_request_if_status_reply_has_no_results(server: StandInServer):
+    server.status_by_hash_results = False
+
+    async def wait():
+        async with AsyncUTSPClient(server.url, polling_policy=FAST_POLLING) as client:
+            return await client.request_time_series_and_wait_for_delivery(
+                create_request()
+            )
+
+    result = asyncio.run(wait())
+    assert result.data["out.txt"].startswith(b"result of ")
+    assert server.calls["requeststatusbyhash"] == server.ready_after
+    assert server.calls["profilerequest"] == 2
+
+
+def test_undecodable_results_are_not_cached(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+    reply = RestReply(b"corrupt", CalculationStatus.INDATABASE, "abc")
+
+    async def get_result():
+        async with AsyncUTSPClient("http://localhost", cache=cache) as client:
+            return await client.get_result(reply, create_request())
+
+    with pytest.raises(zlib.error):
+        asyncio.run(get_result())
+    assert len(cache) == 0
+    cache.close()
+
+
+async def send_requests(client: AsyncUTSPClient, *requests: TimeSeriesRequest):
+    async with client:
+        return [await client.send_request(request) for request in requests]
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+def test_request_compression(server: StandInServer, encoding: str):
+    client = AsyncUTSPClient(
+        server.url, request_compression=encoding, compression_threshold=500
+    )
+    asyncio.run(
+        send_requests(client, create_request(), TimeSeriesRequest("x" * 500, "p"))
+    )
+    # only the large request is compressed
+    assert server.encodings == {encoding: 1}
+    assert server.calls["profilerequest"] == 2
+    assert client.request_compression_supported
+
+
+@pytest.mark.parametrize("error_code", [400, 415])
+def test_request_compression_fallback(server: StandInServer, error_code: int):
+    server.content_encodings = ()
+    server.encoding_error_code = error_code
+    client = AsyncUTSPClient(
+        server.url, request_compression="gzip", compression_threshold=0
+    )
+    replies = asyncio.run(send_requests(client, create_request(), create_request(1)))
+    assert all(r.status == CalculationStatus.CALCULATIONSTARTED for r in replies)
+    assert client.request_compression_supported is False
+    # the second request is sent uncompressed right away
+    assert server.calls["profilerequest"] == 3
+    assert not server.encodings
+
+
+def test_send_requests_in_batches(server: StandInServer):
+    client = AsyncUTSPClient(server.url, batch_size=3)
+
+    async def send_all():
+        async with client:
+            return await client.send_requests([create_request(i) for i in range(7)])
+
+    replies = asyncio.run(send_all())
+    assert len({reply.request_hash for reply in replies}) == 7
+    assert server.batch_sizes == [3, 3, 1]
+    assert server.calls["profilerequest"] == 0
+    assert client.batch_supported
+
+
+def test_send_requests_checks_number_of_replies(server: StandInServer):
+    server.max_batch_replies = 2
+
+    async def send_all():
+        async with AsyncUTSPClient(server.url) as client:
+            return await client.send_requests([create_request(i) for i in range(3)])
+
+    with pytest.raises(Exception, match="Received 2 replies for 3 requests"):
+        asyncio.run(send_all())
+
+
+def test_send_requests_without_batches(server: StandInServer):
+    server.batch = False
+    server.delay = 0.05
+    client = AsyncUTSPClient(server.url, max_concurrency=3)
+
+    async def send_all():
+        async with client:
+            return await client.send_requests([create_request(i) for i in range(6)])
+
+    replies = asyncio.run(send_all())
+    assert len(replies) == 6
+    assert client.batch_supported is False
+    # the requests are sent individually and concurrently
+    assert server.calls["profilerequest"] == 6
+    assert server.max_active == 3
+
+
+def test_client_can_be_reused_in_another_event_loop(server: StandInServer, recwarn):
+    server.delay = 0.02
+    client = AsyncUTSPClient(server.url, max_concurrency=1)
+
+    async def send_all():
+        return await asyncio.gather(
+            *[client.send_request(create_request(i)) for i in range(3)]
+        )
+
+    # the client is not closed between the event loops
+    for _ in range(2):
+        replies = asyncio.run(send_all())
+        assert len(replies) == 3
+    asyncio.run(client.close())
+    gc.collect()
+    assert server.max_active == 1
+    assert not [w for w in recwarn if "Unclosed" in str(w.message)]
+
+
+def test_input_files_are_uploaded_once(server: StandInServer):
+    server.input_file_store = True
+    requests = [create_request_with_input_files(i, a=b"content") for i in range(3)]
+    client = AsyncUTSPClient(server.url, upload_input_files=True)
+    replies = asyncio.run(send_requests(client, *requests))
+    assert all(r.status == CalculationStatus.CALCULATIONSTARTED for r in replies)
+    assert server.calls["inputfilecheck"] == 1
+    assert server.calls["inputfileupload"] == 1
+    assert list(server.input_files.values()) == [b"content"]
+
+
+def test_input_files_fall_back_to_inline(server: StandInServer):
+    requests = [create_request_with_input_files(i, a=b"content") for i in range(2)]
+    client = AsyncUTSPClient(server.url, upload_input_files=True)
+    asyncio.run(send_requests(client, *requests))
+    assert client.input_file_store_supported is False
+    assert server.calls["inputfilecheck"] == 1
+    assert server.calls["profilerequest"] == 2
@@ -0,0 +1,203 @@
+import itertools
+import sqlite3
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from tests.conftest import create_delivery_data
+from utspclient.cache import (
+    DecodedResultCache,
+    ResultCache,
+    get_delivery_size,
+    get_request_hash,
+)
+from utspclient.datastructures import ResultDelivery, TimeSeriesRequest
+from utspclient.decoding import decompress_result_delivery_lazy
+
+
+def test_request_hash_of_json_does_not_deserialize(monkeypatch):
+    request = TimeSeriesRequest("config", "provider", input_files={"a.txt": "YWI="})
+    text = request.to_json()  # type: ignore
+
+    def from_json(*args, **kwargs):
+        raise AssertionError("the request must not be deserialized")
+
+    monkeypatch.setattr(TimeSeriesRequest, "from_json", from_json)
+    assert get_request_hash(text) == get_request_hash(request)
+
+
+def test_lazy_delivery_size_includes_document():
+    data = {"a.txt": list(b"a" * 1000), "b.txt": list(b"b" * 1000)}
+    document_size = len(zlib.decompress(create_delivery_data(data)))
+    delivery = decompress_result_delivery_lazy(create_delivery_data(data))
+    assert delivery.file_sizes == {"a.txt": 1000, "b.txt": 1000}
+    # the document is counted once, although both files are located in it
+    assert get_delivery_size(delivery) == document_size
+    assert delivery.data["a.txt"] == b"a" * 1000
+    assert get_delivery_size(delivery) == document_size + 1000
+
+
+def test_memory_cache_is_bounded_by_document_size():
+    cache = DecodedResultCache(max_size=10000)
+    for i in range(5):
+        data = {"out.txt": list(bytes([i]) * 1000)}
+        cache.put(str(i), decompress_result_delivery_lazy(create_delivery_data(data)))
+    document_size = len(zlib.decompress(create_delivery_data(data)))
+    # each document is about three times as large as the result file it contains
+    assert document_size > 3000
+    assert len(cache) == cache.max_size // document_size
+    assert cache.size <= cache.max_size
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replaces the time in the cache module by a clock that advances one second per call"""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr("utspclient.cache.time.time", lambda: float(next(ticks)))
+
+
+def test_result_cache_is_persistent(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ResultCache(path)
+    cache.put("a", b"delivery")
+    cache.close()
+    cache = ResultCache(path)
+    assert cache.get("a") == b"delivery"
+    assert cache.get("b") is None
+    assert len(cache) == 1 and cache.size == len(b"delivery")
+    cache.close()
+
+
+def test_result_cache_removes_corrupt_entries(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ResultCache(path)
+    cache.put("a", b"delivery")
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE results SET data = ?", (b"corrupt",))
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_result_cache_entries_expire(tmp_path, clock):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"), ttl=10)
+    cache.put("a", b"delivery")
+    cache.put("b", b"delivery")
+    assert cache.get("a") == b"delivery"
+    for _ in range(10):
+        cache.put("c", b"delivery")
+    # expired entries are not returned and removed when other entries are added
+    assert cache.get("a") is None
+    assert "b" not in cache
+    assert cache.get("c") == b"delivery"
+    cache.close()
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path, clock):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"), max_size=250)
+    cache.put("a", b"a" * 100)
+    cache.put("b", b"b" * 100)
+    assert cache.get("a") is not None
+    cache.put("c", b"c" * 100)
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.size == 200
+    # deliveries that are larger than the cache are not stored
+    cache.put("d", b"d" * 251)
+    assert "d" not in cache
+    cache.close()
+
+
+def test_result_cache_can_be_used_by_many_threads(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+
+    def put_and_get(thread_index: int):
+        for i in range(20):
+            key = f"{thread_index}-{i}"
+            cache.put(key, key.encode())
+            assert cache.get(key) == key.encode()
+
+    threads = [threading.Thread(target=put_and_get, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(cache) == 80
+    assert len(cache._connections) == 5
+    cache.close()
+    assert not cache._connections
+    # the cache opens a new connection when it is used again
+    assert cache.get("0-0") == b"0-0"
+    cache.close()
+
+
+def put_deliveries(path: str, process_index: int) -> None:
+    cache = ResultCache(path)
+    for i in range(20):
+        cache.put(f"{process_index}-{i}", bytes([process_index]) * 1000)
+    cache.close()
+
+
+def test_result_cache_can_be_used_by_many_processes(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    with ProcessPoolExecutor(4) as executor:
+        list(executor.map(put_deliveries, [path] * 4, range(4)))
+    cache = ResultCache(path)
+    assert len(cache) == 80
+    assert cache.get("3-19") == bytes([3]) * 1000
+    cache.close()
+
+
+def test_result_cache_membership_test_has_no_side_effects(tmp_path, clock):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"), max_size=250, ttl=10)
+    cache.put("a", b"a" * 100)
+    cache.put("b", b"b" * 100)
+    # checking for an entry does not mark it as recently used
+    assert "a" in cache
+    cache.put("c", b"c" * 100)
+    assert "a" not in cache
+    assert "b" in cache
+    for _ in range(10):
+        assert "x" not in cache
+    # expired entries are reported as missing, but only removed by get or put
+    assert "b" not in cache
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert len(cache) == 1
+    cache.close()
+
+
+def create_decoded_delivery(size: int) -> ResultDelivery:
+    return ResultDelivery(TimeSeriesRequest("config", "provider"), {"a": b"a" * size})
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = DecodedResultCache(max_size=300)
+    for key in "abc":
+        cache.put(key, create_decoded_delivery(100))
+    assert cache.get("a") is not None
+    # the cache is full, so the least recently used delivery is evicted
+    cache.put("d", create_decoded_delivery(100))
+    assert "b" not in cache
+    assert all(key in cache for key in "acd")
+    # a large delivery evicts as many deliveries as necessary
+    cache.put("e", create_decoded_delivery(250))
+    assert list(cache._entries) == ["e"]
+    assert cache.size == 250
+    assert cache.get("b") is None and cache.get("c") is None
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 2, 4)
+
+
+def test_memory_cache_skips_deliveries_that_do_not_fit():
+    cache = DecodedResultCache(max_size=100)
+    cache.put("a", create_decoded_delivery(50))
+    cache.put("b", create_decoded_delivery(101))
+    assert "b" not in cache
+    # replacing a delivery does not count as eviction
+    cache.put("a", create_decoded_delivery(80))
+    assert len(cache) == 1 and cache.size == 80
+    assert cache.evictions == 0
+    cache.remove("a")
+    assert len(cache) == 0 and cache.size == 0
@@ -0,0 +1,125 @@
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from tests.conftest import FAST_POLLING, create_requests
+from tests.stand_in_server import StandInServer
+from utspclient import campaign as campaign_module
+from utspclient.campaign import Campaign
+from utspclient.client import UTSPClient
+from utspclient.datastructures import (
+    CalculationStatus,
+    ResultDelivery,
+    TimeSeriesRequest,
+)
+
+
+def test_statuses_are_checked_by_server_hash(server: StandInServer, tmp_path):
+    campaign = Campaign(str(tmp_path / "campaign.sqlite"))
+    requests = create_requests(3)
+    request_hashes = campaign.add_many(requests)
+    assert campaign.get_server_hashes(request_hashes) == [None] * 3
+    with UTSPClient(server.url) as client:
+        replies = client.send_requests(requests)
+        campaign.record_replies(request_hashes, replies)
+        server_hashes = campaign.get_server_hashes(request_hashes)
+        assert server_hashes == [reply.request_hash for reply in replies]
+        # the server does not know the local hashes of the requests
+        assert list(client.get_statuses(request_hashes)) == [0, 0, 0]
+        statuses = client.get_statuses(server_hashes)  # type: ignore
+    assert list(statuses) == [CalculationStatus.INCALCULATION.value] * 3
+    campaign.record_statuses(request_hashes, statuses)
+    assert campaign.count_statuses()[CalculationStatus.INCALCULATION] == 3
+
+
+def test_old_manifests_are_migrated(tmp_path):
+    path = str(tmp_path / "campaign.sqlite")
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE requests (request_hash TEXT PRIMARY KEY, request TEXT NOT NULL, "
+        "name TEXT NOT NULL, status INTEGER NOT NULL, submitted REAL, updated REAL, "
+        "info TEXT, result_path TEXT, claimed_by TEXT, claimed_until REAL)"
+    )
+    connection.execute(
+        "INSERT INTO requests (request_hash, request, name, status) "
+        "VALUES ('hash', '{}', 'name', 1)"
+    )
+    connection.commit()
+    connection.close()
+    campaign = Campaign(path)
+    entry = campaign.get_entry("hash")
+    assert entry is not None and entry.server_hash is None
+
+
+class FlakyClient(UTSPClient):
+    """Client that fails to get the results of requests with a specific config"""
+
+    def get_result(self, reply, request=None):
+        if request is not None and "flaky" in request:
+            raise ConnectionError("connection lost")
+        return super().get_result(reply, request)
+
+
+def test_run(server: StandInServer, tmp_path):
+    campaign = Campaign(str(tmp_path / "campaign.sqlite"))
+    configs = ["config", "fail", "flaky"]
+    request_hashes = campaign.add_many(TimeSeriesRequest(c, "p") for c in configs)
+    with FlakyClient(
+        server.url, polling_policy=FAST_POLLING, max_polls_per_second=1000
+    ) as client:
+        campaign.run(client, retry_delay=60)
+    done, failed, flaky = [campaign.get_entry(h) for h in request_hashes]
+    assert done is not None and done.result_path is not None
+    assert os.listdir(done.result_path) == ["out.txt"]
+    # only the calculation that failed on the server is marked as failed
+    assert failed is not None and failed.status == CalculationStatus.CALCULATIONFAILED
+    assert failed.info == "Calculation failed: failed on purpose"
+    assert flaky is not None and not flaky.finished
+    assert flaky.info == "connection lost"
+    # the flaky request is released, but only claimed again after the retry delay
+    assert Campaign(campaign.path).claim(10) == []
+    assert campaign.count_unfinished() == 1
+
+
+def test_run_renews_claims_and_records_statuses(
+    server: StandInServer, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(campaign_module, "STATUS_UPDATE_INTERVAL", 0.01)
+    server.ready_after = 30
+    campaign = Campaign(str(tmp_path / "campaign.sqlite"))
+    request_hash = campaign.add(TimeSeriesRequest("config", "p"))
+    with UTSPClient(
+        server.url, polling_policy=FAST_POLLING, max_polls_per_second=1000
+    ) as client:
+        thread = threading.Thread(target=campaign.run, args=(client, None, 10, 0.1))
+        thread.start()
+        time.sleep(0.3)
+        # the claim was renewed, so that other workers cannot claim the request
+        assert Campaign(campaign.path).claim(10) == []
+        entry = campaign.get_entry(request_hash)
+        assert entry is not None and entry.status == CalculationStatus.INCALCULATION
+        thread.join()
+    entry = campaign.get_entry(request_hash)
+    assert entry is not None and entry.status == CalculationStatus.INDATABASE
+
+
+@pytest.mark.parametrize("filename", ["../x", "/tmp/x", "a/../../x", "."])
+def test_record_result_rejects_invalid_file_names(tmp_path, filename: str):
+    campaign = Campaign(str(tmp_path / "campaign.sqlite"))
+    request_hash = campaign.add(TimeSeriesRequest("config", "p"))
+    delivery = ResultDelivery(TimeSeriesRequest("config", "p"), {filename: b"data"})
+    with pytest.raises(Exception, match="Invalid result file name"):
+        campaign.record_result(request_hash, delivery)
+    assert not os.path.exists(tmp_path / "x")
+    assert not os.path.exists(campaign.result_directory)
+
+
+def test_record_result_normalizes_file_names(tmp_path):
+    campaign = Campaign(str(tmp_path / "campaign.sqlite"))
+    request_hash = campaign.add(TimeSeriesRequest("config", "p"))
+    delivery = ResultDelivery(TimeSeriesRequest("config", "p"), {"a/../b.txt": b"1"})
+    result_path = campaign.record_result(request_hash, delivery)
+    assert os.listdir(result_path) == ["b.txt"]
@@ -0,0 +1,313 @@
+import base64
+import hashlib
+import json
+import subprocess
+import sys
+import time
+import zlib
+
+import numpy as np
+import pytest
+
+from tests.conftest import (
+    FAST_POLLING,
+    create_request,
+    create_request_with_input_files,
+)
+from tests.stand_in_server import StandInServer, create_delivery
+from utspclient.cache import DecodedResultCache, ResultCache
+from utspclient.client import UTSPClient, count_statuses
+from utspclient.datastructures import CalculationStatus, RestReply, TimeSeriesRequest
+from utspclient.protocol import REQUEST_HASH_HEADER, STATUS_HEADER, parse_reply
+
+
+def test_package_import_does_not_require_aiohttp():
+    code = "import sys, utspclient; assert 'aiohttp' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_wait_for_delivery_polls_by_hash(server: StandInServer):
+    with UTSPClient(server.url, polling_policy=FAST_POLLING) as client:
+        result = client.request_time_series_and_wait_for_delivery(create_request())
+    assert result.original_request == create_request()
+    assert result.data["out.txt"].startswith(b"result of ")
+    # the request is only submitted once and then polled by its hash
+    assert server.calls["profilerequest"] == 1
+    assert server.calls["requeststatusbyhash"] == server.ready_after
+    assert client.status_by_hash_supported
+
+
+def test_wait_for_delivery_without_status_by_hash(server: StandInServer):
+    server.status_by_hash = False
+    with UTSPClient(server.url, polling_policy=FAST_POLLING) as client:
+        result = client.request_time_series_and_wait_for_delivery(create_request())
+    assert result.data["out.txt"].startswith(b"result of ")
+    # the first status check falls back to sending the full request
+    assert server.calls["profilerequest"] == server.ready_after + 1
+    assert server.calls["requeststatusbyhash"] == 1
+    assert client.status_by_hash_supported is False
+
+
+def test_poll_resends_request_with_unknown_hash(server: StandInServer):
+    reply = RestReply(status=CalculationStatus.INCALCULATION, request_hash="unknown")
+    with UTSPClient(server.url) as client:
+        new_reply = client.poll(create_request(), reply)
+    assert new_reply.status == CalculationStatus.CALCULATIONSTARTED
+    assert server.calls["requeststatusbyhash"] == 1
+    assert server.calls["profilerequest"] == 1
+
+
+def test_poll_resends_request_if_status_reply_has_no_results(server: StandInServer):
+    server.status_by_hash_results = False
+    with UTSPClient(server.url, polling_policy=FAST_POLLING) as client:
+        result = client.request_time_series_and_wait_for_delivery(create_request())
+    assert result.original_request == create_request()
+    assert result.data["out.txt"].startswith(b"result of ")
+    # only the last status check, which reports the finished request, is followed
+    # by sending the full request again
+    assert server.calls["requeststatusbyhash"] == server.ready_after
+    assert server.calls["profilerequest"] == 2
+
+
+def test_submit_many(server: StandInServer):
+    requests = [create_request(i) for i in range(5)]
+    with UTSPClient(
+        server.url, polling_policy=FAST_POLLING, max_polls_per_second=1000
+    ) as client:
+        futures = client.submit_many(requests)
+        results = [future.result(timeout=10) for future in futures]
+    assert [result.original_request for result in results] == requests
+    assert len(server.requests) == len(requests)
+
+
+def test_submit_coalesces_identical_requests(server: StandInServer):
+    server.delay = 0.05
+    with UTSPClient(server.url, polling_policy=FAST_POLLING) as client:
+        futures = [client.submit(create_request()) for _ in range(3)]
+        results = [future.result(timeout=10) for future in futures]
+    assert all(result.data == results[0].data for result in results)
+    assert server.calls["profilerequest"] == 1
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+def test_request_compression(server: StandInServer, encoding: str):
+    with UTSPClient(
+        server.url, request_compression=encoding, compression_threshold=500
+    ) as client:
+        client.send_request(create_request())
+        client.send_request(TimeSeriesRequest("x" * 500, "provider"))
+    # only the large request is compressed
+    assert server.encodings == {encoding: 1}
+    assert server.calls["profilerequest"] == 2
+    assert client.request_compression_supported
+
+
+@pytest.mark.parametrize("error_code", [400, 415])
+def test_request_compression_fallback(server: StandInServer, error_code: int):
+    server.content_encodings = ()
+    server.encoding_error_code = error_code
+    with UTSPClient(
+        server.url, request_compression="gzip", compression_threshold=0
+    ) as client:
+        reply = client.send_request(create_request())
+        assert reply.status == CalculationStatus.CALCULATIONSTARTED
+        assert client.request_compression_supported is False
+        # further requests are sent uncompressed right away
+        client.send_request(create_request(1))
+    assert server.calls["profilerequest"] == 3
+    assert not server.encodings
+
+
+def test_send_requests_in_batches(server: StandInServer):
+    requests = [create_request(i) for i in range(7)]
+    with UTSPClient(server.url, batch_size=3) as client:
+        replies = client.send_requests(requests)
+    assert len(replies) == len(requests)
+    assert len({reply.request_hash for reply in replies}) == len(requests)
+    assert server.batch_sizes == [3, 3, 1]
+    assert server.calls["profilerequest"] == 0
+    assert client.batch_supported
+
+
+def test_send_requests_checks_number_of_replies(server: StandInServer):
+    server.max_batch_replies = 2
+    with UTSPClient(server.url) as client:
+        with pytest.raises(Exception, match="Received 2 replies for 3 requests"):
+            client.send_requests([create_request(i) for i in range(3)])
+
+
+def test_send_requests_without_batches(server: StandInServer):
+    server.batch = False
+    server.delay = 0.05
+    requests = [create_request(i) for i in range(6)]
+    with UTSPClient(server.url, pool_size=3) as client:
+        replies = client.send_requests(requests)
+    assert [reply.status for reply in replies] == [
+        CalculationStatus.CALCULATIONSTARTED
+    ] * len(requests)
+    assert client.batch_supported is False
+    # the requests are sent individually using concurrent connections
+    assert server.calls["profilerequest"] == len(requests)
+    assert server.max_active == 3
+
+
+def test_get_statuses_by_hash_stays_within_poll_budget(server: StandInServer):
+    with UTSPClient(server.url, max_polls_per_second=50) as client:
+        replies = client.send_requests([create_request(i) for i in range(5)])
+        start = time.time()
+        statuses = client.get_statuses([reply.request_hash for reply in replies])
+        duration = time.time() - start
+    assert list(statuses) == [CalculationStatus.INCALCULATION.value] * 5
+    assert client.bulk_status_supported is False
+    assert server.calls["requeststatusbyhash"] == 5
+    # the statuses are requested one by one, 20 ms apart
+    assert duration >= 0.08
+
+
+def test_count_statuses():
+    statuses = np.array([2, 2, 4, 1], dtype=np.int8)
+    counts = count_statuses(statuses)
+    assert counts == {
+        CalculationStatus.UNKNOWN: 0,
+        CalculationStatus.INCALCULATION: 1,
+        CalculationStatus.INDATABASE: 2,
+        CalculationStatus.CALCULATIONSTARTED: 0,
+        CalculationStatus.CALCULATIONFAILED: 1,
+    }
+    assert count_statuses(np.array([], dtype=np.int8))[CalculationStatus.UNKNOWN] == 0
+
+
+def test_count_statuses_of_list():
+    assert count_statuses([4, 4]) == {  # type: ignore
+        **{status: 0 for status in CalculationStatus},
+        CalculationStatus.CALCULATIONFAILED: 2,
+    }
+    # an empty list is not an array of integers
+    assert sum(count_statuses([]).values()) == 0  # type: ignore
+
+
+@pytest.mark.parametrize("code", [-1, 5])
+def test_count_statuses_rejects_invalid_codes(code: int):
+    with pytest.raises(ValueError, match=f"{code} is not a valid CalculationStatus"):
+        count_statuses(np.array([1, code], dtype=np.int8))
+
+
+@pytest.mark.parametrize(
+    "transports, expected",
+    [
+        ((), "list"),
+        (("base64",), "base64"),
+        (("octet-stream", "base64"), "octet-stream"),
+    ],
+)
+def test_result_transport(server: StandInServer, transports, expected: str):
+    server.result_transports = transports
+    server.ready_after = 0
+    with UTSPClient(server.url) as client:
+        reply = client.send_request(create_request())
+    request_json = create_request().to_json()  # type: ignore
+    assert reply.result_delivery == create_delivery(request_json)
+    assert server.transports == {expected: 1}
+
+
+def test_result_transport_can_be_disabled(server: StandInServer):
+    server.result_transports = ("octet-stream", "base64")
+    server.ready_after = 0
+    with UTSPClient(server.url, binary_results=False) as client:
+        reply = client.send_request(create_request())
+    request_json = create_request().to_json()  # type: ignore
+    assert reply.result_delivery == create_delivery(request_json)
+    assert server.transports == {"list": 1}
+
+
+def test_parse_reply_decodes_all_result_transports():
+    data = create_delivery(create_request().to_json())
+    fields = {"status": CalculationStatus.INDATABASE.value, "request_hash": "abc"}
+    json_headers = {"Content-Type": "application/json"}
+    list_reply = parse_reply(
+        json_headers, json.dumps({**fields, "result_delivery": list(data)}).encode()
+    )
+    base64_reply = parse_reply(
+        json_headers,
+        json.dumps(
+            {**fields, "result_delivery": base64.b64encode(data).decode()}
+        ).encode(),
+    )
+    binary_headers = {
+        "Content-Type": "application/octet-stream",
+        STATUS_HEADER: str(CalculationStatus.INDATABASE.value),
+        REQUEST_HASH_HEADER: "abc",
+    }
+    binary_reply = parse_reply(binary_headers, data)
+    expected = RestReply(data, CalculationStatus.INDATABASE, "abc")
+    assert list_reply == base64_reply == binary_reply == expected
+    with UTSPClient("http://localhost") as client:
+        deliveries = [
+            client.get_result(reply)
+            for reply in [list_reply, base64_reply, binary_reply]
+        ]
+    assert deliveries[0] == deliveries[1] == deliveries[2]
+    assert deliveries[0].original_request == create_request()
+
+
+def test_undecodable_results_are_not_cached(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+    memory_cache = DecodedResultCache(max_size=10**6)
+    reply = RestReply(b"corrupt", CalculationStatus.INDATABASE, "abc")
+    with UTSPClient(
+        "http://localhost", cache=cache, memory_cache=memory_cache
+    ) as client:
+        with pytest.raises(zlib.error):
+            client.get_result(reply, create_request())
+    assert len(cache) == 0
+    assert len(memory_cache) == 0
+    cache.close()
+
+
+def test_input_files_are_uploaded_once(server: StandInServer):
+    server.input_file_store = True
+    with UTSPClient(server.url, upload_input_files=True) as client:
+        for i in range(3):
+            reply = client.send_request(
+                create_request_with_input_files(i, a=b"shared", b=b"shared", c=b"own")
+            )
+            assert reply.status == CalculationStatus.CALCULATIONSTARTED
+    assert client.input_file_store_supported
+    assert set(server.input_files.values()) == {b"shared", b"own"}
+    # the files are only checked and uploaded for the first request
+    assert server.calls["inputfilecheck"] == 1
+    assert server.calls["inputfileupload"] == 2
+    for request in server.requests.values():
+        sent_request = TimeSeriesRequest.from_json(request)  # type: ignore
+        assert not sent_request.input_files
+        assert set(sent_request.input_file_references) == {"a", "b", "c"}
+
+
+def test_input_files_stored_on_server_are_not_uploaded(server: StandInServer):
+    server.input_file_store = True
+    server.input_files[hashlib.sha256(b"stored").hexdigest()] = b"stored"
+    with UTSPClient(server.url, upload_input_files=True) as client:
+        client.send_request(create_request_with_input_files(a=b"stored"))
+    assert server.calls["inputfilecheck"] == 1
+    assert server.calls["inputfileupload"] == 0
+
+
+def test_input_files_fall_back_to_inline(server: StandInServer):
+    with UTSPClient(server.url, upload_input_files=True) as client:
+        for i in range(2):
+            client.send_request(create_request_with_input_files(i, a=b"content"))
+    assert client.input_file_store_supported is False
+    # the missing input file store is only detected once
+    assert server.calls["inputfilecheck"] == 1
+    assert server.calls["profilerequest"] == 2
+    for request in server.requests.values():
+        sent_request = TimeSeriesRequest.from_json(request)  # type: ignore
+        assert sent_request.input_files == {"a": base64.b64encode(b"content").decode()}
+
+
+def test_input_files_are_sent_inline_by_default(server: StandInServer):
+    server.input_file_store = True
+    with UTSPClient(server.url) as client:
+        client.send_request(create_request_with_input_files(a=b"content"))
+    assert server.calls["inputfilecheck"] == 0
+    assert not server.input_files
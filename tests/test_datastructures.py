@@ -0,0 +1,76 @@
+import base64
+import dataclasses
+import hashlib
+import json
+
+import pytest
+
+from utspclient.datastructures import (
+    ResultDelivery,
+    ResultFileRequirement,
+    TimeSeriesRequest,
+    get_cache_key_from_json,
+)
+
+
+def test_get_hash_hashes_json_representation():
+    request = TimeSeriesRequest("config", "provider", guid="1")
+    expected = hashlib.sha256(request.to_json().encode("utf-8")).hexdigest()
+    assert request.get_hash() == expected
+
+
+def test_cache_key_is_canonical():
+    files = {"a.txt": ResultFileRequirement.REQUIRED, "b.txt": None}
+    request = TimeSeriesRequest("config", "provider", required_result_files=files)
+    reordered = dataclasses.replace(
+        request, required_result_files=dict(reversed(list(files.items())))
+    )
+    assert request.get_cache_key() == reordered.get_cache_key()
+    assert request.get_hash() != reordered.get_hash()
+
+
+def test_cache_key_is_updated_when_request_changes():
+    request = TimeSeriesRequest("config", "provider")
+    key = request.get_cache_key()
+    request.simulation_config = "other config"
+    assert request.get_cache_key() != key
+
+
+def test_cache_key_with_guid():
+    request = TimeSeriesRequest("config", "provider")
+    variant = dataclasses.replace(request, guid="7")
+    assert request.get_cache_key_with_guid("7") == variant.get_cache_key()
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        TimeSeriesRequest("config", "provider"),
+        TimeSeriesRequest(
+            'config with "quotes" and ümlauts',
+            "provider",
+            guid="7",
+            required_result_files={"b.txt": ResultFileRequirement.OPTIONAL, "a": None},
+            input_files={"z.txt": "YWI=", "a.txt": ""},
+            input_file_references={"ref.txt": "1234"},
+        ),
+    ],
+)
+def test_cache_key_from_json(request_: TimeSeriesRequest):
+    text = request_.to_json()  # type: ignore
+    assert get_cache_key_from_json(text) == request_.get_cache_key()
+    # the key does not depend on the formatting of the json
+    assert get_cache_key_from_json(json.dumps(json.loads(text), indent=2)) == (
+        request_.get_cache_key()
+    )
+
+
+def test_result_delivery_decodes_lists_and_base64():
+    request = TimeSeriesRequest("config", "provider")
+    content = bytes(range(256))
+    expected = ResultDelivery(request, {"out.bin": content})
+    from_list = ResultDelivery(request, {"out.bin": list(content)})
+    from_base64 = ResultDelivery(
+        request, {"out.bin": base64.b64encode(content).decode()}
+    )
+    assert from_list == from_base64 == expected
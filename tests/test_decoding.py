@@ -0,0 +1,147 @@
+import base64
+import json
+import os
+import zlib
+
+import pytest
+
+from tests.conftest import DELIVERY_REQUEST, create_delivery_data
+from utspclient.datastructures import SpilledFile, TimeSeriesRequest
+from utspclient.decoding import (
+    _decode_bytes_value,
+    decode_object,
+    decompress_result_delivery,
+    decompress_result_delivery_lazy,
+    parse_byte_array,
+    parse_rest_reply,
+    parse_result_delivery,
+)
+
+
+def test_spilled_files_are_removed(tmp_path):
+    data = create_delivery_data({"a.txt": list(b"a" * 100), "b.txt": list(b"b" * 10)})
+    with decompress_result_delivery(data, 50, str(tmp_path)) as delivery:
+        assert delivery.data["b.txt"] == b"b" * 10
+        (spilled_file,) = delivery.spilled_files
+        assert spilled_file.read() == b"a" * 100
+    assert not os.listdir(tmp_path)
+
+
+def test_lazy_spilled_files_are_removed(tmp_path):
+    data = create_delivery_data({"a.txt": list(b"a" * 100)})
+    delivery = decompress_result_delivery_lazy(data, None, str(tmp_path))
+    assert isinstance(delivery.spilled_files[0], SpilledFile)
+    assert delivery.data["a.txt"] == b"a" * 100
+    delivery.remove_spilled_files()
+    assert not os.listdir(tmp_path)
+
+
+def test_spilled_files_are_removed_if_decoding_fails(tmp_path):
+    document = json.dumps(
+        {"original_request": DELIVERY_REQUEST, "data": {"a.txt": [1, 2, 3]}}
+    )
+    # cut off the document within the result file
+    data = zlib.compress(document[:-8].encode("utf-8"))
+    with pytest.raises(Exception):
+        decompress_result_delivery(data, None, str(tmp_path))
+    assert not os.listdir(tmp_path)
+
+
+@pytest.mark.parametrize(
+    "array",
+    ["[1,2,255]", "[ 0 , 17 ,\n255 ]", "[7]", "[]", "[ ]", str(list(range(256)))],
+)
+def test_parse_byte_array(array: str):
+    assert parse_byte_array(array, 0) == (bytes(json.loads(array)), len(array))
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        "[1.5,2]",
+        "[1, 2.0]",
+        "[-1,2]",
+        "[1,-2]",
+        "[1e2,3]",
+        "[1,2E0]",
+        "[256]",
+        "[1,[2]]",
+    ],
+)
+def test_other_arrays_fall_back_to_json(array: str):
+    assert parse_byte_array(array, 0) is None
+    document = '{"a": ' + array + "}"
+    decoded, end = decode_object(document, 0, {"a": _decode_bytes_value})
+    assert decoded == json.loads(document)
+    assert end == len(document)
+
+
+@pytest.mark.parametrize("array", ["[1,2,]", "[1,,2]", "[1,2", "[1 2]", "[1,a]"])
+def test_malformed_arrays_are_rejected(array: str):
+    assert parse_byte_array(array, 0) is None
+    document = '{"result_delivery": ' + array + "}"
+    with pytest.raises(ValueError):
+        json.loads(document)
+    with pytest.raises(ValueError):
+        parse_rest_reply(document)
+
+
+def test_result_delivery_decoding_matches_json():
+    data = {"a.txt": list(b"content"), "empty.txt": [], "b.bin": list(range(256))}
+    document = json.dumps(
+        {"original_request": DELIVERY_REQUEST, "data": data}, indent=2
+    )
+    expected = {name: bytes(values) for name, values in data.items()}
+    assert parse_result_delivery(document).data == expected
+    compressed = zlib.compress(document.encode("utf-8"))
+    assert decompress_result_delivery(compressed).data == expected
+
+
+def create_chunk_test_document() -> str:
+    """Creates a delivery with byte arrays, base64 strings with escaped slashes and
+    other values, so that small chunks split separators, numbers and escapes"""
+    content = bytes(range(256)) * 2
+    request = {
+        "simulation_config": 'config with "quotes" and ümlauts',
+        "providername": "provider",
+        "input_files": {"a.txt": "YWI="},
+    }
+    data = {
+        "list.bin": list(content),
+        "short.txt": [7, 0, 255, 10],
+        "empty.txt": [],
+        "base64.bin": base64.b64encode(content).decode(),
+        "padded.txt": base64.b64encode(b"ab").decode(),
+        "empty.bin": "",
+    }
+    document = json.dumps(
+        {"original_request": request, "data": data, "duration": 12345.678},
+        indent=1,
+        ensure_ascii=False,
+    )
+    # json allows escaping slashes, which occur in base64 strings
+    return document.replace("/", "\\/")
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 8))
+def test_decoding_across_chunk_boundaries(chunk_size: int):
+    document = create_chunk_test_document()
+    expected = json.loads(document)
+    compressed = zlib.compress(document.encode("utf-8"))
+    delivery = decompress_result_delivery(compressed, chunk_size=chunk_size)
+    assert delivery.original_request == TimeSeriesRequest.from_dict(  # type: ignore
+        expected["original_request"]
+    )
+    assert delivery.data == {
+        name: base64.b64decode(value) if isinstance(value, str) else bytes(value)
+        for name, value in expected["data"].items()
+    }
+
+
+def test_lazy_decoding_enforces_memory_limit():
+    data = create_delivery_data({"a.txt": list(b"a" * 1000)})
+    document_size = len(zlib.decompress(data))
+    delivery = decompress_result_delivery_lazy(data, document_size)
+    assert delivery.data["a.txt"] == b"a" * 1000
+    with pytest.raises(MemoryError):
+        decompress_result_delivery_lazy(data, document_size - 1)
@@ -0,0 +1,86 @@
+import inspect
+
+import pytest
+
+from utspclient.helpers import lpgdata
+from utspclient.helpers.lpg_catalog import (
+    find_households,
+    get_catalog_index,
+    get_household,
+)
+from utspclient.helpers.lpg_helper import (
+    collect_lpg_households,
+    create_hh_data_from_number_and_size,
+)
+from utspclient.helpers.lpgpythonbindings import JsonReference
+
+CHR54 = lpgdata.Households.CHR54_Retired_Couple_no_work
+
+
+def test_find_by_guid_name_attribute_and_code():
+    index = get_catalog_index(lpgdata.Households)
+    assert index.find(CHR54.Guid.StrVal) is CHR54
+    assert index.find("CHR54 Retired Couple, no work") is CHR54
+    assert index.find("CHR54_Retired_Couple_no_work") is CHR54
+    assert index.find("CHR54") is CHR54
+    assert index.find("CHR00") is None
+    assert "CHR54" in index
+    assert len(index) == len(vars(lpgdata.Households)["__annotations__"])
+
+
+def test_get_raises_for_unknown_and_ambiguous_keys():
+    index = get_catalog_index(lpgdata.TemplatePersons)
+    with pytest.raises(KeyError, match="ambiguous"):
+        index.get("CHR01")
+    with pytest.raises(KeyError, match="No entry"):
+        index.get("CHR00")
+    assert index.get("CHR01_0_23F") is lpgdata.TemplatePersons.CHR01_0_23F
+
+
+def test_get_by_code():
+    persons = get_catalog_index(lpgdata.TemplatePersons).get_by_code("CHR01")
+    assert persons == [
+        lpgdata.TemplatePersons.CHR01_0_23F,
+        lpgdata.TemplatePersons.CHR01_1_25M,
+    ]
+    assert get_catalog_index(lpgdata.Households).get_by_code("CHR00") == []
+
+
+def test_filter_by_living_pattern_tags():
+    tags = lpgdata.LivingPatternTags
+    retirees = find_households(tags.Living_Pattern_Retiree)
+    assert CHR54 in retirees
+    assert lpgdata.Households.CHR01_Couple_both_at_Work not in retirees
+    # a tag also matches all more specific tags
+    office_jobs = find_households(tags.Living_Pattern_Office_Job)
+    early_office_jobs = find_households(tags.Living_Pattern_Office_Job_Early_5_7am)
+    assert early_office_jobs
+    assert set(map(id, early_office_jobs)) < set(map(id, office_jobs))
+    both = find_households(tags.Living_Pattern_Retiree, tags.Living_Pattern_Office_Job)
+    assert set(map(id, both)) <= set(map(id, retirees))
+
+
+def test_get_household():
+    assert get_household("CHR54") is CHR54
+    assert get_household(CHR54.Guid.StrVal) is CHR54
+    with pytest.raises(KeyError):
+        get_household("CHR00")
+
+
+def test_collect_lpg_households():
+    households = collect_lpg_households()
+    members = inspect.getmembers(lpgdata.Households)
+    expected = {
+        name: value for name, value in members if isinstance(value, JsonReference)
+    }
+    assert households == expected
+    assert len(households) == len(vars(lpgdata.Households)["__annotations__"])
+
+
+def test_create_hh_data_from_number_and_size():
+    households = create_hh_data_from_number_and_size(3, 2)
+    # each household is only added once, not once per person
+    assert len(households) == 3
+    assert len({id(household) for household in households}) == 3
+    for household in households:
+        assert len(household.HouseholdDataPersonSpec.Persons) == 2
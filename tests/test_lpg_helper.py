@@ -0,0 +1,94 @@
+from collections import Counter
+
+import pytest
+
+from utspclient.helpers import lpgdata
+from utspclient.helpers.lpg_helper import create_population
+from utspclient.helpers.lpgpythonbindings import (
+    Gender,
+    HouseholdDataSpecificationType,
+)
+
+COUPLES = [
+    lpgdata.HouseholdTemplates.CHR01_Couple_both_at_Work,
+    lpgdata.HouseholdTemplates.CHR02_Couple_30_64_age_with_work,
+]
+SINGLE = lpgdata.HouseholdTemplates.CHR07_Single_with_work
+
+
+def get_persons(household):
+    return [
+        (person.Age, person.Gender)
+        for person in household.HouseholdDataPersonSpec.Persons
+    ]
+
+
+def test_population_by_persons():
+    households = create_population(
+        2000,
+        {1: 0.25, 3: 0.75},
+        age_distribution={(0, 18): 0.5, (65, 70): 0.5},
+        female_share=0.3,
+        seed=1,
+    )
+    assert len(households) == 2000
+    assert all(
+        household.HouseholdDataSpecification == HouseholdDataSpecificationType.ByPersons
+        for household in households
+    )
+    sizes = Counter(len(get_persons(household)) for household in households)
+    assert set(sizes) == {1, 3}
+    assert 400 < sizes[1] < 600
+    persons = [person for household in households for person in get_persons(household)]
+    assert len(persons) == sizes[1] + 3 * sizes[3]
+    assert all(age < 18 or 65 <= age < 70 for age, _ in persons)
+    females = sum(gender == Gender.Female for _, gender in persons)
+    assert 0.25 < females / len(persons) < 0.35
+    assert len({household.UniqueHouseholdId for household in households}) == 2000
+
+
+@pytest.mark.parametrize("by_template_name", [False, True])
+def test_population_is_reproducible(by_template_name: bool):
+    def create(seed: int):
+        return create_population(
+            500, {1: 1, 2: 2, 3: 1}, seed=seed, by_template_name=by_template_name
+        )
+
+    first = create(7)
+    assert [household.to_dict() for household in first] == [
+        household.to_dict() for household in create(7)
+    ]
+    assert first != create(8)
+
+
+def test_population_with_fixed_seed():
+    households = create_population(
+        3, {1: 1, 2: 1}, age_distribution={(20, 30): 1}, seed=42
+    )
+    assert list(map(get_persons, households)) == [
+        [(25, Gender.Male), (21, Gender.Male)],
+        [(28, Gender.Male)],
+        [(24, Gender.Female), (25, Gender.Female)],
+    ]
+
+
+def test_population_by_template_name():
+    households = create_population(
+        3000, {1: 1, 2: 2}, seed=3, by_template_name=True, templates=COUPLES + [SINGLE]
+    )
+    counts = Counter(
+        household.HouseholdTemplateSpec.HouseholdTemplateName
+        for household in households
+    )
+    assert set(counts) == set(COUPLES) | {SINGLE}
+    # each size is drawn with its weight, and the templates of a size are equally likely
+    assert 900 < counts[SINGLE] < 1100
+    for template in COUPLES:
+        assert 900 < counts[template] < 1100
+
+
+def test_population_without_template_for_size():
+    with pytest.raises(Exception, match="no household template with 1 persons"):
+        create_population(10, {1: 1, 2: 1}, by_template_name=True, templates=COUPLES)
+    with pytest.raises(Exception, match="no household template with 99 persons"):
+        create_population(10, {99: 1}, by_template_name=True)
@@ -0,0 +1,292 @@
+import copy
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Optional, Set
+
+import pytest
+import dataclasses_json  # type: ignore
+from dataclasses_json import dataclass_json  # type: ignore
+
+from utspclient.helpers import lpg_helper, lpg_serialization, lpgdata
+from utspclient.helpers.lpgpythonbindings import (
+    CalcOption,
+    Gender,
+    HouseCreationAndCalculationJob,
+    HouseholdDataSpecificationType,
+    JsonCalcSpecification,
+    PersonData,
+)
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+@dataclass_json
+@dataclass
+class Inner:
+    Name: str = ""
+    Weights: List[float] = field(default_factory=list)
+
+
+@dataclass_json
+@dataclass
+class Outer:
+    Required: int
+    Colors: List[Color] = field(default_factory=list)
+    Tags: Set[str] = field(default_factory=set)
+    Child: Optional[Inner] = None
+    Children: Dict[str, Inner] = field(default_factory=dict)
+    Note: Optional[str] = None
+
+
+@dataclass_json
+@dataclass
+class WithOverride:
+    Value: int = field(
+        default=0,
+        metadata=dataclasses_json.config(
+            encoder=lambda v: v * 10, decoder=lambda v: v // 10
+        ),
+    )
+
+
+def create_configs() -> List[HouseCreationAndCalculationJob]:
+    households = list(lpg_helper.collect_lpg_households().values())
+    configs = [
+        HouseCreationAndCalculationJob(),
+        lpg_helper.create_basic_lpg_config(
+            households[0],
+            lpgdata.HouseTypes.HT03_House_with_a_solar_thermal_System_and_300_L_storage_tank_gas_heating,
+        ),
+        lpg_helper.create_basic_lpg_config(
+            households[1],
+            lpgdata.HouseTypes.HT06_Normal_house_with_15_000_kWh_Heating_Continuous_Flow_Gas_Heating,
+            "2021-01-01",
+            "2021-12-31",
+            "00:15:00",
+            geographic_location=lpgdata.GeographicLocations.France_Limoges,
+            energy_intensity=lpgdata.EnergyIntensityType.EnergySaving,
+            transportation_device_set=lpgdata.TransportationDeviceSets.Bus_and_one_30_km_h_Car,
+            calc_options=[
+                CalcOption.SumProfileExternalIndividualHouseholdsAsJson,
+                CalcOption.BodilyActivityStatistics,
+            ],
+        ),
+    ]
+    for by_template_name in [False, True]:
+        config = lpg_helper.create_basic_lpg_config(
+            households[2],
+            lpgdata.HouseTypes.HT22_Big_Multifamily_House_no_heating_cooling,
+        )
+        assert config.House is not None
+        config.House.Households = lpg_helper.create_population(
+            5, {1: 1, 2: 1, 4: 1}, seed=1, by_template_name=by_template_name
+        )
+        configs.append(config)
+    return configs
+
+
+@pytest.mark.parametrize("config", create_configs())
+def test_parity_with_dataclasses_json(config):
+    text = config.to_json()
+    assert lpg_serialization.to_json(config) == text
+    assert lpg_serialization.to_json(config, indent=4) == config.to_json(indent=4)
+    assert lpg_serialization.to_dict(config) == config.to_dict(encode_json=False)
+    loaded = lpg_serialization.from_json(HouseCreationAndCalculationJob, text)
+    assert loaded == HouseCreationAndCalculationJob.from_json(text)
+    assert loaded == config
+    # like with dataclasses_json, floats with integer values are written as floats now
+    assert lpg_serialization.to_json(loaded) == loaded.to_json()
+
+
+def test_optional_fields():
+    person = PersonData(Age=30, Gender=None, PersonName=None)
+    text = person.to_json()
+    assert '"Gender": null' in text
+    assert lpg_serialization.to_json(person) == text
+    assert lpg_serialization.from_json(PersonData, text) == person
+    person.Gender = Gender.Female
+    assert lpg_serialization.to_json(person) == person.to_json()
+    assert (
+        lpg_serialization.from_json(PersonData, person.to_json()).Gender
+        is Gender.Female
+    )
+
+
+def test_enum_lists():
+    calc_spec = JsonCalcSpecification(
+        CalcOptions=[
+            CalcOption.HouseSumProfilesFromDetailedDats,
+            CalcOption.TotalsPerLoadtype,
+        ]
+    )
+    text = calc_spec.to_json()
+    assert lpg_serialization.to_json(calc_spec) == text
+    loaded = lpg_serialization.from_json(JsonCalcSpecification, text)
+    assert loaded == JsonCalcSpecification.from_json(text)
+    assert all(isinstance(option, CalcOption) for option in loaded.CalcOptions)
+
+
+def test_generic_dataclass_fields():
+    outer = Outer(
+        1,
+        [Color.RED, Color.GREEN],
+        {"a"},
+        Inner("child", [1.5]),
+        {"x": Inner("y", [2.0, 3.0])},
+    )
+    text = outer.to_json()
+    assert lpg_serialization.to_json(outer) == text
+    assert lpg_serialization.to_dict(outer) == outer.to_dict(encode_json=False)
+    loaded = lpg_serialization.from_json(Outer, text)
+    assert loaded == Outer.from_json(text) == outer
+    assert lpg_serialization.to_json(Outer(2)) == Outer(2).to_json()
+
+
+def test_serializers_are_generated_once():
+    serializer = lpg_serialization.get_serializer(Inner)
+    assert serializer.__name__ == "serialize"
+    assert lpg_serialization.get_serializer(Inner) is serializer
+    deserializer = lpg_serialization.get_deserializer(Inner)
+    assert deserializer.__name__ == "deserialize"
+    assert lpg_serialization.get_deserializer(Inner) is deserializer
+
+
+def test_generated_deserializer():
+    with pytest.raises(KeyError, match="Required"):
+        lpg_serialization.from_dict(Outer, {})
+    first = lpg_serialization.from_dict(Outer, {"Required": 1})
+    second = lpg_serialization.from_dict(Outer, {"Required": 1})
+    # the default factories are called for each object
+    assert first.Colors is not second.Colors
+    # values are converted to the annotated types
+    loaded = lpg_serialization.from_dict(Outer, {"Required": "3", "Colors": ["red"]})
+    assert loaded == Outer.from_dict({"Required": "3", "Colors": ["red"]})
+    assert loaded.Required == 3 and loaded.Colors == [Color.RED]
+    # objects are passed through
+    assert lpg_serialization.from_dict(Outer, first) is first
+
+
+def test_field_overrides_use_dataclasses_json():
+    assert lpg_serialization.get_serializer(WithOverride).__name__ != "serialize"
+    assert lpg_serialization.get_deserializer(WithOverride).__name__ != "deserialize"
+    obj = WithOverride(3)
+    text = lpg_serialization.to_json(obj)
+    assert text == obj.to_json() == '{"Value": 30}'
+    assert lpg_serialization.from_json(WithOverride, text) == WithOverride.from_json(
+        text
+    )
+
+
+def test_encoded_enum_types_are_passed_through():
+    class Shape(Enum):
+        ROUND = "round"
+
+    @dataclass_json
+    @dataclass
+    class Shaped:
+        Kind: Shape
+        Kinds: List[Shape]
+
+    obj = Shaped(Shape.ROUND, [Shape.ROUND])
+    # the serializer is generated before the enum type is known
+    serializer = lpg_serialization.get_serializer(Shaped)
+    assert Shape not in lpg_serialization._PASSTHROUGH_TYPES
+    assert serializer(obj) == obj.to_dict(encode_json=False)
+    # the first value registers the type for all serializers of the process
+    assert Shape in lpg_serialization._PASSTHROUGH_TYPES
+    assert serializer(obj) == obj.to_dict(encode_json=False)
+    assert lpg_serialization.to_json(obj) == obj.to_json()
+    # other types are not affected
+    assert lpg_serialization._encode_value(Inner()) == {"Name": "", "Weights": []}
+    assert Inner not in lpg_serialization._PASSTHROUGH_TYPES
+
+
+def create_template_config() -> HouseCreationAndCalculationJob:
+    return create_configs()[2]
+
+
+def test_template_renders_like_to_json():
+    config = create_template_config()
+    slots = [
+        "HouseholdReference",
+        "RandomSeed",
+        "EnergyIntensityType",
+        "CalcOptions",
+        "GeographicLocation",
+        "House.Households.0.HouseholdDataSpecification",
+    ]
+    template = lpg_serialization.ConfigTemplate(config, slots)
+    households = list(lpg_helper.collect_lpg_households().values())
+    values = {
+        "HouseholdReference": households[5],
+        "RandomSeed": 42,
+        "EnergyIntensityType": lpgdata.EnergyIntensityType.EnergyIntensive,
+        "CalcOptions": [CalcOption.TotalsPerLoadtype, CalcOption.OverallSum],
+        "GeographicLocation": None,
+        "House.Households.0.HouseholdDataSpecification": HouseholdDataSpecificationType.ByTemplateName,
+    }
+    variant = copy.deepcopy(config)
+    assert variant.House is not None and variant.CalcSpec is not None
+    household = variant.House.Households[0]
+    assert household.HouseholdNameSpec is not None
+    household.HouseholdNameSpec.HouseholdReference = values["HouseholdReference"]
+    household.HouseholdDataSpecification = values[
+        "House.Households.0.HouseholdDataSpecification"
+    ]
+    variant.CalcSpec.RandomSeed = values["RandomSeed"]
+    variant.CalcSpec.EnergyIntensityType = values["EnergyIntensityType"]
+    variant.CalcSpec.CalcOptions = values["CalcOptions"]
+    variant.CalcSpec.GeographicLocation = None
+    assert template.render(**values) == variant.to_json()  # type: ignore
+    # the base config is not changed
+    assert config == create_template_config()
+
+
+def test_template_defaults():
+    config = create_template_config()
+    template = lpg_serialization.ConfigTemplate(
+        config, ["RandomSeed", "StartDate", "RandomSeed"]
+    )
+    assert template.slot_paths == {
+        "RandomSeed": "CalcSpec.RandomSeed",
+        "StartDate": "CalcSpec.StartDate",
+    }
+    assert template.defaults == {"RandomSeed": "-1", "StartDate": '"2021-01-01"'}
+    assert template.render() == config.to_json()  # type: ignore
+    assert config.CalcSpec is not None
+    config.CalcSpec.RandomSeed = 7
+    assert template.render(RandomSeed=7) == config.to_json()  # type: ignore
+
+
+def test_template_unknown_slot():
+    template = lpg_serialization.ConfigTemplate(
+        create_template_config(), ["RandomSeed"]
+    )
+    with pytest.raises(KeyError, match="StartDate"):
+        template.render(RandomSeed=1, StartDate="2021-01-01")
+
+
+def test_template_missing_path():
+    config = create_template_config()
+    for path in ["CalcSpec.NoSuchField", "House.Households.3.HouseTypeCode", "Nothing"]:
+        with pytest.raises(KeyError, match=path):
+            lpg_serialization.ConfigTemplate(config, [path])
+
+
+def test_template_overlapping_slots():
+    config = create_template_config()
+    for slots in [
+        ["StartDate", "CalcSpec.StartDate"],
+        ["StartDate", "CalcSpec"],
+        ["CalcSpec", "StartDate"],
+    ]:
+        with pytest.raises(ValueError, match="overlap"):
+            lpg_serialization.ConfigTemplate(config, slots)
+    # paths that only share a prefix do not overlap
+    template = lpg_serialization.ConfigTemplate(
+        config, ["House", "HouseDefinitionType"]
+    )
+    assert template.render() == config.to_json()  # type: ignore
@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+import pytest
+
+from utspclient.helpers import lpgdata, lpgpythonbindings
+
+
+def test_import_does_not_load_catalog():
+    code = (
+        "from utspclient.helpers import lpgdata\n"
+        "assert lpgdata._catalog_data is None\n"
+        "assert 'CHR01_Couple_both_at_Work' not in vars(lpgdata.Households)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_helper_import_does_not_import_bindings():
+    code = (
+        "import sys\n"
+        "import utspclient\n"
+        "from utspclient.helpers import lpg_catalog, lpg_helper\n"
+        "assert 'utspclient.helpers.lpgpythonbindings' not in sys.modules\n"
+        "assert 'utspclient.client' not in sys.modules\n"
+        "assert 'pandas' not in sys.modules\n"
+        "assert lpg_helper.create_basic_lpg_config('ref', 'HT01').CalcSpec\n"
+        "assert 'utspclient.helpers.lpgpythonbindings' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_submodules_are_imported_on_access():
+    code = (
+        "import sys, utspclient\n"
+        "assert 'utspclient.helpers.lpg_helper' not in sys.modules\n"
+        "assert utspclient.helpers.lpg_helper.create_population\n"
+        "assert 'utspclient.client' not in sys.modules\n"
+        "assert utspclient.client.UTSPClient\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_star_import_exports_bindings_and_catalogs():
+    namespace: dict = {}
+    exec("from utspclient.helpers.lpgdata import *", namespace)
+    binding_namespace: dict = {}
+    exec("from utspclient.helpers.lpgpythonbindings import *", binding_namespace)
+    assert set(binding_namespace) - {"__builtins__"} <= set(namespace)
+    assert namespace["JsonReference"] is lpgpythonbindings.JsonReference
+    assert namespace["Gender"] is lpgpythonbindings.Gender
+    assert namespace["Households"] is lpgdata.Households
+
+
+def test_dir_lists_bindings_and_entries():
+    assert {"JsonReference", "Gender", "Households"} <= set(dir(lpgdata))
+    assert "CHR01_Couple_both_at_Work" in dir(lpgdata.Households)
+
+
+def test_entries_are_resolved_on_access():
+    household = lpgdata.Households.CHR01_Couple_both_at_Work
+    assert isinstance(household, lpgpythonbindings.JsonReference)
+    assert household.Name == "CHR01 Couple both at Work"
+    assert lpgdata.LoadTypes.Electricity == "Electricity"
+    person = lpgdata.TemplatePersons.CHR01_0_23F
+    assert isinstance(person.Gender, lpgpythonbindings.Gender)
+    with pytest.raises(AttributeError):
+        lpgdata.Households.CHR00_Unknown
+    with pytest.raises(AttributeError):
+        lpgdata.UnknownBinding
@@ -0,0 +1,115 @@
+import threading
+import time
+
+import pytest
+
+from tests.conftest import FAST_POLLING, create_requests
+from tests.stand_in_server import StandInServer
+from utspclient.client import UTSPClient
+from utspclient.pipeline import Pipeline
+
+
+def run_pipeline(pipeline: Pipeline, requests, timeout: float = 10):
+    """Runs the pipeline in a separate thread, so that a hanging pipeline fails the test"""
+    outcome = {}
+
+    def target():
+        try:
+            outcome["completed"] = pipeline.run(requests)
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "The pipeline did not finish"
+    return outcome
+
+
+@pytest.fixture
+def client(server: StandInServer):
+    server.bulk_status = True
+    with UTSPClient(
+        server.url, polling_policy=FAST_POLLING, max_polls_per_second=1000
+    ) as utsp_client:
+        yield utsp_client
+
+
+def test_results_are_passed_to_sink(server: StandInServer, client: UTSPClient):
+    results = {}
+    pipeline = Pipeline(
+        client, lambda request, delivery: results.update({request: delivery})
+    )
+    requests = create_requests(10)
+    outcome = run_pipeline(pipeline, requests)
+    assert outcome == {"completed": 10}
+    assert set(results) == {request.to_json() for request in requests}  # type: ignore
+    assert server.calls["requeststatusbulk"] > 0
+
+
+def test_unknown_requests_are_submitted_again(
+    server: StandInServer, client: UTSPClient
+):
+    server.forget_requests = True
+    pipeline = Pipeline(client, lambda request, delivery: None)
+    outcome = run_pipeline(pipeline, create_requests(5))
+    assert outcome == {"completed": 5}
+    assert sum(server.batch_sizes) == 10
+
+
+def test_invalid_status_fails_requests(server: StandInServer, client: UTSPClient):
+    server.bulk_status_code = 42
+    pipeline = Pipeline(client, lambda request, delivery: None)
+    outcome = run_pipeline(pipeline, create_requests(3))
+    assert outcome == {"completed": 0}
+    assert len(pipeline.errors) == 3
+    assert all(isinstance(error, ValueError) for _, error in pipeline.errors)
+
+
+def test_stops_with_full_queues(server: StandInServer, client: UTSPClient):
+    server.ready_after = 0
+
+    def requests():
+        yield from create_requests(20)
+        raise RuntimeError("no more requests")
+
+    pipeline = Pipeline(
+        client, lambda request, delivery: time.sleep(0.05), queue_size=1, batch_size=1
+    )
+    start = time.time()
+    outcome = run_pipeline(pipeline, requests())
+    assert isinstance(outcome["error"], RuntimeError)
+    assert time.time() - start < 5
+
+
+@pytest.mark.parametrize("method", ["get_statuses", "poll"])
+def test_failed_status_checks_are_retried(
+    server: StandInServer, client: UTSPClient, monkeypatch, method: str
+):
+    original = getattr(client, method)
+    failures = [ConnectionError("connection dropped")] * 3
+
+    def flaky(*args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(client, method, flaky)
+    pipeline = Pipeline(client, lambda request, delivery: None, max_retries=2)
+    outcome = run_pipeline(pipeline, create_requests(3))
+    assert outcome == {"completed": 3}
+    assert not failures
+
+
+def test_requests_fail_after_too_many_retries(
+    server: StandInServer, client: UTSPClient, monkeypatch
+):
+    def fail(*args, **kwargs):
+        raise ConnectionError("connection dropped")
+
+    monkeypatch.setattr(client, "poll", fail)
+    pipeline = Pipeline(client, lambda request, delivery: None, max_retries=2)
+    outcome = run_pipeline(pipeline, create_requests(3))
+    assert outcome == {"completed": 0}
+    assert len(pipeline.errors) == 3
+    assert all(isinstance(error, ConnectionError) for _, error in pipeline.errors)
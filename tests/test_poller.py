@@ -0,0 +1,103 @@
+import threading
+from typing import List, Set
+
+import pytest
+
+from tests.conftest import FAST_POLLING, create_request, create_requests
+from tests.stand_in_server import StandInServer
+from utspclient.client import UTSPClient
+from utspclient.datastructures import CalculationStatus, RestReply
+from utspclient.poller import BackgroundPoller
+from utspclient.polling import PollBudget
+
+
+class RecordingClient(UTSPClient):
+    """Client that records the threads on which results are decoded"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.result_threads: Set[str] = set()
+
+    def get_result(self, reply, request=None):
+        self.result_threads.add(threading.current_thread().name)
+        return super().get_result(reply, request)
+
+
+def test_results_are_decoded_by_workers(server: StandInServer):
+    requests = create_requests(4)
+    client = RecordingClient(
+        server.url, polling_policy=FAST_POLLING, max_polls_per_second=1000
+    )
+    with client:
+        futures = [client.poller.track(request) for request in requests]
+        results = [future.result(timeout=10) for future in futures]
+    assert [result.original_request for result in results] == requests
+    assert client.result_threads
+    assert all(name.startswith("UTSPResultWorker") for name in client.result_threads)
+
+
+class CountingBudget(PollBudget):
+    """Poll budget that counts the status checks it allowed"""
+
+    def __init__(self, max_polls_per_second: float) -> None:
+        super().__init__(max_polls_per_second)
+        self.polls = 0
+
+    def wait(self) -> None:
+        self.polls += 1
+        super().wait()
+
+
+def test_status_checks_use_client_budget(server: StandInServer):
+    server.ready_after = 2
+    with UTSPClient(server.url, polling_policy=FAST_POLLING) as client:
+        client.poll_budget = CountingBudget(1000)
+        future = client.poller.track(create_request())
+        future.result(timeout=10)
+    # the poller shares the budget with pipelines and get_statuses
+    assert client.poll_budget.polls == sum(server.calls.values())
+    assert client.poll_budget.polls >= 3
+
+
+def test_stop_cancels_tracked_requests(server: StandInServer):
+    server.ready_after = 1000
+    client = UTSPClient(server.url, polling_policy=FAST_POLLING)
+    future = client.poller.track(create_request())
+    client.close()
+    assert future.cancelled()
+
+
+def test_failed_status_checks_are_retried(server: StandInServer):
+    # the first two attempts to submit the request fail
+    server.failures = 2
+    with UTSPClient(server.url, polling_policy=FAST_POLLING) as client:
+        future = client.poller.track(create_request())
+        result = future.result(timeout=10)
+    assert result.original_request == create_request()
+
+
+def test_request_fails_after_too_many_retries(server: StandInServer):
+    server.failures = 1000
+    with UTSPClient(
+        server.url, polling_policy=FAST_POLLING, max_polls_per_second=1000
+    ) as client:
+        poller = BackgroundPoller(client, max_retries=2)
+        future = poller.track(create_request())
+        with pytest.raises(Exception, match="502"):
+            future.result(timeout=10)
+        poller.stop()
+    assert sum(server.calls.values()) == 3
+
+
+def test_track_after_stop_does_not_resolve(server: StandInServer):
+    client = UTSPClient(server.url, polling_policy=FAST_POLLING)
+    client.poller.stop()
+    reply = RestReply(b"", CalculationStatus.INDATABASE, "hash")
+    statuses: List[RestReply] = []
+    with pytest.raises(RuntimeError, match="stopped"):
+        client.poller.track(
+            create_request(), reply, on_status=statuses.append
+        )
+    client.close()
+    # the finished reply was not handed on
+    assert not statuses
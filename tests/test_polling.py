@@ -0,0 +1,80 @@
+import pytest
+
+from utspclient.datastructures import TimeSeriesRequest
+from utspclient.polling import PollingPolicy, get_providername
+
+
+def test_delay_grows_exponentially():
+    policy = PollingPolicy(initial_delay=1, factor=2, max_delay=60, jitter=0)
+    delays = [policy.get_delay("lpg", attempt) for attempt in range(5)]
+    assert delays == [1, 2, 4, 8, 16]
+
+
+def test_delay_is_capped():
+    policy = PollingPolicy(initial_delay=1, factor=2, max_delay=60, jitter=0)
+    assert policy.get_delay("lpg", 6) == 60
+    assert policy.get_delay("lpg", 100) == 60
+
+
+@pytest.mark.parametrize("attempt", [2000, 10**9])
+def test_delay_does_not_overflow(attempt: int):
+    policy = PollingPolicy(initial_delay=0.5, factor=1.5, max_delay=30, jitter=0)
+    assert policy.get_delay("lpg", attempt) == 30
+
+
+def test_delay_without_backoff():
+    policy = PollingPolicy(initial_delay=2, factor=1, jitter=0)
+    assert policy.get_delay("lpg", 0) == policy.get_delay("lpg", 5000) == 2
+
+
+def test_jitter_bounds():
+    policy = PollingPolicy(initial_delay=1, factor=2, max_delay=60, jitter=0.1)
+    delays = [policy.get_delay("lpg", 3) for _ in range(1000)]
+    assert all(7.2 <= delay <= 8.8 for delay in delays)
+    # the delays are spread out
+    assert len(set(delays)) > 1
+
+
+def test_first_check_uses_learned_duration():
+    policy = PollingPolicy(initial_delay=1, jitter=0, first_check_share=0.8)
+    assert policy.expected_duration("lpg") is None
+    policy.record_duration("lpg", 100)
+    assert policy.expected_duration("lpg") == 100
+    assert policy.get_delay("lpg", 0) == 80
+    # later checks use the exponential backoff
+    assert policy.get_delay("lpg", 1) == 2
+    # other providers are not affected
+    assert policy.get_delay("hisim", 0) == 1
+
+
+def test_first_check_is_not_earlier_than_initial_delay():
+    policy = PollingPolicy(initial_delay=1, jitter=0)
+    policy.record_duration("lpg", 0.1)
+    assert policy.get_delay("lpg", 0) == 1
+
+
+def test_durations_are_smoothed():
+    policy = PollingPolicy(smoothing=0.25)
+    policy.record_duration("LPG", 100)
+    policy.record_duration("lpg", 20)
+    # provider names are not case sensitive
+    assert policy.expected_duration("Lpg") == 80
+
+
+def test_durations_are_not_learned_if_disabled():
+    policy = PollingPolicy(learn_durations=False)
+    policy.record_duration("lpg", 100)
+    policy.record_duration("", 100)
+    assert policy.expected_duration("lpg") is None
+    policy = PollingPolicy()
+    # requests without provider name are not learned from
+    policy.record_duration("", 100)
+    assert policy.expected_duration("") is None
+
+
+def test_get_providername():
+    request = TimeSeriesRequest("config", "LPG")
+    assert get_providername(request) == "LPG"
+    assert get_providername(request.to_json()) == "LPG"  # type: ignore
+    assert get_providername("not json") == ""
+    assert get_providername("[1, 2]") == ""
@@ -0,0 +1,88 @@
+import zlib
+
+import pytest
+
+from utspclient.datastructures import CalculationStatus, RestReply
+from utspclient.protocol import (
+    ClientBase,
+    is_complete_status_reply,
+    is_endpoint_supported,
+    parse_batch_replies,
+)
+
+
+def create_client(**kwargs) -> ClientBase:
+    settings = dict(
+        url="http://localhost/api/v1/profilerequest",
+        api_key="",
+        poll_by_hash=True,
+        polling_policy=None,
+        binary_results=True,
+        max_result_memory=None,
+        spill_directory=None,
+        lazy_results=False,
+        cache=None,
+        memory_cache=None,
+        request_compression=None,
+        compression_threshold=100,
+        upload_input_files=False,
+        batch_size=500,
+    )
+    settings.update(kwargs)
+    return ClientBase(**settings)  # type: ignore
+
+
+def test_endpoint_support():
+    assert is_endpoint_supported(200)
+    assert not is_endpoint_supported(404)
+    assert not is_endpoint_supported(501)
+    with pytest.raises(Exception, match="Received error code: 500"):
+        is_endpoint_supported(500)
+
+
+@pytest.mark.parametrize(
+    "status, result_delivery, complete",
+    [
+        (CalculationStatus.INCALCULATION, None, True),
+        (CalculationStatus.INDATABASE, b"data", True),
+        # the server does not know the hash anymore
+        (CalculationStatus.UNKNOWN, None, False),
+        # the results were not included
+        (CalculationStatus.INDATABASE, None, False),
+    ],
+)
+def test_complete_status_reply(status, result_delivery, complete: bool):
+    reply = RestReply(result_delivery, status, "hash")
+    assert is_complete_status_reply(reply) == complete
+
+
+def test_batch_reply_count_is_checked():
+    body = b'[{"status": 1, "request_hash": "a"}]'
+    assert parse_batch_replies(body, 1)[0].request_hash == "a"
+    with pytest.raises(Exception, match="Received 1 replies for 2 requests"):
+        parse_batch_replies(body, 2)
+
+
+def test_only_large_bodies_are_compressed():
+    client = create_client(request_compression="deflate")
+    body, compressed_body = client._encode_json("small")
+    assert body == b'"small"' and compressed_body is None
+    body, compressed_body = client._encode_json("x" * 200)
+    assert compressed_body is not None and zlib.decompress(compressed_body) == body
+
+
+def test_rejected_compression_is_negotiated():
+    client = create_client(request_compression="gzip")
+    # the first rejection might be caused by the compression
+    assert client._retry_uncompressed(415)
+    client._record_uncompressed_retry(200)
+    assert client.request_compression_supported is False
+    assert client._encode_json("x" * 200)[1] is None
+
+
+def test_accepted_compression_is_negotiated():
+    client = create_client(request_compression="gzip")
+    assert not client._retry_uncompressed(200)
+    assert client.request_compression_supported is True
+    # once compression is known to work, errors are not retried uncompressed
+    assert not client._retry_uncompressed(400)
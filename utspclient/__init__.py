@@ -1 +1,32 @@
-from utspclient import client, datastructures, result_file_filters, helpers
+"""
+Client for the Universal Time Series Provider (UTSP). The submodules are only imported
+when they are used, so that importing a single one, e.g. the LPG helpers, does not
+import the client and its dependencies.
+"""
+
+import importlib
+from typing import Any, List
+
+_SUBMODULES = [
+    "cache",
+    "campaign",
+    "client",
+    "datastructures",
+    "decoding",
+    "helpers",
+    "pipeline",
+    "poller",
+    "polling",
+    "protocol",
+    "result_file_filters",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_SUBMODULES))
@@ -0,0 +1,576 @@
+"""
+Asynchronous client for the UTSP server, which allows to have many requests in flight
+at the same time from a single process. It requires aiohttp, which is installed with
+the "async" extra (pip install utspclient[async]). It is not imported by the utspclient
+package, so import utspclient.async_client explicitly to use it.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urljoin
+
+import aiohttp
+import numpy as np
+from utspclient.cache import DecodedResultCache, ResultCache, get_request_hash
+from utspclient.client import decompress_result_data, get_result
+from utspclient.datastructures import (
+    CalculationStatus,
+    RestReply,
+    ResultDelivery,
+    TimeSeriesRequest,
+)
+from utspclient.polling import PollingPolicy, get_providername
+from utspclient.protocol import (
+    BATCH_ENDPOINT,
+    BULK_STATUS_ENDPOINT,
+    INPUT_FILE_CHECK_ENDPOINT,
+    INPUT_FILE_UPLOAD_ENDPOINT,
+    JSON_HEADERS,
+    STATUS_BY_HASH_ENDPOINT,
+    ClientBase,
+    check_status,
+    get_status_code,
+    get_upload_headers,
+    is_complete_status_reply,
+    is_endpoint_supported,
+    parse_batch_replies,
+    parse_bulk_statuses,
+    parse_reply,
+)
+
+
+class AsyncUTSPClient(ClientBase):
+    """
+    Asynchronous counterpart of :class:`utspclient.client.UTSPClient`.
+
+    The number of HTTP requests that are sent to the server at the same time is limited
+    by a semaphore, so that any number of requests can be waited for concurrently
+    without overloading the server. Endpoint URLs passed to the methods are resolved
+    relative to the url of the client.
+    """
+
+    def __init__(
+        self,
+        url: str = "",
+        api_key: str = "",
+        max_concurrency: int = 100,
+        timeout: Optional[float] = None,
+        poll_by_hash: bool = True,
+        polling_policy: Optional[PollingPolicy] = None,
+        binary_results: bool = True,
+        max_result_memory: Optional[int] = None,
+        spill_directory: Optional[str] = None,
+        lazy_results: bool = False,
+        cache: Optional[ResultCache] = None,
+        memory_cache: Optional[DecodedResultCache] = None,
+        request_compression: Optional[str] = None,
+        compression_threshold: int = 16384,
+        upload_input_files: bool = False,
+        batch_size: int = 500,
+    ) -> None:
+        """
+        Creates a new asynchronous client
+
+        :param url: URL of the UTSP server or of its profile request endpoint, defaults to ""
+        :type url: str, optional
+        :param api_key: the api key to use, defaults to ""
+        :type api_key: str, optional
+        :param max_concurrency: maximum number of concurrent HTTP requests, defaults to 100
+        :type max_concurrency: int, optional
+        :param timeout: default timeout for each HTTP request in seconds, defaults to None
+        :type timeout: Optional[float], optional
+        :param poll_by_hash: whether to poll the status of submitted requests by their hash
+            instead of sending the full request again, defaults to True
+        :type poll_by_hash: bool, optional
+        :param polling_policy: policy that determines the delays between status checks,
+            defaults to a new PollingPolicy with default parameters
+        :type polling_policy: Optional[PollingPolicy], optional
+        :param binary_results: whether to ask the server to send result data in a binary
+            format instead of json lists of integers, defaults to True
+        :type binary_results: bool, optional
+        :param max_result_memory: maximum number of bytes of result file contents to keep in
+            memory when decoding a delivery, defaults to None (no limit)
+        :type max_result_memory: Optional[int], optional
+        :param spill_directory: directory to write result files to that would exceed the
+            memory limit. These files are not deleted automatically, see
+            ResultDelivery.remove_spilled_files. Defaults to None
+        :type spill_directory: Optional[str], optional
+        :param lazy_results: whether to return LazyResultDelivery objects that only decode
+            result files when they are accessed, defaults to False
+        :type lazy_results: bool, optional
+        :param cache: local cache for delivered results. Requests whose results are in the
+            cache are not sent to the server at all. Defaults to None
+        :type cache: Optional[ResultCache], optional
+        :param memory_cache: in-memory cache for decoded results, defaults to None
+        :type memory_cache: Optional[DecodedResultCache], optional
+        :param request_compression: content encoding for compressing large request bodies,
+            either "gzip" or "deflate", defaults to None (no compression)
+        :type request_compression: Optional[str], optional
+        :param compression_threshold: minimum size of a request body in bytes to be
+            compressed, defaults to 16384
+        :type compression_threshold: int, optional
+        :param upload_input_files: whether to upload the input files of requests to the input
+            file store of the server, so that requests only contain references to them.
+            Each file is only uploaded once. Input files are sent inline if the server
+            does not provide an input file store. Defaults to False
+        :type upload_input_files: bool, optional
+        :param batch_size: maximum number of requests that are sent together when submitting
+            many requests at once, defaults to 500
+        :type batch_size: int, optional
+        """
+        super().__init__(
+            url,
+            api_key,
+            poll_by_hash,
+            polling_policy,
+            binary_results,
+            max_result_memory,
+            spill_directory,
+            lazy_results,
+            cache,
+            memory_cache,
+            request_compression,
+            compression_threshold,
+            upload_input_files,
+            batch_size,
+        )
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        # asyncio primitives, created within the event loop that uses them
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore_instance: Optional[asyncio.Semaphore] = None
+        # prevents uploading the same file concurrently
+        self._input_file_lock_instance: Optional[asyncio.Lock] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        # closes the session of a previous event loop that was already closed
+        self._closing_session: Optional["asyncio.Task[None]"] = None
+        # tasks of the requests that are currently processed, for coalescing
+        # concurrent calls for the same request
+        self._in_flight: Dict[Tuple[str, str], "asyncio.Task[ResultDelivery]"] = {}
+
+    async def __aenter__(self) -> "AsyncUTSPClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes all pooled connections"""
+        self._bind_to_running_loop()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._closing_session is not None:
+            await self._closing_session
+            self._closing_session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The HTTP session of this client. It is created on first use, because it has
+        to be created within a running event loop, and created again when the client is
+        used in another event loop."""
+        self._bind_to_running_loop()
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self._get_session_headers(),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    @property
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Limits the number of concurrent HTTP requests"""
+        self._bind_to_running_loop()
+        assert self._semaphore_instance is not None
+        return self._semaphore_instance
+
+    @property
+    def _input_file_lock(self) -> asyncio.Lock:
+        """Prevents uploading the same input file concurrently"""
+        self._bind_to_running_loop()
+        assert self._input_file_lock_instance is not None
+        return self._input_file_lock_instance
+
+    def _bind_to_running_loop(self) -> None:
+        """Creates the asyncio primitives of this client for the running event loop. On
+        older Python versions they are bound to the loop they were created in, so they are
+        created again when the client is used in another loop, e.g. in a later call of
+        asyncio.run. The HTTP session of the previous loop is closed, and a new one is
+        created on first use."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            previous_loop = self._loop
+            self._loop = loop
+            if self._session is not None:
+                if previous_loop is not None and previous_loop.is_closed():
+                    # the connections were dropped with the loop, so closing the session
+                    # does not need the previous loop anymore
+                    self._closing_session = loop.create_task(self._session.close())
+                elif previous_loop is not None:
+                    asyncio.run_coroutine_threadsafe(
+                        self._session.close(), previous_loop
+                    )
+                self._session = None
+            self._semaphore_instance = asyncio.Semaphore(self.max_concurrency)
+            self._input_file_lock_instance = asyncio.Lock()
+            # tasks of another event loop can not be awaited anymore
+            self._in_flight = {}
+
+    async def send_request(
+        self,
+        request: Union[str, TimeSeriesRequest],
+        url: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> RestReply:
+        """
+        Sends the request to the utsp and returns the reply
+
+        :param request: the request to send
+        :type request: Union[str, TimeSeriesRequest]
+        :param url: URL of the endpoint to send the request to, defaults to the client url
+        :type url: Optional[str], optional
+        :param timeout: timeout for this request, defaults to the client timeout
+        :type timeout: Optional[float], optional
+        :raises Exception: if the server reported an error
+        :return: the reply from the utsp server
+        :rtype: RestReply
+        """
+        url = self.resolve_url(url)
+        request = await self._prepare_request(request, url, timeout)
+        response, content = await self._post_json(url, request, timeout)
+        check_status(response.status)
+        return parse_reply(response.headers, content)
+
+    async def send_requests(
+        self,
+        requests: Iterable[Union[str, TimeSeriesRequest]],
+        url: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> List[RestReply]:
+        """
+        Sends multiple requests to the utsp in batches, or concurrently one by one if the
+        server does not support batches. See :meth:`utspclient.client.UTSPClient.send_requests`.
+        """
+        requests = list(requests)
+        url = self.resolve_url(url)
+        replies: List[RestReply] = []
+        while self.batch_supported is not False and len(replies) < len(requests):
+            batch = [
+                await self._prepare_request(request, url, timeout)
+                for request in requests[len(replies) : len(replies) + self.batch_size]
+            ]
+            response, content = await self._post_json(
+                urljoin(url, BATCH_ENDPOINT), batch, timeout
+            )
+            self.batch_supported = is_endpoint_supported(response.status)
+            if not self.batch_supported:
+                break
+            replies.extend(parse_batch_replies(content, len(batch)))
+        remaining = requests[len(replies) :]
+        replies.extend(
+            await asyncio.gather(
+                *[self.send_request(request, url, timeout) for request in remaining]
+            )
+        )
+        return replies
+
+    async def _prepare_request(
+        self,
+        request: Union[str, TimeSeriesRequest],
+        url: str,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """Returns the json representation of a request for sending it to the
+        server. Input files are uploaded to the input file store of the server if
+        possible and replaced by references."""
+        request, referencing_request, contents = self._reference_input_files(request)
+        if referencing_request is not None and await self.store_input_files(
+            contents, url, timeout
+        ):
+            return referencing_request
+        return request
+
+    async def _post_json(
+        self, url: str, value: Any, timeout: Optional[float] = None
+    ) -> Tuple[aiohttp.ClientResponse, bytes]:
+        """Posts a value as json, compressing the body if it is large enough. Returns
+        the response and its body."""
+        request_timeout = (
+            aiohttp.ClientTimeout(total=timeout) if timeout is not None else None
+        )
+        body, compressed_body = self._encode_json(value)
+        async with self._semaphore:
+            if compressed_body is not None:
+                async with self.session.post(
+                    url,
+                    data=compressed_body,
+                    headers=self._get_compressed_json_headers(),
+                    timeout=request_timeout,
+                ) as response:
+                    content = await response.read()
+                if not self._retry_uncompressed(response.status):
+                    return response, content
+            async with self.session.post(
+                url, data=body, headers=JSON_HEADERS, timeout=request_timeout
+            ) as response:
+                content = await response.read()
+            if compressed_body is not None:
+                self._record_uncompressed_retry(response.status)
+            return response, content
+
+    async def get_statuses(
+        self,
+        request_hashes: Iterable[str],
+        url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        chunk_size: int = 10000,
+    ) -> np.ndarray:
+        """
+        Requests the statuses of many requests at once.
+        See :meth:`utspclient.client.UTSPClient.get_statuses`.
+        """
+        request_hashes = list(request_hashes)
+        url = self.resolve_url(url)
+        statuses = np.empty(len(request_hashes), dtype=np.int8)
+        done = 0
+        while self.bulk_status_supported is not False and done < len(request_hashes):
+            chunk = request_hashes[done : done + chunk_size]
+            response, content = await self._post_json(
+                urljoin(url, BULK_STATUS_ENDPOINT), chunk, timeout
+            )
+            self.bulk_status_supported = is_endpoint_supported(response.status)
+            if not self.bulk_status_supported:
+                break
+            statuses[done : done + len(chunk)] = parse_bulk_statuses(
+                response.headers, content, len(chunk)
+            )
+            done += len(chunk)
+        if done < len(request_hashes):
+            replies = await asyncio.gather(
+                *[
+                    self.send_status_request(request_hash, url, timeout)
+                    for request_hash in request_hashes[done:]
+                ]
+            )
+            statuses[done:] = [get_status_code(reply) for reply in replies]
+        return statuses
+
+    async def store_input_files(
+        self,
+        contents: Dict[str, bytes],
+        url: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Uploads input files to the input file store of the server, unless they are already
+        stored there. See :meth:`utspclient.client.UTSPClient.store_input_files`.
+        """
+        url = self.resolve_url(url)
+        if not self._get_unstored_input_files(contents, url):
+            return True
+        async with self._input_file_lock:
+            return await self._store_input_files(contents, url, timeout)
+
+    async def _store_input_files(
+        self, contents: Dict[str, bytes], url: str, timeout: Optional[float] = None
+    ) -> bool:
+        # must be called while holding the input file lock
+        unchecked = self._get_unstored_input_files(contents, url)
+        if not unchecked:
+            return True
+        request_timeout = (
+            aiohttp.ClientTimeout(total=timeout) if timeout is not None else None
+        )
+        async with self._semaphore:
+            async with self.session.post(
+                urljoin(url, INPUT_FILE_CHECK_ENDPOINT),
+                json=unchecked,
+                timeout=request_timeout,
+            ) as response:
+                self.input_file_store_supported = is_endpoint_supported(
+                    response.status
+                )
+                if not self.input_file_store_supported:
+                    return False
+                missing = await response.json(content_type=None)
+        for content_hash in missing:
+            async with self._semaphore:
+                async with self.session.post(
+                    urljoin(url, INPUT_FILE_UPLOAD_ENDPOINT),
+                    data=contents[content_hash],
+                    headers=get_upload_headers(content_hash),
+                    timeout=request_timeout,
+                ) as response:
+                    check_status(response.status)
+        self._record_stored_input_files(url, unchecked)
+        return True
+
+    async def send_status_request(
+        self,
+        request_hash: str,
+        url: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[RestReply]:
+        """
+        Requests the status of a previously submitted request using only its hash.
+        See :meth:`utspclient.client.UTSPClient.send_status_request`.
+        """
+        request_timeout = (
+            aiohttp.ClientTimeout(total=timeout) if timeout is not None else None
+        )
+        async with self._semaphore:
+            async with self.session.post(
+                urljoin(self.resolve_url(url), STATUS_BY_HASH_ENDPOINT),
+                json=request_hash,
+                timeout=request_timeout,
+            ) as response:
+                self.status_by_hash_supported = is_endpoint_supported(response.status)
+                if not self.status_by_hash_supported:
+                    return None
+                body = await response.read()
+        return parse_reply(response.headers, body)
+
+    async def poll(
+        self,
+        request: Union[str, TimeSeriesRequest],
+        reply: RestReply,
+        url: Optional[str] = None,
+    ) -> RestReply:
+        """
+        Checks the status of a submitted request, if possible only using its hash.
+        See :meth:`utspclient.client.UTSPClient.poll`.
+        """
+        if self._can_poll_by_hash(reply):
+            status_reply = await self.send_status_request(reply.request_hash, url)
+            if status_reply is not None and is_complete_status_reply(status_reply):
+                return status_reply
+        return await self.send_request(request, url)
+
+    async def get_result(
+        self,
+        reply: RestReply,
+        request: Optional[Union[str, TimeSeriesRequest]] = None,
+    ) -> Optional[ResultDelivery]:
+        """
+        Gets the time series out of a rest reply if it was delivered. Decompressing
+        the result data is done in an executor to not block the event loop.
+        See :meth:`utspclient.client.UTSPClient.get_result`.
+        """
+        if reply.status != CalculationStatus.INDATABASE:
+            return get_result(reply)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            None,
+            get_result,
+            reply,
+            self.max_result_memory,
+            self.spill_directory,
+            self.lazy_results,
+        )
+        if request is None or not reply.result_delivery:
+            return result
+        # only cache deliveries that could be decoded
+        request_hash = get_request_hash(request)
+        if self.cache is not None:
+            await loop.run_in_executor(
+                None, self.cache.put, request_hash, reply.result_delivery
+            )
+        if self.memory_cache is not None and result is not None:
+            self.memory_cache.put(request_hash, result)
+        return result
+
+    async def get_cached_result(
+        self, request: Union[str, TimeSeriesRequest]
+    ) -> Optional[ResultDelivery]:
+        """
+        Returns the result of a request from the cache of the client.
+        See :meth:`utspclient.client.UTSPClient.get_cached_result`.
+        """
+        if self.cache is None and self.memory_cache is None:
+            return None
+        request_hash = get_request_hash(request)
+        if self.memory_cache is not None:
+            result = self.memory_cache.get(request_hash)
+            if result is not None:
+                return result
+        if self.cache is None:
+            return None
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, self.cache.get, request_hash)
+        if data is None:
+            return None
+        result = await loop.run_in_executor(
+            None,
+            decompress_result_data,
+            data,
+            self.max_result_memory,
+            self.spill_directory,
+            self.lazy_results,
+        )
+        if self.memory_cache is not None:
+            self.memory_cache.put(request_hash, result)
+        return result
+
+    async def request_time_series_and_wait_for_delivery(
+        self,
+        request: Union[str, TimeSeriesRequest],
+        url: Optional[str] = None,
+    ) -> ResultDelivery:
+        """
+        Requests a single time series from the UTSP server and waits until it was delivered.
+        If the same request is already in flight, it is not sent again, but the pending
+        request is waited for.
+
+        :param request: The request object defining the requested time series
+        :type request: Union[str, TimeSeriesRequest]
+        :param url: URL of the profile request endpoint, defaults to the client url
+        :type url: Optional[str], optional
+        :return: The requested result data
+        :rtype: ResultDelivery
+        """
+        cached_result = await self.get_cached_result(request)
+        if cached_result is not None:
+            return cached_result
+        key = (self.resolve_url(url), get_request_hash(request))
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._wait_for_delivery(request, url))
+            self._in_flight[key] = task
+
+            def remove(finished_task) -> None:
+                if self._in_flight.get(key) is finished_task:
+                    del self._in_flight[key]
+
+            task.add_done_callback(remove)
+        # shield the task, so that a cancelled caller does not cancel it for all others
+        return await asyncio.shield(task)
+
+    async def _wait_for_delivery(
+        self,
+        request: Union[str, TimeSeriesRequest],
+        url: Optional[str] = None,
+    ) -> ResultDelivery:
+        """Sends a request and polls its status until the results are delivered"""
+        providername = get_providername(request)
+        if isinstance(request, TimeSeriesRequest):
+            request = request.to_json()  # type: ignore
+        # submit the request once, then only poll its status
+        start_time = time.time()
+        reply = await self.send_request(request, url)
+        wait_count = 0
+        while reply.status not in [
+            CalculationStatus.INDATABASE,
+            CalculationStatus.CALCULATIONFAILED,
+        ]:
+            await asyncio.sleep(self.polling_policy.get_delay(providername, wait_count))
+            wait_count += 1
+            reply = await self.poll(request, reply, url)
+        if wait_count > 0 and reply.status == CalculationStatus.INDATABASE:
+            # learn how long the calculation took for polling future requests
+            self.polling_policy.record_duration(providername, time.time() - start_time)
+        ts = await self.get_result(reply, request)
+        assert ts is not None, "No time series was delivered"
+        return ts
@@ -0,0 +1,344 @@
+"""
+Local caches for result data, so that results already delivered by the UTSP do not have
+to be downloaded again
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union
+
+from utspclient.datastructures import (
+    LazyResultData,
+    ResultDelivery,
+    SpilledFile,
+    TimeSeriesRequest,
+    get_cache_key_from_json,
+)
+
+
+def get_request_hash(request: Union[str, TimeSeriesRequest]) -> str:
+    """
+    Returns the hash of a request that is used as cache key
+
+    :param request: the request, either as object or as json string
+    :type request: Union[str, TimeSeriesRequest]
+    :return: the hash of the request
+    :rtype: str
+    """
+    if isinstance(request, str):
+        return get_cache_key_from_json(request)
+    return request.get_cache_key()
+
+
+class ResultCache:
+    """
+    Persistent, content-addressed cache for compressed result deliveries, stored in an
+    SQLite database. The deliveries are stored exactly as received from the server,
+    keyed by the hash of the request.
+
+    The total size of the cache can be limited, in which case the least recently used
+    entries are evicted, and entries can expire after a fixed time. A checksum of each
+    entry is verified on every read. The database uses write-ahead logging, so that
+    multiple threads and processes can safely use the same cache file concurrently.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        timeout: float = 60,
+    ) -> None:
+        """
+        Opens or creates a cache
+
+        :param path: path of the database file
+        :type path: str
+        :param max_size: maximum total size of all cached deliveries in bytes, defaults to
+            None (no limit)
+        :type max_size: Optional[int], optional
+        :param ttl: time in seconds after which cached deliveries expire, defaults to None
+            (no expiration)
+        :type ttl: Optional[float], optional
+        :param timeout: time in seconds to wait for locks held by other processes,
+            defaults to 60
+        :type timeout: float, optional
+        """
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self.timeout = timeout
+        # sqlite connections must not be shared between threads
+        self._local = threading.local()
+        # all connections opened by any thread, so that close can close them
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        connection = self._connection
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("""CREATE TABLE IF NOT EXISTS results (
+                request_hash TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                checksum TEXT NOT NULL,
+                created REAL NOT NULL,
+                last_access REAL NOT NULL
+            )""")
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access)"
+        )
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        with self._connections_lock:
+            if connection is not None and connection in self._connections:
+                return connection
+            # autocommit mode; transactions are started explicitly. The connection is
+            # only used by this thread, but it may be closed by another one.
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._connections.append(connection)
+        self._local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        """Closes the database connections of all threads. It must not be called while
+        other threads use the cache. The cache can still be used afterwards, which opens
+        new connections."""
+        with self._connections_lock:
+            connections = self._connections
+            self._connections = []
+        for connection in connections:
+            connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def __contains__(self, request_hash: str) -> bool:
+        # unlike get, this neither marks the entry as used nor removes expired entries
+        query = "SELECT 1 FROM results WHERE request_hash = ?"
+        parameters: Tuple[Union[str, float], ...] = (request_hash,)
+        if self.ttl is not None:
+            query += " AND created >= ?"
+            parameters += (time.time() - self.ttl,)
+        return self._connection.execute(query, parameters).fetchone() is not None
+
+    @property
+    def size(self) -> int:
+        """The total size of all cached deliveries in bytes"""
+        row = self._connection.execute("SELECT SUM(size) FROM results").fetchone()
+        return row[0] or 0
+
+    def get(self, request_hash: str) -> Optional[bytes]:
+        """
+        Returns a cached delivery. Expired entries and entries with an invalid checksum
+        are removed.
+
+        :param request_hash: hash of the request
+        :type request_hash: str
+        :return: the compressed delivery, or None if it is not in the cache
+        :rtype: Optional[bytes]
+        """
+        connection = self._connection
+        row = connection.execute(
+            "SELECT data, checksum, created FROM results WHERE request_hash = ?",
+            (request_hash,),
+        ).fetchone()
+        if row is None:
+            return None
+        data, checksum, created = row
+        now = time.time()
+        if (self.ttl is not None and created < now - self.ttl) or hashlib.sha256(
+            data
+        ).hexdigest() != checksum:
+            self.remove(request_hash)
+            return None
+        connection.execute(
+            "UPDATE results SET last_access = ? WHERE request_hash = ?",
+            (now, request_hash),
+        )
+        return bytes(data)
+
+    def put(self, request_hash: str, data: bytes) -> None:
+        """
+        Adds a delivery to the cache and evicts entries if the cache is too large
+
+        :param request_hash: hash of the request
+        :type request_hash: str
+        :param data: the compressed delivery as received from the server
+        :type data: bytes
+        """
+        if self.max_size is not None and len(data) > self.max_size:
+            # the delivery does not fit into the cache at all
+            return
+        now = time.time()
+        checksum = hashlib.sha256(data).hexdigest()
+        connection = self._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (request_hash, data, len(data), checksum, now, now),
+            )
+            self._evict(connection, now)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        """Removes expired entries, and least recently used entries while the cache is
+        too large. Must be called within a transaction."""
+        if self.ttl is not None:
+            connection.execute(
+                "DELETE FROM results WHERE created < ?", (now - self.ttl,)
+            )
+        if self.max_size is None:
+            return
+        total = connection.execute("SELECT SUM(size) FROM results").fetchone()[0] or 0
+        if total <= self.max_size:
+            return
+        rows = connection.execute(
+            "SELECT request_hash, size FROM results ORDER BY last_access"
+        ).fetchall()
+        evicted = []
+        for request_hash, size in rows:
+            if total <= self.max_size:
+                break
+            evicted.append((request_hash,))
+            total -= size
+        connection.executemany("DELETE FROM results WHERE request_hash = ?", evicted)
+
+    def remove(self, request_hash: str) -> None:
+        """Removes a delivery from the cache"""
+        self._connection.execute(
+            "DELETE FROM results WHERE request_hash = ?", (request_hash,)
+        )
+
+    def clear(self) -> None:
+        """Removes all deliveries from the cache"""
+        self._connection.execute("DELETE FROM results")
+
+
+def get_delivery_size(delivery: ResultDelivery) -> int:
+    """
+    Returns the total size of the result files of a delivery that are kept in memory.
+    For a lazy delivery this includes the encoded document its result files are
+    located in.
+
+    :param delivery: the result delivery
+    :type delivery: ResultDelivery
+    :return: the size in bytes
+    :rtype: int
+    """
+    if isinstance(delivery.data, LazyResultData):
+        return delivery.data.memory_size
+    return sum(
+        len(value)
+        for value in delivery.data.values()
+        if not isinstance(value, SpilledFile)
+    )
+
+
+class DecodedResultCache:
+    """
+    In-memory LRU cache for decoded result deliveries, keyed by request hash. The cache
+    is bounded by the total size of the result files it holds instead of the number of
+    deliveries. It can be shared between threads.
+
+    Cached deliveries are returned as they are, so they must not be modified. Deliveries
+    with result files that were written to disk are not cached, because these files
+    belong to the caller that received the delivery and might be deleted at any time.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Creates a new cache
+
+        :param max_size: maximum total size of the result files of all cached deliveries
+            in bytes
+        :type max_size: int
+        """
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[ResultDelivery, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, request_hash: str) -> bool:
+        with self._lock:
+            return request_hash in self._entries
+
+    def get(self, request_hash: str) -> Optional[ResultDelivery]:
+        """
+        Returns a cached delivery and marks it as most recently used
+
+        :param request_hash: hash of the request
+        :type request_hash: str
+        :return: the delivery, or None if it is not in the cache
+        :rtype: Optional[ResultDelivery]
+        """
+        with self._lock:
+            entry = self._entries.get(request_hash)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(request_hash)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, request_hash: str, delivery: ResultDelivery) -> None:
+        """
+        Adds a delivery to the cache and evicts the least recently used deliveries if the
+        cache is too large
+
+        :param request_hash: hash of the request
+        :type request_hash: str
+        :param delivery: the decoded delivery
+        :type delivery: ResultDelivery
+        """
+        if delivery.spilled_files:
+            return
+        size = get_delivery_size(delivery)
+        if size > self.max_size:
+            # the delivery does not fit into the cache at all
+            return
+        with self._lock:
+            old_entry = self._entries.pop(request_hash, None)
+            if old_entry is not None:
+                self.size -= old_entry[1]
+            self._entries[request_hash] = (delivery, size)
+            self.size += size
+            while self.size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+    def remove(self, request_hash: str) -> None:
+        """Removes a delivery from the cache"""
+        with self._lock:
+            entry = self._entries.pop(request_hash, None)
+            if entry is not None:
+                self.size -= entry[1]
+
+    def clear(self) -> None:
+        """Removes all deliveries from the cache"""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
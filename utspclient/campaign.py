@@ -0,0 +1,687 @@
+"""
+Persistent manifests for campaigns of many requests, so that a campaign can be
+interrupted and resumed at any time without asking the server for the state of every
+request again
+"""
+
+import os
+import queue
+import shutil
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent import futures
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from utspclient.cache import get_request_hash
+from utspclient.client import CalculationFailedError
+from utspclient.datastructures import (
+    CalculationStatus,
+    RestReply,
+    ResultDelivery,
+    SpilledFile,
+    TimeSeriesRequest,
+)
+
+if TYPE_CHECKING:
+    from utspclient.client import UTSPClient
+
+#: Maximum time in seconds between writing the statuses seen by the poller to the manifest
+STATUS_UPDATE_INTERVAL = 10
+
+# columns of the manifest table that make up a CampaignEntry
+_ENTRY_COLUMNS = (
+    "request_hash, request, name, status, submitted, info, result_path, server_hash"
+)
+
+
+@dataclass
+class CampaignEntry:
+    """A single request of a campaign and what is known about it"""
+
+    request_hash: str
+    request: str
+    name: str
+    status: CalculationStatus
+    submitted: Optional[float] = None
+    info: Optional[str] = None
+    result_path: Optional[str] = None
+    # the hash by which the server identifies the request, once it was submitted
+    server_hash: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the results were stored or the calculation failed"""
+        return (
+            self.result_path is not None
+            or self.status == CalculationStatus.CALCULATIONFAILED
+        )
+
+
+class Campaign:
+    """
+    Manifest of a campaign of requests, stored in an SQLite database. For each request
+    the manifest records when it was submitted, the request hash returned by the server,
+    its last known status, the error message if the calculation failed, and where its
+    result files were stored.
+
+    Requests are claimed by a worker before they are processed, so that several threads
+    or processes can work on the same campaign concurrently. Claims expire after a lease
+    time, so that requests claimed by a crashed worker are processed again by others.
+    The database uses write-ahead logging and every update is a single transaction, so
+    the manifest stays consistent when a worker is interrupted at any point.
+    """
+
+    def __init__(
+        self, path: str, result_directory: Optional[str] = None, timeout: float = 60
+    ) -> None:
+        """
+        Opens or creates a campaign manifest
+
+        :param path: path of the database file
+        :type path: str
+        :param result_directory: directory in which the result files are stored, defaults
+            to a directory next to the database file
+        :type result_directory: Optional[str], optional
+        :param timeout: time in seconds to wait for locks held by other processes,
+            defaults to 60
+        :type timeout: float, optional
+        """
+        self.path = path
+        if result_directory is None:
+            result_directory = os.path.splitext(os.path.abspath(path))[0] + "_results"
+        self.result_directory = result_directory
+        self.timeout = timeout
+        # identifies the claims of this campaign object
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+        # sqlite connections must not be shared between threads
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        connection = self._connection
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("""CREATE TABLE IF NOT EXISTS requests (
+                request_hash TEXT PRIMARY KEY,
+                request TEXT NOT NULL,
+                name TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                submitted REAL,
+                updated REAL,
+                info TEXT,
+                result_path TEXT,
+                claimed_by TEXT,
+                claimed_until REAL,
+                server_hash TEXT
+            )""")
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(requests)")]
+        if "server_hash" not in columns:
+            # manifest created by an older version
+            connection.execute("ALTER TABLE requests ADD COLUMN server_hash TEXT")
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS requests_unfinished ON requests (claimed_until) "
+            f"WHERE result_path IS NULL AND status != {CalculationStatus.CALCULATIONFAILED.value}"
+        )
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # autocommit mode; transactions are started explicitly
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            self._local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        """Closes the database connection of the current thread"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM requests").fetchone()[0]
+
+    def add(self, request: Union[str, TimeSeriesRequest], name: str = "") -> str:
+        """
+        Adds a request to the campaign, unless it is already part of it
+
+        :param request: the request
+        :type request: Union[str, TimeSeriesRequest]
+        :param name: name of the request for identifying its results, defaults to ""
+        :type name: str, optional
+        :return: the hash of the request
+        :rtype: str
+        """
+        return self.add_many([request], [name])[0]
+
+    def add_many(
+        self,
+        requests: Iterable[Union[str, TimeSeriesRequest]],
+        names: Optional[Iterable[str]] = None,
+        request_hashes: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """
+        Adds multiple requests to the campaign in a single transaction. Requests that are
+        already part of the campaign are skipped.
+
+        :param requests: the requests
+        :type requests: Iterable[Union[str, TimeSeriesRequest]]
+        :param names: names of the requests for identifying their results, defaults to None
+        :type names: Optional[Iterable[str]], optional
+        :param request_hashes: the hashes of the requests if they are already known, e.g.
+            from TimeSeriesRequest.get_cache_key_with_guid, defaults to None
+        :type request_hashes: Optional[Iterable[str]], optional
+        :return: the hashes of the requests
+        :rtype: List[str]
+        """
+        requests = list(requests)
+        names = list(names) if names is not None else [""] * len(requests)
+        assert len(names) == len(requests), "A name is needed for each request"
+        if request_hashes is None:
+            hashes = [get_request_hash(request) for request in requests]
+        else:
+            hashes = list(request_hashes)
+            assert len(hashes) == len(requests), "A hash is needed for each request"
+        rows = []
+        for request, name, request_hash in zip(requests, names, hashes):
+            if isinstance(request, TimeSeriesRequest):
+                request = request.to_json()  # type: ignore
+            rows.append(
+                (request_hash, request, name, CalculationStatus.UNKNOWN.value, None)
+            )
+        self._execute_many(
+            "INSERT OR IGNORE INTO requests (request_hash, request, name, status, updated) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        return [row[0] for row in rows]
+
+    def _execute_many(self, statement: str, rows: List[tuple]) -> None:
+        """Executes a statement for many rows in a single transaction"""
+        connection = self._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(statement, rows)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _to_entries(self, rows: Iterable[tuple]) -> List[CampaignEntry]:
+        return [
+            CampaignEntry(
+                request_hash,
+                request,
+                name,
+                CalculationStatus(status),
+                submitted,
+                info,
+                result_path,
+                server_hash,
+            )
+            for (
+                request_hash,
+                request,
+                name,
+                status,
+                submitted,
+                info,
+                result_path,
+                server_hash,
+            ) in rows
+        ]
+
+    def get_entry(self, request_hash: str) -> Optional[CampaignEntry]:
+        """
+        Returns the manifest entry of a request
+
+        :param request_hash: hash of the request
+        :type request_hash: str
+        :return: the entry, or None if the request is not part of the campaign
+        :rtype: Optional[CampaignEntry]
+        """
+        rows = self._connection.execute(
+            f"SELECT {_ENTRY_COLUMNS} " "FROM requests WHERE request_hash = ?",
+            (request_hash,),
+        ).fetchall()
+        entries = self._to_entries(rows)
+        return entries[0] if entries else None
+
+    def get_entries(
+        self, status: Optional[CalculationStatus] = None
+    ) -> List[CampaignEntry]:
+        """
+        Returns the manifest entries of all requests, or of all requests with a specific
+        status
+
+        :param status: the status of the requests to return, defaults to None (all requests)
+        :type status: Optional[CalculationStatus], optional
+        :return: the entries
+        :rtype: List[CampaignEntry]
+        """
+        query = f"SELECT {_ENTRY_COLUMNS} " "FROM requests"
+        if status is None:
+            rows = self._connection.execute(query).fetchall()
+        else:
+            rows = self._connection.execute(
+                query + " WHERE status = ?", (status.value,)
+            ).fetchall()
+        return self._to_entries(rows)
+
+    def count_statuses(self) -> Dict[CalculationStatus, int]:
+        """
+        Counts how many requests of the campaign have each status
+
+        :return: the number of requests for each status
+        :rtype: Dict[CalculationStatus, int]
+        """
+        counts = dict(
+            self._connection.execute(
+                "SELECT status, COUNT(*) FROM requests GROUP BY status"
+            ).fetchall()
+        )
+        return {status: counts.get(status.value, 0) for status in CalculationStatus}
+
+    @property
+    def finished(self) -> bool:
+        """Whether the results of all requests were stored or their calculations failed"""
+        return self.count_unfinished() == 0
+
+    def count_unfinished(self) -> int:
+        """Returns the number of requests whose results were not stored yet and whose
+        calculations did not fail"""
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM requests WHERE result_path IS NULL AND status != ?",
+            (CalculationStatus.CALCULATIONFAILED.value,),
+        ).fetchone()[0]
+
+    def claim(self, count: int, lease: float = 3600) -> List[CampaignEntry]:
+        """
+        Claims unfinished requests for processing by this worker. Requests that are claimed
+        by another worker are skipped, unless the claim has expired.
+
+        :param count: maximum number of requests to claim
+        :type count: int
+        :param lease: time in seconds after which the claims expire, defaults to 3600
+        :type lease: float, optional
+        :return: the claimed entries
+        :rtype: List[CampaignEntry]
+        """
+        now = time.time()
+        connection = self._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            rows = connection.execute(
+                f"SELECT {_ENTRY_COLUMNS} "
+                "FROM requests WHERE result_path IS NULL AND status != ? "
+                "AND (claimed_until IS NULL OR claimed_until < ?) LIMIT ?",
+                (CalculationStatus.CALCULATIONFAILED.value, now, count),
+            ).fetchall()
+            connection.executemany(
+                "UPDATE requests SET claimed_by = ?, claimed_until = ? "
+                "WHERE request_hash = ?",
+                [(self.worker_id, now + lease, row[0]) for row in rows],
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return self._to_entries(rows)
+
+    def release(self, request_hashes: Iterable[str]) -> None:
+        """
+        Releases the claims of this worker for the specified requests
+
+        :param request_hashes: hashes of the requests
+        :type request_hashes: Iterable[str]
+        """
+        self._execute_many(
+            "UPDATE requests SET claimed_by = NULL, claimed_until = NULL "
+            "WHERE request_hash = ? AND claimed_by = ?",
+            [(request_hash, self.worker_id) for request_hash in request_hashes],
+        )
+
+    def renew(self, request_hashes: Iterable[str], lease: float = 3600) -> None:
+        """
+        Extends the claims of this worker for the specified requests
+
+        :param request_hashes: hashes of the requests
+        :type request_hashes: Iterable[str]
+        :param lease: time in seconds from now after which the claims expire, defaults
+            to 3600
+        :type lease: float, optional
+        """
+        claimed_until = time.time() + lease
+        self._execute_many(
+            "UPDATE requests SET claimed_until = ? "
+            "WHERE request_hash = ? AND claimed_by = ?",
+            [
+                (claimed_until, request_hash, self.worker_id)
+                for request_hash in request_hashes
+            ],
+        )
+
+    def record_replies(
+        self, request_hashes: Iterable[str], replies: Iterable[RestReply]
+    ) -> None:
+        """
+        Records the statuses of submitted requests and the hashes by which the server
+        identifies them
+
+        :param request_hashes: hashes of the requests
+        :type request_hashes: Iterable[str]
+        :param replies: the replies received from the server for the requests
+        :type replies: Iterable[RestReply]
+        """
+        now = time.time()
+        self._execute_many(
+            "UPDATE requests SET status = ?, info = ?, updated = ?, "
+            "submitted = COALESCE(submitted, ?), "
+            "server_hash = COALESCE(NULLIF(?, ''), server_hash) WHERE request_hash = ?",
+            [
+                (
+                    reply.status.value,
+                    reply.info,
+                    now,
+                    now,
+                    reply.request_hash,
+                    request_hash,
+                )
+                for request_hash, reply in zip(request_hashes, replies)
+            ],
+        )
+
+    def record_statuses(
+        self,
+        request_hashes: Iterable[str],
+        statuses: Iterable[Union[int, CalculationStatus]],
+    ) -> None:
+        """
+        Records the last known statuses of requests, e.g. the status codes returned by
+        :meth:`utspclient.client.UTSPClient.get_statuses`
+
+        :param request_hashes: hashes of the requests
+        :type request_hashes: Iterable[str]
+        :param statuses: the statuses or status codes of the requests
+        :type statuses: Iterable[Union[int, CalculationStatus]]
+        """
+        codes = [
+            status.value if isinstance(status, CalculationStatus) else int(status)
+            for status in statuses
+        ]
+        now = time.time()
+        self._execute_many(
+            "UPDATE requests SET status = ?, updated = ? "
+            "WHERE request_hash = ? AND result_path IS NULL",
+            [
+                (code, now, request_hash)
+                for request_hash, code in zip(request_hashes, codes)
+            ],
+        )
+
+    def get_server_hashes(self, request_hashes: Iterable[str]) -> List[Optional[str]]:
+        """
+        Returns the hashes by which the server identifies the requests, which are needed
+        for checking their statuses with :meth:`utspclient.client.UTSPClient.get_statuses`
+
+        :param request_hashes: hashes of the requests
+        :type request_hashes: Iterable[str]
+        :return: the server hashes, or None for requests that were not submitted yet
+        :rtype: List[Optional[str]]
+        """
+        server_hashes = dict(
+            self._connection.execute(
+                "SELECT request_hash, server_hash FROM requests"
+            ).fetchall()
+        )
+        return [server_hashes.get(request_hash) for request_hash in request_hashes]
+
+    def record_failure(self, request_hash: str, info: str) -> None:
+        """
+        Records that the calculation of a request failed
+
+        :param request_hash: hash of the request
+        :type request_hash: str
+        :param info: the error message
+        :type info: str
+        """
+        self._execute_many(
+            "UPDATE requests SET status = ?, info = ?, updated = ?, "
+            "claimed_by = NULL, claimed_until = NULL WHERE request_hash = ?",
+            [
+                (
+                    CalculationStatus.CALCULATIONFAILED.value,
+                    info,
+                    time.time(),
+                    request_hash,
+                )
+            ],
+        )
+
+    def record_error(
+        self, request_hash: str, info: str, retry_delay: float = 0
+    ) -> None:
+        """
+        Records an error that occurred while processing a request, e.g. a connection
+        error, without marking its calculation as failed. The claim is released, so that
+        the request can be processed again after the retry delay.
+
+        :param request_hash: hash of the request
+        :type request_hash: str
+        :param info: the error message
+        :type info: str
+        :param retry_delay: time in seconds before the request can be claimed again,
+            defaults to 0
+        :type retry_delay: float, optional
+        """
+        now = time.time()
+        self._execute_many(
+            "UPDATE requests SET info = ?, updated = ?, claimed_by = NULL, "
+            "claimed_until = ? WHERE request_hash = ?",
+            [(info, now, now + retry_delay, request_hash)],
+        )
+
+    def record_result(self, request_hash: str, delivery: ResultDelivery) -> str:
+        """
+        Stores the result files of a request in the result directory and records their
+        location. The files are written to a temporary directory first, so that the
+        result directory of a request is always complete.
+
+        :param request_hash: hash of the request
+        :type request_hash: str
+        :param delivery: the delivered results
+        :type delivery: ResultDelivery
+        :raises Exception: if the name of a result file is an absolute path or points
+            outside of the result directory of the request
+        :return: the directory containing the result files
+        :rtype: str
+        """
+        filenames = {
+            filename: _get_relative_path(filename) for filename in delivery.data
+        }
+        result_path = os.path.join(self.result_directory, request_hash)
+        temp_path = f"{result_path}.{uuid.uuid4().hex}.tmp"
+        os.makedirs(temp_path)
+        try:
+            for filename, relative_path in filenames.items():
+                file_path = os.path.join(temp_path, relative_path)
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                content = delivery.data[filename]
+                if isinstance(content, SpilledFile):
+                    shutil.copyfile(content.path, file_path)
+                else:
+                    with open(file_path, "wb") as f:
+                        f.write(content)
+            if os.path.isdir(result_path):
+                # stored by another worker before
+                shutil.rmtree(temp_path)
+            else:
+                os.replace(temp_path, result_path)
+        except BaseException:
+            shutil.rmtree(temp_path, ignore_errors=True)
+            raise
+        self._execute_many(
+            "UPDATE requests SET status = ?, info = NULL, updated = ?, result_path = ?, "
+            "claimed_by = NULL, claimed_until = NULL WHERE request_hash = ?",
+            [
+                (
+                    CalculationStatus.INDATABASE.value,
+                    time.time(),
+                    result_path,
+                    request_hash,
+                )
+            ],
+        )
+        return result_path
+
+    def reset_failed(self) -> int:
+        """
+        Marks all failed requests as unfinished again, so that they are processed again
+
+        :return: the number of failed requests
+        :rtype: int
+        """
+        connection = self._connection
+        cursor = connection.execute(
+            "UPDATE requests SET status = ?, updated = ? WHERE status = ?",
+            (
+                CalculationStatus.UNKNOWN.value,
+                time.time(),
+                CalculationStatus.CALCULATIONFAILED.value,
+            ),
+        )
+        return cursor.rowcount
+
+    def run(
+        self,
+        client: "UTSPClient",
+        url: Optional[str] = None,
+        chunk_size: int = 500,
+        lease: float = 3600,
+        retry_delay: float = 600,
+    ) -> None:
+        """
+        Processes all unfinished requests of the campaign until their results are stored
+        or their calculations failed. The requests are claimed in chunks, submitted and
+        tracked by the background poller of the client. The claims are renewed while
+        waiting for the results, and the statuses seen by the poller are recorded. Can
+        be called by several workers for the same campaign at the same time.
+
+        Requests are only marked as failed if the server reports that their calculation
+        failed. If another error occurs for a request, e.g. a connection error, it is
+        recorded and the request is released, so that it is processed again by a later
+        call after the retry delay.
+
+        :param client: the client to use for sending the requests
+        :type client: UTSPClient
+        :param url: URL of the profile request endpoint, defaults to the client url
+        :type url: Optional[str], optional
+        :param chunk_size: number of requests to claim at once, defaults to 500
+        :type chunk_size: int, optional
+        :param lease: time in seconds after which claims expire if they are not renewed,
+            e.g. because the worker crashed, defaults to 3600
+        :type lease: float, optional
+        :param retry_delay: time in seconds after which requests are processed again
+            if an error occurred, defaults to 600
+        :type retry_delay: float, optional
+        """
+        while True:
+            entries = self.claim(chunk_size, lease)
+            if not entries:
+                return
+            requests = [entry.request for entry in entries]
+            request_hashes = [entry.request_hash for entry in entries]
+            try:
+                replies = client.send_requests(requests, url)
+                self.record_replies(request_hashes, replies)
+                self._wait_for_results(
+                    client, url, requests, request_hashes, replies, lease, retry_delay
+                )
+            except BaseException:
+                # let other workers process the remaining requests
+                self.release(request_hashes)
+                raise
+
+    def _wait_for_results(
+        self,
+        client: "UTSPClient",
+        url: Optional[str],
+        requests: List[str],
+        request_hashes: List[str],
+        replies: List[RestReply],
+        lease: float,
+        retry_delay: float,
+    ) -> None:
+        """Tracks submitted requests and records their results, while renewing the
+        claims and recording the statuses seen by the poller"""
+        # status changes are passed from the polling thread to this thread
+        status_updates: "queue.SimpleQueue[Tuple[str, CalculationStatus]]" = (
+            queue.SimpleQueue()
+        )
+
+        def get_status_callback(request_hash: str) -> Callable[[RestReply], None]:
+            return lambda reply: status_updates.put((request_hash, reply.status))
+
+        pending: Dict["futures.Future[ResultDelivery]", str] = {}
+        for request, request_hash, reply in zip(requests, request_hashes, replies):
+            future = client.poller.track(
+                request, reply, url, get_status_callback(request_hash)
+            )
+            pending[future] = request_hash
+        renew_time = time.time() + lease / 2
+        while pending:
+            timeout = min(max(renew_time - time.time(), 0), STATUS_UPDATE_INTERVAL)
+            done, _ = futures.wait(
+                pending, timeout, return_when=futures.FIRST_COMPLETED
+            )
+            self._record_status_updates(status_updates)
+            for future in done:
+                request_hash = pending.pop(future)
+                try:
+                    with future.result() as delivery:
+                        self.record_result(request_hash, delivery)
+                except CalculationFailedError as e:
+                    self.record_failure(request_hash, str(e))
+                except Exception as e:
+                    self.record_error(request_hash, str(e), retry_delay)
+            if pending and time.time() >= renew_time:
+                self.renew(pending.values(), lease)
+                renew_time = time.time() + lease / 2
+
+    def _record_status_updates(
+        self, status_updates: "queue.SimpleQueue[Tuple[str, CalculationStatus]]"
+    ) -> None:
+        """Writes the statuses seen by the poller to the manifest. Finished requests are
+        skipped, because their statuses are recorded together with their results."""
+        updates: Dict[str, CalculationStatus] = {}
+        while not status_updates.empty():
+            request_hash, status = status_updates.get()
+            updates[request_hash] = status
+        finished = (CalculationStatus.INDATABASE, CalculationStatus.CALCULATIONFAILED)
+        unfinished = {
+            request_hash: status
+            for request_hash, status in updates.items()
+            if status not in finished
+        }
+        if unfinished:
+            self.record_statuses(unfinished.keys(), unfinished.values())
+
+
+def _get_relative_path(filename: str) -> str:
+    """Normalizes the name of a result file and checks that it is a relative path
+    within the result directory"""
+    path = os.path.normpath(filename)
+    if (
+        os.path.isabs(path)
+        or os.path.splitdrive(path)[0]
+        or path == os.curdir
+        or path == os.pardir
+        or path.startswith(os.pardir + os.sep)
+    ):
+        raise Exception(f"Invalid result file name: {filename}")
+    return path
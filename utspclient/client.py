@@ -1,65 +1,185 @@
-import json
+import logging
+import threading
 import time
-from typing import Dict, List, Optional, Set, Union
-import zlib
+from concurrent import futures
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urljoin
 
+import numpy as np
 import requests
-from pandas import DataFrame  # type: ignore
+from requests.adapters import HTTPAdapter
+from utspclient.cache import DecodedResultCache, ResultCache, get_request_hash
 from utspclient.datastructures import (
     CalculationStatus,
     RestReply,
     ResultDelivery,
     TimeSeriesRequest,
 )
+from utspclient.decoding import (
+    decompress_result_delivery,
+    decompress_result_delivery_lazy,
+)
+from utspclient.poller import BackgroundPoller
+from utspclient.polling import PollBudget, PollingPolicy, get_providername
+from utspclient.protocol import (
+    BATCH_ENDPOINT,
+    BULK_STATUS_ENDPOINT,
+    INPUT_FILE_CHECK_ENDPOINT,
+    INPUT_FILE_UPLOAD_ENDPOINT,
+    JSON_HEADERS,
+    STATUS_BY_HASH_ENDPOINT,
+    ClientBase,
+    check_status,
+    get_status_code,
+    get_upload_headers,
+    is_complete_status_reply,
+    is_endpoint_supported,
+    parse_batch_replies,
+    parse_bulk_statuses,
+    parse_reply,
+)
 
+logger = logging.getLogger(__name__)
 
-def decompress_result_data(data: bytes) -> ResultDelivery:
-    json_data = zlib.decompress(data).decode()
-    return ResultDelivery.from_json(json_data)  # type: ignore
+#: Timeout for a single HTTP request in seconds, either as a single value or as a
+#: (connect timeout, read timeout) tuple. None means waiting indefinitely.
+Timeout = Optional[Union[float, Tuple[float, float]]]
 
+class CalculationFailedError(Exception):
+    """Raised when the server reports that the calculation of a request failed"""
 
-def send_request(
-    url: str, request: Union[str, TimeSeriesRequest], api_key: str = ""
-) -> RestReply:
+
+def decompress_result_data(
+    data: bytes,
+    max_memory: Optional[int] = None,
+    spill_directory: Optional[str] = None,
+    lazy: bool = False,
+) -> ResultDelivery:
     """
-    Sends the request to the utsp and returns the reply
+    Decompresses and parses the result data of a reply. The data is decompressed and parsed
+    incrementally to limit the memory needed.
 
-    :param url: URL of the utsp server
-    :type url: str
-    :param request: the request to send
-    :type request: Union[str, TimeSeriesRequest]
-    :param api_key: the api key to use, defaults to ""
-    :type api_key: str, optional
-    :raises Exception: if the server reported an error
-    :return: the reply from the utsp server
-    :rtype: RestReply
+    :param data: the compressed result data
+    :type data: bytes
+    :param max_memory: maximum number of bytes of result file contents to keep in memory,
+        defaults to None (no limit)
+    :type max_memory: Optional[int], optional
+    :param spill_directory: directory to write result files to that would exceed the
+        memory limit. If no memory limit is set, all result files are written to this
+        directory. Defaults to None
+    :type spill_directory: Optional[str], optional
+    :param lazy: whether to return a LazyResultDelivery that only decodes result files
+        when they are accessed, defaults to False
+    :type lazy: bool, optional
+    :raises MemoryError: if the memory limit is exceeded and no spill directory was set
+    :return: the result delivery; result files written to disk are represented by
+        SpilledFile objects unless lazy is set
+    :rtype: ResultDelivery
     """
-    if isinstance(request, TimeSeriesRequest):
-        request = request.to_json()  # type: ignore
-    response = requests.post(url, json=request, headers={"Authorization": api_key})
-    if not response.ok:
-        raise Exception(f"Received error code: {str(response)}")
-    response_dict = response.json()
-    # don't use dataclasses_json here, it has bug regarding bytes
-    reply = RestReply(**response_dict)  # type: ignore
-    return reply
+    if lazy:
+        return decompress_result_delivery_lazy(data, max_memory, spill_directory)
+    return decompress_result_delivery(data, max_memory, spill_directory)
 
 
-def get_result(reply: RestReply) -> Optional[ResultDelivery]:
+def as_completed(
+    fs: Iterable["Future[ResultDelivery]"], timeout: Optional[float] = None
+) -> Iterator["Future[ResultDelivery]"]:
+    """
+    Iterates over the futures of submitted requests in the order in which they are finished,
+    so that results can already be processed while other requests are still calculated.
+
+    :param fs: the futures returned by :meth:`UTSPClient.submit` or :meth:`UTSPClient.submit_many`
+    :type fs: Iterable[Future[ResultDelivery]]
+    :param timeout: maximum number of seconds to wait in total, defaults to None
+    :type timeout: Optional[float], optional
+    :raises TimeoutError: if not all futures are finished within the timeout
+    :return: an iterator over the finished futures
+    :rtype: Iterator[Future[ResultDelivery]]
+    """
+    return futures.as_completed(fs, timeout)
+
+
+def _completed_future(result: ResultDelivery) -> "Future[ResultDelivery]":
+    """Returns a future that is already resolved with the specified result"""
+    future: "Future[ResultDelivery]" = Future()
+    future.set_result(result)
+    return future
+
+
+def _copy_future_state(
+    source: "Future[ResultDelivery]", target: "Future[ResultDelivery]"
+) -> None:
+    """Resolves the target future with the outcome of the finished source future"""
+    if source.cancelled():
+        target.cancel()
+    elif target.set_running_or_notify_cancel():
+        exception = source.exception()
+        if exception is not None:
+            target.set_exception(exception)
+        else:
+            target.set_result(source.result())
+
+
+def count_statuses(statuses: np.ndarray) -> Dict[CalculationStatus, int]:
+    """
+    Counts how many requests have each status
+
+    :param statuses: status codes as returned by :meth:`UTSPClient.get_statuses`
+    :type statuses: np.ndarray
+    :raises ValueError: if a status code does not belong to a CalculationStatus
+    :return: the number of requests for each status
+    :rtype: Dict[CalculationStatus, int]
+    """
+    statuses = np.asarray(statuses, dtype=np.int64)
+    # the status codes are numbered consecutively from 0
+    invalid = (statuses < 0) | (statuses >= len(CalculationStatus))
+    if invalid.any():
+        raise ValueError(f"{statuses[invalid][0]} is not a valid CalculationStatus")
+    counts = np.bincount(statuses, minlength=len(CalculationStatus))
+    return {status: int(counts[status.value]) for status in CalculationStatus}
+
+
+def get_result(
+    reply: RestReply,
+    max_memory: Optional[int] = None,
+    spill_directory: Optional[str] = None,
+    lazy: bool = False,
+) -> Optional[ResultDelivery]:
     """
     Helper function for getting a time series out of a rest reply if it was delivered.
     Raises an exception when the calculation failed
 
     :param reply: the reply from the utsp server to check for a time series
     :type reply: RestReply
-    :raises Exception: if the calculation failed
+    :param max_memory: maximum number of bytes of result file contents to keep in memory,
+        defaults to None (no limit)
+    :type max_memory: Optional[int], optional
+    :param spill_directory: directory to write result files to that would exceed the
+        memory limit, defaults to None
+    :type spill_directory: Optional[str], optional
+    :param lazy: whether to return a LazyResultDelivery that only decodes result files
+        when they are accessed, defaults to False
+    :type lazy: bool, optional
+    :raises CalculationFailedError: if the calculation failed
     :return: the delivered time series, or None
     :rtype: Optional[TimeSeriesDelivery]
     """
     status = reply.status
     # parse and return the time series if it was delivered
     if status == CalculationStatus.INDATABASE:
-        return decompress_result_data(reply.result_delivery)  # type: ignore
+        return decompress_result_data(
+            reply.result_delivery, max_memory, spill_directory, lazy  # type: ignore
+        )
     # if the time series is still in calculation, return None
     if status in [
         CalculationStatus.CALCULATIONSTARTED,
@@ -68,10 +188,781 @@ def get_result(reply: RestReply) -> Optional[ResultDelivery]:
         return None
     # the calculation failed: raise an error
     if status == CalculationStatus.CALCULATIONFAILED:
-        raise Exception("Calculation failed: " + (reply.info or ""))
+        raise CalculationFailedError("Calculation failed: " + (reply.info or ""))
     raise Exception("Unknown status")
 
 
+class UTSPClient(ClientBase):
+    """
+    Client for a UTSP server that keeps a pool of keep-alive connections, so that
+    consecutive requests, e.g. status polls, do not have to open a new connection
+    each time.
+
+    Endpoint URLs passed to the methods are resolved relative to the url of the client,
+    so they can either be absolute or relative to the client url, e.g. "requeststatus".
+    """
+
+    def __init__(
+        self,
+        url: str = "",
+        api_key: str = "",
+        pool_size: int = 10,
+        timeout: Timeout = None,
+        poll_by_hash: bool = True,
+        polling_policy: Optional[PollingPolicy] = None,
+        max_polls_per_second: float = 10,
+        binary_results: bool = True,
+        max_result_memory: Optional[int] = None,
+        spill_directory: Optional[str] = None,
+        lazy_results: bool = False,
+        cache: Optional[ResultCache] = None,
+        memory_cache: Optional[DecodedResultCache] = None,
+        request_compression: Optional[str] = None,
+        compression_threshold: int = 16384,
+        upload_input_files: bool = False,
+        batch_size: int = 500,
+    ) -> None:
+        """
+        Creates a new client
+
+        :param url: URL of the UTSP server or of its profile request endpoint, defaults to ""
+        :type url: str, optional
+        :param api_key: the api key to use, defaults to ""
+        :type api_key: str, optional
+        :param pool_size: maximum number of connections that are kept open, defaults to 10
+        :type pool_size: int, optional
+        :param timeout: default timeout for each HTTP request, defaults to None
+        :type timeout: Timeout, optional
+        :param poll_by_hash: whether to poll the status of submitted requests by their hash
+            instead of sending the full request again, defaults to True
+        :type poll_by_hash: bool, optional
+        :param polling_policy: policy that determines the delays between status checks,
+            defaults to a new PollingPolicy with default parameters
+        :type polling_policy: Optional[PollingPolicy], optional
+        :param max_polls_per_second: budget for the total number of status checks per
+            second of the background poller, of pipelines and of status requests for
+            many requests at once, defaults to 10
+        :type max_polls_per_second: float, optional
+        :param binary_results: whether to ask the server to send result data in a binary
+            format instead of json lists of integers, defaults to True
+        :type binary_results: bool, optional
+        :param max_result_memory: maximum number of bytes of result file contents to keep in
+            memory when decoding a delivery, defaults to None (no limit)
+        :type max_result_memory: Optional[int], optional
+        :param spill_directory: directory to write result files to that would exceed the
+            memory limit. These files are not deleted automatically, see
+            ResultDelivery.remove_spilled_files. Defaults to None
+        :type spill_directory: Optional[str], optional
+        :param lazy_results: whether to return LazyResultDelivery objects that only decode
+            result files when they are accessed, defaults to False
+        :type lazy_results: bool, optional
+        :param cache: local cache for delivered results. Requests whose results are in the
+            cache are not sent to the server at all. Defaults to None
+        :type cache: Optional[ResultCache], optional
+        :param memory_cache: in-memory cache for decoded results, defaults to None
+        :type memory_cache: Optional[DecodedResultCache], optional
+        :param request_compression: content encoding for compressing large request bodies,
+            either "gzip" or "deflate", defaults to None (no compression)
+        :type request_compression: Optional[str], optional
+        :param compression_threshold: minimum size of a request body in bytes to be
+            compressed, defaults to 16384
+        :type compression_threshold: int, optional
+        :param upload_input_files: whether to upload the input files of requests to the input
+            file store of the server, so that requests only contain references to them.
+            Each file is only uploaded once. Input files are sent inline if the server
+            does not provide an input file store. Defaults to False
+        :type upload_input_files: bool, optional
+        :param batch_size: maximum number of requests that are sent together when submitting
+            many requests at once, defaults to 500
+        :type batch_size: int, optional
+        """
+        super().__init__(
+            url,
+            api_key,
+            poll_by_hash,
+            polling_policy,
+            binary_results,
+            max_result_memory,
+            spill_directory,
+            lazy_results,
+            cache,
+            memory_cache,
+            request_compression,
+            compression_threshold,
+            upload_input_files,
+            batch_size,
+        )
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_polls_per_second = max_polls_per_second
+        self.poll_budget = PollBudget(max_polls_per_second)
+        # prevents uploading the same file concurrently
+        self._input_file_lock = threading.Lock()
+        self._poller: Optional[BackgroundPoller] = None
+        self._poller_lock = threading.Lock()
+        # futures of the requests that are currently processed, for coalescing
+        # concurrent calls for the same request
+        self._in_flight: Dict[Tuple[str, str], "Future[ResultDelivery]"] = {}
+        self._in_flight_lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self._get_session_headers())
+
+    def __enter__(self) -> "UTSPClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops the background poller and closes all pooled connections"""
+        if self._poller is not None:
+            self._poller.stop()
+        self.session.close()
+
+    @property
+    def poller(self) -> BackgroundPoller:
+        """The background poller of this client, which is created on first use"""
+        with self._poller_lock:
+            if self._poller is None:
+                self._poller = BackgroundPoller(self)
+            return self._poller
+
+    def send_request(
+        self,
+        request: Union[str, TimeSeriesRequest],
+        url: Optional[str] = None,
+        timeout: Timeout = None,
+    ) -> RestReply:
+        """
+        Sends the request to the utsp and returns the reply
+
+        :param request: the request to send
+        :type request: Union[str, TimeSeriesRequest]
+        :param url: URL of the endpoint to send the request to, defaults to the client url
+        :type url: Optional[str], optional
+        :param timeout: timeout for this request, defaults to the client timeout
+        :type timeout: Timeout, optional
+        :raises Exception: if the server reported an error
+        :return: the reply from the utsp server
+        :rtype: RestReply
+        """
+        url = self.resolve_url(url)
+        timeout = timeout if timeout is not None else self.timeout
+        request = self._prepare_request(request, url, timeout)
+        response = self._post_json(url, request, timeout)
+        check_status(response.status_code)
+        return parse_reply(response.headers, response.content)
+
+    def send_requests(
+        self,
+        requests: Iterable[Union[str, TimeSeriesRequest]],
+        url: Optional[str] = None,
+        timeout: Timeout = None,
+    ) -> List[RestReply]:
+        """
+        Sends multiple requests to the utsp and returns the replies. The requests are sent
+        in batches of at most batch_size requests. If the server does not support batches,
+        the requests are sent individually using concurrent connections.
+
+        :param requests: the requests to send
+        :type requests: Iterable[Union[str, TimeSeriesRequest]]
+        :param url: URL of the profile request endpoint, defaults to the client url
+        :type url: Optional[str], optional
+        :param timeout: timeout for each HTTP request, defaults to the client timeout
+        :type timeout: Timeout, optional
+        :raises Exception: if the server reported an error
+        :return: the replies from the utsp server, in the same order as the requests
+        :rtype: List[RestReply]
+        """
+        requests = list(requests)
+        url = self.resolve_url(url)
+        timeout = timeout if timeout is not None else self.timeout
+        replies: List[RestReply] = []
+        while self.batch_supported is not False and len(replies) < len(requests):
+            batch = [
+                self._prepare_request(request, url, timeout)
+                for request in requests[len(replies) : len(replies) + self.batch_size]
+            ]
+            response = self._post_json(urljoin(url, BATCH_ENDPOINT), batch, timeout)
+            self.batch_supported = is_endpoint_supported(response.status_code)
+            if not self.batch_supported:
+                break
+            replies.extend(parse_batch_replies(response.content, len(batch)))
+        remaining = requests[len(replies) :]
+        if remaining:
+            with ThreadPoolExecutor(self.pool_size) as executor:
+                replies.extend(
+                    executor.map(
+                        lambda request: self.send_request(request, url, timeout),
+                        remaining,
+                    )
+                )
+        return replies
+
+    def _prepare_request(
+        self, request: Union[str, TimeSeriesRequest], url: str, timeout: Timeout
+    ) -> str:
+        """Returns the json representation of a request for sending it to the
+        server. Input files are uploaded to the input file store of the server if
+        possible and replaced by references."""
+        request, referencing_request, contents = self._reference_input_files(request)
+        if referencing_request is not None and self.store_input_files(
+            contents, url, timeout
+        ):
+            return referencing_request
+        return request
+
+    def _post_json(self, url: str, value: Any, timeout: Timeout) -> requests.Response:
+        """Posts a value as json, compressing the body if it is large enough"""
+        body, compressed_body = self._encode_json(value)
+        if compressed_body is not None:
+            response = self.session.post(
+                url,
+                data=compressed_body,
+                headers=self._get_compressed_json_headers(),
+                timeout=timeout,
+            )
+            if not self._retry_uncompressed(response.status_code):
+                return response
+        response = self.session.post(
+            url, data=body, headers=JSON_HEADERS, timeout=timeout
+        )
+        if compressed_body is not None:
+            self._record_uncompressed_retry(response.status_code)
+        return response
+
+    def get_statuses(
+        self,
+        request_hashes: Iterable[str],
+        url: Optional[str] = None,
+        timeout: Timeout = None,
+        chunk_size: int = 10000,
+    ) -> np.ndarray:
+        """
+        Requests the statuses of many requests at once. If the server does not support
+        bulk status requests, the status of each request is requested individually by
+        its hash using concurrent connections, within the poll budget of the client.
+
+        The server identifies requests by the hashes returned in RestReply.request_hash.
+        Requests that were never submitted have the status UNKNOWN.
+
+        :param request_hashes: the hashes of the requests
+        :type request_hashes: Iterable[str]
+        :param url: URL of the profile request endpoint, defaults to the client url
+        :type url: Optional[str], optional
+        :param timeout: timeout for each HTTP request, defaults to the client timeout
+        :type timeout: Timeout, optional
+        :param chunk_size: maximum number of hashes sent in one HTTP request, defaults to 10000
+        :type chunk_size: int, optional
+        :raises Exception: if the server reported an error or supports neither bulk status
+            requests nor status requests by hash
+        :return: the status codes of the requests as int8 array, in the same order as the
+            hashes. Use :func:`count_statuses` to count them.
+        :rtype: np.ndarray
+        """
+        request_hashes = list(request_hashes)
+        url = self.resolve_url(url)
+        timeout = timeout if timeout is not None else self.timeout
+        statuses = np.empty(len(request_hashes), dtype=np.int8)
+        done = 0
+        while self.bulk_status_supported is not False and done < len(request_hashes):
+            chunk = request_hashes[done : done + chunk_size]
+            response = self._post_json(
+                urljoin(url, BULK_STATUS_ENDPOINT), chunk, timeout
+            )
+            self.bulk_status_supported = is_endpoint_supported(response.status_code)
+            if not self.bulk_status_supported:
+                break
+            statuses[done : done + len(chunk)] = parse_bulk_statuses(
+                response.headers, response.content, len(chunk)
+            )
+            done += len(chunk)
+        if done < len(request_hashes):
+
+            def get_status(request_hash: str) -> int:
+                self.poll_budget.wait()
+                return get_status_code(
+                    self.send_status_request(request_hash, url, timeout)
+                )
+
+            with ThreadPoolExecutor(self.pool_size) as executor:
+                statuses[done:] = list(executor.map(get_status, request_hashes[done:]))
+        return statuses
+
+    def store_input_files(
+        self,
+        contents: Dict[str, bytes],
+        url: Optional[str] = None,
+        timeout: Timeout = None,
+    ) -> bool:
+        """
+        Uploads input files to the input file store of the server. Files that are already
+        stored on the server are not uploaded again.
+
+        :param contents: the file contents by sha256 hash
+        :type contents: Dict[str, bytes]
+        :param url: URL the requests using the files are sent to, defaults to the client url
+        :type url: Optional[str], optional
+        :param timeout: timeout for each HTTP request, defaults to the client timeout
+        :type timeout: Timeout, optional
+        :raises Exception: if the server reported an error
+        :return: True if all files are stored on the server, or False if the server does not
+            provide an input file store
+        :rtype: bool
+        """
+        url = self.resolve_url(url)
+        timeout = timeout if timeout is not None else self.timeout
+        if not self._get_unstored_input_files(contents, url):
+            return True
+        with self._input_file_lock:
+            return self._store_input_files(contents, url, timeout)
+
+    def _store_input_files(
+        self, contents: Dict[str, bytes], url: str, timeout: Timeout
+    ) -> bool:
+        # must be called while holding the input file lock
+        unchecked = self._get_unstored_input_files(contents, url)
+        if not unchecked:
+            return True
+        response = self.session.post(
+            urljoin(url, INPUT_FILE_CHECK_ENDPOINT), json=unchecked, timeout=timeout
+        )
+        self.input_file_store_supported = is_endpoint_supported(response.status_code)
+        if not self.input_file_store_supported:
+            return False
+        for content_hash in response.json():
+            response = self.session.post(
+                urljoin(url, INPUT_FILE_UPLOAD_ENDPOINT),
+                data=contents[content_hash],
+                headers=get_upload_headers(content_hash),
+                timeout=timeout,
+            )
+            check_status(response.status_code)
+        self._record_stored_input_files(url, unchecked)
+        return True
+
+    def send_status_request(
+        self, request_hash: str, url: Optional[str] = None, timeout: Timeout = None
+    ) -> Optional[RestReply]:
+        """
+        Requests the status of a previously submitted request using only its hash, which
+        avoids uploading the full request again. If the calculation is finished, the reply
+        contains the result data just like the reply to the full request.
+
+        :param request_hash: the request hash returned by the server on submission
+        :type request_hash: str
+        :param url: URL the request was submitted to, defaults to the client url
+        :type url: Optional[str], optional
+        :param timeout: timeout for this request, defaults to the client timeout
+        :type timeout: Timeout, optional
+        :raises Exception: if the server reported an error
+        :return: the reply from the utsp server, or None if the server does not support
+            status requests by hash
+        :rtype: Optional[RestReply]
+        """
+        response = self.session.post(
+            urljoin(self.resolve_url(url), STATUS_BY_HASH_ENDPOINT),
+            json=request_hash,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+        self.status_by_hash_supported = is_endpoint_supported(response.status_code)
+        if not self.status_by_hash_supported:
+            return None
+        return parse_reply(response.headers, response.content)
+
+    def poll(
+        self,
+        request: Union[str, TimeSeriesRequest],
+        reply: RestReply,
+        url: Optional[str] = None,
+    ) -> RestReply:
+        """
+        Checks the status of a submitted request. If possible, only the request hash from the
+        last reply is sent. Otherwise, if the server does not know the hash anymore, or if
+        it reports the request as finished without including the results, the full request
+        is sent again.
+
+        :param request: the submitted request
+        :type request: Union[str, TimeSeriesRequest]
+        :param reply: the last reply received for this request
+        :type reply: RestReply
+        :param url: URL the request was submitted to, defaults to the client url
+        :type url: Optional[str], optional
+        :return: the current reply from the utsp server
+        :rtype: RestReply
+        """
+        if self._can_poll_by_hash(reply):
+            status_reply = self.send_status_request(reply.request_hash, url)
+            if status_reply is not None and is_complete_status_reply(status_reply):
+                return status_reply
+        return self.send_request(request, url)
+
+    def get_result(
+        self,
+        reply: RestReply,
+        request: Optional[Union[str, TimeSeriesRequest]] = None,
+    ) -> Optional[ResultDelivery]:
+        """
+        Gets the time series out of a rest reply if it was delivered.
+        See :func:`get_result`.
+
+        :param reply: the reply from the utsp server to check for a time series
+        :type reply: RestReply
+        :param request: the request the reply belongs to. If specified, delivered results
+            are added to the cache of the client. Defaults to None
+        :type request: Optional[Union[str, TimeSeriesRequest]], optional
+        """
+        if (
+            request is None
+            or reply.status != CalculationStatus.INDATABASE
+            or not reply.result_delivery
+        ):
+            return get_result(
+                reply, self.max_result_memory, self.spill_directory, self.lazy_results
+            )
+        result = get_result(
+            reply, self.max_result_memory, self.spill_directory, self.lazy_results
+        )
+        # only cache deliveries that could be decoded
+        request_hash = get_request_hash(request)
+        if self.cache is not None:
+            self.cache.put(request_hash, reply.result_delivery)
+        if self.memory_cache is not None and result is not None:
+            self.memory_cache.put(request_hash, result)
+        return result
+
+    def get_cached_result(
+        self, request: Union[str, TimeSeriesRequest]
+    ) -> Optional[ResultDelivery]:
+        """
+        Returns the result of a request from the cache of the client
+
+        :param request: the request
+        :type request: Union[str, TimeSeriesRequest]
+        :return: the cached result from the memory cache or the persistent cache, or None if
+            the result is not cached
+        :rtype: Optional[ResultDelivery]
+        """
+        if self.cache is None and self.memory_cache is None:
+            return None
+        request_hash = get_request_hash(request)
+        if self.memory_cache is not None:
+            result = self.memory_cache.get(request_hash)
+            if result is not None:
+                return result
+        if self.cache is None:
+            return None
+        data = self.cache.get(request_hash)
+        if data is None:
+            return None
+        result = decompress_result_data(
+            data, self.max_result_memory, self.spill_directory, self.lazy_results
+        )
+        if self.memory_cache is not None:
+            self.memory_cache.put(request_hash, result)
+        return result
+
+    def _join_in_flight(
+        self, request: Union[str, TimeSeriesRequest], url: Optional[str] = None
+    ) -> Tuple["Future[ResultDelivery]", bool]:
+        """
+        Registers a request as in flight, or joins the identical request that is already
+        in flight. Only the caller that registered the request has to process it and
+        resolve the returned future, while all other callers only wait for it.
+
+        :param request: the request
+        :type request: Union[str, TimeSeriesRequest]
+        :param url: URL of the profile request endpoint, defaults to the client url
+        :type url: Optional[str], optional
+        :return: a future for the result of the request, and whether the caller has to
+            process the request
+        :rtype: Tuple[Future[ResultDelivery], bool]
+        """
+        key = (self.resolve_url(url), get_request_hash(request))
+        future: "Future[ResultDelivery]" = Future()
+        with self._in_flight_lock:
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                self._in_flight[key] = future
+        if in_flight is not None:
+            # use a separate future, so that cancelling it does not affect other callers
+            in_flight.add_done_callback(lambda f: _copy_future_state(f, future))
+            return future, False
+
+        def remove(_) -> None:
+            with self._in_flight_lock:
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+
+        future.add_done_callback(remove)
+        return future, True
+
+    def submit(
+        self, request: Union[str, TimeSeriesRequest], url: Optional[str] = None
+    ) -> "Future[ResultDelivery]":
+        """
+        Sends a request to the UTSP and returns immediately. The status of the request is then
+        checked by the background poller of the client. If the same request is already
+        in flight, it is not sent again, but the future waits for the pending request.
+
+        :param request: the request to send
+        :type request: Union[str, TimeSeriesRequest]
+        :param url: URL of the profile request endpoint, defaults to the client url
+        :type url: Optional[str], optional
+        :return: a future for the result of the request
+        :rtype: Future[ResultDelivery]
+        """
+        cached_result = self.get_cached_result(request)
+        if cached_result is not None:
+            return _completed_future(cached_result)
+        future, is_new = self._join_in_flight(request, url)
+        if not is_new:
+            return future
+        if isinstance(request, TimeSeriesRequest):
+            request = request.to_json()  # type: ignore
+        try:
+            reply = self.send_request(request, url)
+            tracked = self.poller.track(request, reply, url)
+        except BaseException as e:
+            future.set_running_or_notify_cancel()
+            future.set_exception(e)
+            raise
+        tracked.add_done_callback(lambda f: _copy_future_state(f, future))
+        return future
+
+    def submit_many(
+        self,
+        requests: Iterable[Union[str, TimeSeriesRequest]],
+        url: Optional[str] = None,
+    ) -> List["Future[ResultDelivery]"]:
+        """
+        Sends multiple requests to the UTSP, using batches if the server supports them.
+        See :meth:`submit`.
+
+        :param requests: the requests to send
+        :type requests: Iterable[Union[str, TimeSeriesRequest]]
+        :param url: URL of the profile request endpoint, defaults to the client url
+        :type url: Optional[str], optional
+        :return: the futures for the results of the requests, in the same order as the requests
+        :rtype: List[Future[ResultDelivery]]
+        """
+        result_futures: List["Future[ResultDelivery]"] = []
+        # requests that have to be sent, with the futures for their results
+        new_requests: List[str] = []
+        new_futures: List["Future[ResultDelivery]"] = []
+        for request in requests:
+            cached_result = self.get_cached_result(request)
+            if cached_result is not None:
+                result_futures.append(_completed_future(cached_result))
+                continue
+            future, is_new = self._join_in_flight(request, url)
+            result_futures.append(future)
+            if is_new:
+                if isinstance(request, TimeSeriesRequest):
+                    request = request.to_json()  # type: ignore
+                new_requests.append(request)  # type: ignore
+                new_futures.append(future)
+        try:
+            replies = self.send_requests(new_requests, url)
+        except BaseException as e:
+            for future in new_futures:
+                future.set_running_or_notify_cancel()
+                future.set_exception(e)
+            raise
+        for request, reply, future in zip(new_requests, replies, new_futures):
+            tracked = self.poller.track(request, reply, url)
+            tracked.add_done_callback(
+                lambda f, future=future: _copy_future_state(f, future)  # type: ignore
+            )
+        return result_futures
+
+    def request_time_series_and_wait_for_delivery(
+        self,
+        request: Union[str, TimeSeriesRequest],
+        url: Optional[str] = None,
+    ) -> ResultDelivery:
+        """
+        Requests a single time series from the UTSP server and waits until it was delivered
+
+        :param request: The request object defining the requested time series
+        :type request: Union[str, TimeSeriesRequest]
+        :param url: URL of the profile request endpoint, defaults to the client url
+        :type url: Optional[str], optional
+        :return: The requested result data
+        :rtype: ResultDelivery
+        """
+        cached_result = self.get_cached_result(request)
+        if cached_result is not None:
+            return cached_result
+        # if the same request is already in flight, only wait for its result
+        future, is_new = self._join_in_flight(request, url)
+        if not is_new:
+            return future.result()
+        try:
+            result = self._wait_for_delivery(request, url)
+        except BaseException as e:
+            future.set_running_or_notify_cancel()
+            future.set_exception(e)
+            raise
+        future.set_running_or_notify_cancel()
+        future.set_result(result)
+        return result
+
+    def _wait_for_delivery(
+        self, request: Union[str, TimeSeriesRequest], url: Optional[str] = None
+    ) -> ResultDelivery:
+        """Sends a request and polls its status until the results are delivered"""
+        providername = get_providername(request)
+        if isinstance(request, TimeSeriesRequest):
+            request = request.to_json()  # type: ignore
+        # submit the request once, then only poll its status
+        start_time = time.time()
+        reply = self.send_request(request, url)
+        wait_count = 0
+        while reply.status not in [
+            CalculationStatus.INDATABASE,
+            CalculationStatus.CALCULATIONFAILED,
+        ]:
+            time.sleep(self.polling_policy.get_delay(providername, wait_count))
+            wait_count += 1
+            logger.debug(
+                "Waiting for request %s: status check %d",
+                reply.request_hash,
+                wait_count,
+            )
+            reply = self.poll(request, reply, url)
+        if wait_count > 0 and reply.status == CalculationStatus.INDATABASE:
+            # learn how long the calculation took for polling future requests
+            self.polling_policy.record_duration(providername, time.time() - start_time)
+        ts = self.get_result(reply, request)
+        assert ts is not None, "No time series was delivered"
+        logger.debug("Request %s finished", reply.request_hash)
+        return ts
+
+
+# shared clients used by the module-level functions, one for each api key
+_default_clients: Dict[str, UTSPClient] = {}
+_default_clients_lock = threading.Lock()
+
+
+def get_default_client(api_key: str = "") -> UTSPClient:
+    """
+    Returns the shared client that is used by the module-level functions for the
+    specified api key, so that these functions also reuse their connections.
+
+    :param api_key: the api key to use, defaults to ""
+    :type api_key: str, optional
+    :return: the shared client
+    :rtype: UTSPClient
+    """
+    with _default_clients_lock:
+        client = _default_clients.get(api_key)
+        if client is None:
+            client = UTSPClient(api_key=api_key)
+            _default_clients[api_key] = client
+        return client
+
+
+def send_request(
+    url: str, request: Union[str, TimeSeriesRequest], api_key: str = ""
+) -> RestReply:
+    """
+    Sends the request to the utsp and returns the reply
+
+    :param url: URL of the utsp server
+    :type url: str
+    :param request: the request to send
+    :type request: Union[str, TimeSeriesRequest]
+    :param api_key: the api key to use, defaults to ""
+    :type api_key: str, optional
+    :raises Exception: if the server reported an error
+    :return: the reply from the utsp server
+    :rtype: RestReply
+    """
+    return get_default_client(api_key).send_request(request, url)
+
+
+def submit(
+    url: str, request: Union[str, TimeSeriesRequest], api_key: str = ""
+) -> "Future[ResultDelivery]":
+    """
+    Sends the request to the utsp and returns a future for its result without waiting
+    for the calculation. See :meth:`UTSPClient.submit`.
+
+    :param url: URL of the utsp server
+    :type url: str
+    :param request: the request to send
+    :type request: Union[str, TimeSeriesRequest]
+    :param api_key: the api key to use, defaults to ""
+    :type api_key: str, optional
+    :return: a future for the result of the request
+    :rtype: Future[ResultDelivery]
+    """
+    return get_default_client(api_key).submit(request, url)
+
+
+def send_requests(
+    url: str, requests: Iterable[Union[str, TimeSeriesRequest]], api_key: str = ""
+) -> List[RestReply]:
+    """
+    Sends multiple requests to the utsp, in batches if the server supports them, and
+    returns the replies. See :meth:`UTSPClient.send_requests`.
+
+    :param url: URL of the utsp server
+    :type url: str
+    :param requests: the requests to send
+    :type requests: Iterable[Union[str, TimeSeriesRequest]]
+    :param api_key: the api key to use, defaults to ""
+    :type api_key: str, optional
+    :raises Exception: if the server reported an error
+    :return: the replies from the utsp server, in the same order as the requests
+    :rtype: List[RestReply]
+    """
+    return get_default_client(api_key).send_requests(requests, url)
+
+
+def get_statuses(
+    url: str, request_hashes: Iterable[str], api_key: str = ""
+) -> np.ndarray:
+    """
+    Requests the statuses of many requests at once. See :meth:`UTSPClient.get_statuses`.
+
+    :param url: URL of the utsp server
+    :type url: str
+    :param request_hashes: the hashes of the requests
+    :type request_hashes: Iterable[str]
+    :param api_key: the api key to use, defaults to ""
+    :type api_key: str, optional
+    :raises Exception: if the server reported an error
+    :return: the status codes of the requests as int8 array, in the same order as the hashes
+    :rtype: np.ndarray
+    """
+    return get_default_client(api_key).get_statuses(request_hashes, url)
+
+
+def submit_many(
+    url: str, requests: Iterable[Union[str, TimeSeriesRequest]], api_key: str = ""
+) -> List["Future[ResultDelivery]"]:
+    """
+    Sends multiple requests to the utsp and returns futures for their results without
+    waiting for the calculations. Use :func:`as_completed` to process the results in
+    the order in which they are finished.
+
+    :param url: URL of the utsp server
+    :type url: str
+    :param requests: the requests to send
+    :type requests: Iterable[Union[str, TimeSeriesRequest]]
+    :param api_key: the api key to use, defaults to ""
+    :type api_key: str, optional
+    :return: the futures for the results of the requests, in the same order as the requests
+    :rtype: List[Future[ResultDelivery]]
+    """
+    return get_default_client(api_key).submit_many(requests, url)
+
+
 def request_time_series_and_wait_for_delivery(
     url: str,
     request: Union[str, TimeSeriesRequest],
@@ -89,21 +980,6 @@ def request_time_series_and_wait_for_delivery(
     :return: The requested result data
     :rtype: ResultDelivery
     """
-    if isinstance(request, TimeSeriesRequest):
-        request = request.to_json()  # type: ignore
-    status = CalculationStatus.UNKNOWN
-    wait_count = 0
-    while status not in [
-        CalculationStatus.INDATABASE,
-        CalculationStatus.CALCULATIONFAILED,
-    ]:
-        reply = send_request(url, request, api_key)
-        status = reply.status
-        wait_count += 1
-        if status != CalculationStatus.INDATABASE:
-            time.sleep(1)
-            print("waiting for " + str(wait_count))
-    ts = get_result(reply)
-    assert ts is not None, "No time series was delivered"
-    print("finished")
-    return ts
+    return get_default_client(api_key).request_time_series_and_wait_for_delivery(
+        request, url
+    )
@@ -1,9 +1,12 @@
+import base64
 import hashlib
+import json
+import os
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, Union
 
-from dataclasses_json import dataclass_json  # type: ignore
+from dataclasses_json import config, dataclass_json  # type: ignore
 
 
 class CalculationStatus(Enum):
@@ -35,6 +38,10 @@ class TimeSeriesRequest:
     # dataclasses_json the 'bytes' type cannot be used here, so the file contents are
     # stored base64-encoded.
     input_files: Dict[str, str] = field(default_factory=dict)
+    # Additional input files that were uploaded to the input file store of the server
+    # beforehand, as file names mapped to the sha256 hashes of the file contents. Only
+    # included in the json representation if not empty.
+    input_file_references: Dict[str, str] = field(default_factory=dict, metadata=config(exclude=lambda value: not value))  # type: ignore
 
     def __post_init__(self):
         if not isinstance(self.required_result_files, dict):
@@ -45,17 +52,172 @@ class TimeSeriesRequest:
             raise RuntimeError(
                 "Invalid TimeSeriesRequest: the input_files attribute must be a dict"
             )
+        if not isinstance(self.input_file_references, dict):
+            raise RuntimeError(
+                "Invalid TimeSeriesRequest: the input_file_references attribute must be a dict"
+            )
+        # snapshot of the hashed fields and the hash object for all fields except the guid
+        self._hash_state = None
+
+    def __getstate__(self):
+        # hash objects cannot be pickled
+        state = self.__dict__.copy()
+        state["_hash_state"] = None
+        return state
+
+    def _get_hash_snapshot(self) -> tuple:
+        # comparing the snapshot is much cheaper than serializing the request, because
+        # unchanged values are compared by identity
+        return (
+            self.simulation_config,
+            self.providername,
+            tuple(self.required_result_files.items()),
+            tuple(self.input_files.items()),
+            tuple(self.input_file_references.items()),
+        )
+
+    def _get_base_hash(self) -> Any:
+        """Returns a sha256 hash object of the canonical representation of all fields
+        except the guid, which is reused as long as these fields do not change"""
+        snapshot = self._get_hash_snapshot()
+        state = getattr(self, "_hash_state", None)
+        if state is not None and state[0] == snapshot:
+            return state[1]
+        required_result_files = {
+            name: requirement.value if isinstance(requirement, Enum) else requirement
+            for name, requirement in self.required_result_files.items()
+        }
+        base_hash = _hash_canonical_fields(
+            self.simulation_config,
+            self.providername,
+            required_result_files,
+            self.input_files,
+            self.input_file_references,
+        )
+        self._hash_state = (snapshot, base_hash)
+        return base_hash
 
     def get_hash(self) -> str:
         # hash the json representation of the object
         data = self.to_json().encode("utf-8")  # type: ignore
         return hashlib.sha256(data).hexdigest()
 
+    def get_cache_key(self) -> str:
+        """
+        Returns the hash of the canonical json representation of the request, which is
+        used as key for caching results. Unlike get_hash, it does not depend on the order
+        of the entries of required_result_files and input_files. It is cached until one
+        of the fields of the request is changed.
+
+        This key is only used locally and is unrelated to the request hash returned by
+        the server.
+
+        :return: the cache key of the request
+        :rtype: str
+        """
+        return self.get_cache_key_with_guid(self.guid)
+
+    def get_cache_key_with_guid(self, guid: str) -> str:
+        """
+        Returns the cache key a copy of this request with a different guid would have.
+        This is cheap, because only the guid has to be hashed.
+
+        :param guid: the guid of the request variant
+        :type guid: str
+        :return: the cache key of the request variant
+        :rtype: str
+        """
+        request_hash = self._get_base_hash().copy()
+        request_hash.update(_canonical_guid(guid))
+        return request_hash.hexdigest()
+
+
+def _hash_canonical_fields(
+    simulation_config: str,
+    providername: str,
+    required_result_files: Dict[str, Optional[int]],
+    input_files: Dict[str, str],
+    input_file_references: Dict[str, str],
+) -> Any:
+    """Returns a sha256 hash object of the canonical json representation of a request
+    up to the value of the guid"""
+    # canonical json with sorted keys; the guid is always the last field, so that
+    # requests differing only in their guid share the same prefix
+    prefix = (
+        '{"simulation_config": '
+        + json.dumps(simulation_config)
+        + ', "providername": '
+        + json.dumps(providername)
+        + ', "required_result_files": '
+        + json.dumps(required_result_files, sort_keys=True)
+        + ', "input_files": '
+        + json.dumps(input_files, sort_keys=True)
+    )
+    if input_file_references:
+        prefix += ', "input_file_references": ' + json.dumps(
+            input_file_references, sort_keys=True
+        )
+    prefix += ', "guid": '
+    return hashlib.sha256(prefix.encode("utf-8"))
+
+
+def _canonical_guid(guid: str) -> bytes:
+    """Returns the rest of the canonical json representation of a request"""
+    return (json.dumps(guid) + "}").encode("utf-8")
+
+
+def get_cache_key_from_json(request: str) -> str:
+    """
+    Returns the cache key of a request in json format, which is the same as that of the
+    deserialized request, see TimeSeriesRequest.get_cache_key. The json is only parsed
+    and not converted into a TimeSeriesRequest, which is much faster.
+
+    :param request: the request as json string
+    :type request: str
+    :return: the cache key of the request
+    :rtype: str
+    """
+    fields = json.loads(request)
+    request_hash = _hash_canonical_fields(
+        fields["simulation_config"],
+        fields["providername"],
+        fields.get("required_result_files") or {},
+        fields.get("input_files") or {},
+        fields.get("input_file_references") or {},
+    )
+    request_hash.update(_canonical_guid(fields.get("guid", "")))
+    return request_hash.hexdigest()
+
+
+@dataclass
+class SpilledFile:
+    """A delivered result file that was written to disk instead of being kept in memory.
+    The file belongs to whoever received the delivery and is not deleted automatically,
+    see ResultDelivery.remove_spilled_files."""
+
+    path: str
+    size: int
+
+    def read(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def decode(self, encoding: str = "utf-8") -> str:
+        return self.read().decode(encoding)
+
+    def remove(self) -> None:
+        """Deletes the file, if it still exists"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
 
 @dataclass_json
 @dataclass
 class ResultDelivery:
     original_request: TimeSeriesRequest
+    # Result files as bytes, or as SpilledFile if they were written to disk while decoding
     data: Dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self):
@@ -63,6 +225,109 @@ class ResultDelivery:
             if isinstance(value, List):
                 # bytes are stored as a list in json; convert it back
                 self.data[key] = bytes(value)
+            elif isinstance(value, str):
+                # bytes were transferred base64-encoded
+                self.data[key] = base64.b64decode(value)
+
+    def __enter__(self) -> "ResultDelivery":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.remove_spilled_files()
+
+    @property
+    def spilled_files(self) -> List[SpilledFile]:
+        """The result files of this delivery that were written to disk"""
+        return [value for value in self.data.values() if isinstance(value, SpilledFile)]
+
+    def remove_spilled_files(self) -> None:
+        """Deletes the result files of this delivery that were written to disk. The
+        files are not accessible anymore afterwards. This is also done when the delivery
+        is used as context manager."""
+        for spilled_file in self.spilled_files:
+            spilled_file.remove()
+
+
+class LazyResultData(Mapping[str, bytes]):
+    """
+    Mapping of result file names to file contents that only decodes a file when it is
+    accessed for the first time. Names and sizes of the files are available without
+    decoding them.
+
+    Each entry is either already decoded bytes, or an object with a 'size' attribute and
+    a 'read()' method returning the decoded bytes, e.g. a SpilledFile. Entries that read
+    from an encoded document in memory provide it as 'document' attribute.
+    """
+
+    def __init__(self, entries: Dict[str, Any]) -> None:
+        self._entries = entries
+        self._decoded: Dict[str, bytes] = {}
+
+    def __getitem__(self, name: str) -> bytes:
+        if name in self._decoded:
+            return self._decoded[name]
+        entry = self._entries[name]
+        if not isinstance(entry, bytes):
+            entry = entry.read()
+            self._decoded[name] = entry
+        return entry
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def size(self, name: str) -> int:
+        """Returns the size of a result file in bytes without decoding it"""
+        entry = self._entries[name]
+        return len(entry) if isinstance(entry, bytes) else entry.size
+
+    @property
+    def sizes(self) -> Dict[str, int]:
+        """The sizes of all result files in bytes"""
+        return {name: self.size(name) for name in self._entries}
+
+    def is_decoded(self, name: str) -> bool:
+        """Returns whether a result file has already been decoded"""
+        return name in self._decoded or isinstance(self._entries[name], bytes)
+
+    @property
+    def memory_size(self) -> int:
+        """The number of bytes kept in memory for the result files. Files that are not
+        decoded yet may be located in a larger encoded document, e.g. the decompressed
+        delivery, which is kept in memory as a whole and counted once."""
+        size = sum(len(content) for content in self._decoded.values())
+        documents: Dict[int, int] = {}
+        for entry in self._entries.values():
+            if isinstance(entry, bytes):
+                size += len(entry)
+            elif hasattr(entry, "document"):
+                documents[id(entry.document)] = len(entry.document)
+        return size + sum(documents.values())
+
+    @property
+    def spilled_files(self) -> List[SpilledFile]:
+        """The result files that are read from disk when they are accessed"""
+        return [entry for entry in self._entries.values() if isinstance(entry, SpilledFile)]
+
+
+class LazyResultDelivery(ResultDelivery):
+    """A ResultDelivery that decodes its result files on first access. The data
+    attribute is a LazyResultData object."""
+
+    def __post_init__(self):
+        if not isinstance(self.data, LazyResultData):
+            self.data = LazyResultData(self.data)  # type: ignore
+
+    @property
+    def file_sizes(self) -> Dict[str, int]:
+        """The sizes of all result files in bytes, determined without decoding them"""
+        return self.data.sizes  # type: ignore
+
+    @property
+    def spilled_files(self) -> List[SpilledFile]:
+        return self.data.spilled_files  # type: ignore
 
 
 @dataclass_json
@@ -80,3 +345,6 @@ class RestReply:
         if isinstance(self.result_delivery, List):
             # bytes are stored as a list in json; convert it back
             self.result_delivery = bytes(self.result_delivery)
+        elif isinstance(self.result_delivery, str):
+            # bytes were transferred base64-encoded
+            self.result_delivery = base64.b64decode(self.result_delivery)
@@ -0,0 +1,636 @@
+"""
+Fast decoding of utsp replies and result deliveries that contain bytes encoded as json
+lists of integers. Instead of building a python list of ints for each byte, such arrays
+are directly parsed into numpy uint8 buffers.
+
+Compressed result deliveries can additionally be decoded incrementally, so that the
+decompressed json document never has to be kept in memory as a whole.
+"""
+
+import base64
+import codecs
+import json
+from json.decoder import JSONDecodeError, scanstring  # type: ignore
+import os
+import re
+import tempfile
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+import zlib
+
+import numpy as np
+from utspclient.datastructures import (
+    LazyResultDelivery,
+    RestReply,
+    ResultDelivery,
+    SpilledFile,
+    TimeSeriesRequest,
+)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+# characters that can continue a number
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+#: Decodes the json value starting at the specified index for the specified key. Returns
+#: the value and the index after it.
+ValueDecoder = Callable[[str, str, int], Tuple[Any, int]]
+
+
+def _skip_whitespace(s: str, idx: int) -> int:
+    return _WHITESPACE.match(s, idx).end()  # type: ignore
+
+
+def parse_byte_array(s: str, idx: int) -> Optional[Tuple[bytes, int]]:
+    """
+    Parses a json list of integers in [0, 255] into a bytes object.
+
+    :param s: the json document
+    :type s: str
+    :param idx: index of the opening bracket of the list
+    :type idx: int
+    :return: the bytes and the index after the closing bracket, or None if the value at
+        the index is not a list of byte values
+    :rtype: Optional[Tuple[bytes, int]]
+    """
+    if s[idx] != "[":
+        return None
+    first = _skip_whitespace(s, idx + 1)
+    if s[first] == "]":
+        return b"", first + 1
+    if not s[first].isdigit():
+        return None
+    end = s.find("]", first)
+    if end < 0:
+        return None
+    content = s[first:end]
+    try:
+        # parse to a wider type to detect values that do not fit into a byte
+        values = np.fromstring(content, dtype=np.uint16, sep=",")  # type: ignore
+    except ValueError:
+        # the list contains something other than integers
+        return None
+    # older numpy versions stop parsing early instead of raising an error
+    if len(values) != content.count(",") + 1 or values.max() > 255:
+        return None
+    return values.astype(np.uint8).tobytes(), end + 1
+
+
+def _decode_value(key: str, s: str, idx: int) -> Tuple[Any, int]:
+    """Decodes any json value using the standard decoder"""
+    return _decoder.raw_decode(s, idx)
+
+
+def _decode_bytes_value(key: str, s: str, idx: int) -> Tuple[Any, int]:
+    """Decodes a json value that is expected to be a byte array"""
+    result = parse_byte_array(s, idx)
+    if result is None:
+        return _decoder.raw_decode(s, idx)
+    return result
+
+
+def decode_object(
+    s: str, idx: int, value_decoders: Dict[str, ValueDecoder]
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Decodes a json object using custom decoders for the values of specific keys.
+
+    :param s: the json document
+    :type s: str
+    :param idx: index of the opening brace of the object
+    :type idx: int
+    :param value_decoders: decoders for the values of specific keys. The decoder for the
+        key "*" is used for all other keys, defaults to the standard json decoder.
+    :type value_decoders: Dict[str, ValueDecoder]
+    :raises ValueError: if the document is not valid json
+    :return: the decoded object and the index after the closing brace
+    :rtype: Tuple[Dict[str, Any], int]
+    """
+    if s[idx] != "{":
+        raise ValueError(f"Expected an object at index {idx}")
+    default_decoder = value_decoders.get("*", _decode_value)
+    result: Dict[str, Any] = {}
+    idx = _skip_whitespace(s, idx + 1)
+    if s[idx] == "}":
+        return result, idx + 1
+    while True:
+        if s[idx] != '"':
+            raise ValueError(f"Expected a property name at index {idx}")
+        key, idx = scanstring(s, idx + 1)
+        idx = _skip_whitespace(s, idx)
+        if s[idx] != ":":
+            raise ValueError(f"Expected ':' at index {idx}")
+        idx = _skip_whitespace(s, idx + 1)
+        decoder = value_decoders.get(key, default_decoder)
+        result[key], idx = decoder(key, s, idx)
+        idx = _skip_whitespace(s, idx)
+        if s[idx] == ",":
+            idx = _skip_whitespace(s, idx + 1)
+        elif s[idx] == "}":
+            return result, idx + 1
+        else:
+            raise ValueError(f"Expected ',' or '}}' at index {idx}")
+
+
+def _decode_data(key: str, s: str, idx: int) -> Tuple[Any, int]:
+    """Decodes the data dict of a result delivery, which maps file names to bytes"""
+    if s[idx] != "{":
+        return _decoder.raw_decode(s, idx)
+    return decode_object(s, idx, {"*": _decode_bytes_value})
+
+
+def _to_str(document: Union[str, bytes]) -> str:
+    if isinstance(document, (bytes, bytearray, memoryview)):
+        return bytes(document).decode()
+    return document
+
+
+def parse_rest_reply(document: Union[str, bytes]) -> RestReply:
+    """
+    Parses a json reply from the utsp server.
+
+    :param document: the json reply
+    :type document: Union[str, bytes]
+    :return: the reply object
+    :rtype: RestReply
+    """
+    s = _to_str(document)
+    reply_dict, _ = decode_object(
+        s,
+        _skip_whitespace(s, 0),
+        {"result_delivery": _decode_bytes_value},
+    )
+    return RestReply(**reply_dict)
+
+
+def parse_rest_replies(document: Union[str, bytes]) -> List[RestReply]:
+    """
+    Parses a json list of replies from the utsp server, as returned for a batch of
+    requests.
+
+    :param document: the json list of replies
+    :type document: Union[str, bytes]
+    :raises ValueError: if the document is not a valid list of replies
+    :return: the reply objects
+    :rtype: List[RestReply]
+    """
+    s = _to_str(document)
+    idx = _skip_whitespace(s, 0)
+    if s[idx] != "[":
+        raise ValueError(f"Expected a list at index {idx}")
+    replies: List[RestReply] = []
+    idx = _skip_whitespace(s, idx + 1)
+    if s[idx] == "]":
+        return replies
+    value_decoders: Dict[str, ValueDecoder] = {"result_delivery": _decode_bytes_value}
+    while True:
+        reply_dict, idx = decode_object(s, idx, value_decoders)
+        replies.append(RestReply(**reply_dict))
+        idx = _skip_whitespace(s, idx)
+        if s[idx] == ",":
+            idx = _skip_whitespace(s, idx + 1)
+        elif s[idx] == "]":
+            return replies
+        else:
+            raise ValueError(f"Expected ',' or ']' at index {idx}")
+
+
+def parse_result_delivery(document: Union[str, bytes]) -> ResultDelivery:
+    """
+    Parses a decompressed result delivery.
+
+    :param document: the result delivery in json format
+    :type document: Union[str, bytes]
+    :return: the result delivery object
+    :rtype: ResultDelivery
+    """
+    s = _to_str(document)
+    delivery_dict, _ = decode_object(s, _skip_whitespace(s, 0), {"data": _decode_data})
+    original_request = TimeSeriesRequest.from_dict(delivery_dict["original_request"])  # type: ignore
+    return ResultDelivery(original_request, delivery_dict.get("data", {}))
+
+
+def _parse_byte_values(content: str) -> bytes:
+    """Parses comma-separated integers in [0, 255] into a bytes object"""
+    if not content.strip():
+        return b""
+    try:
+        values = np.fromstring(content, dtype=np.uint16, sep=",")  # type: ignore
+    except ValueError:
+        values = None
+    if values is None or len(values) != content.count(",") + 1 or values.max() > 255:
+        raise ValueError("Invalid byte array in result delivery")
+    return values.astype(np.uint8).tobytes()
+
+
+class _MemoryBudget:
+    """Keeps track of the memory used by decoded result files"""
+
+    def __init__(self, max_memory: Optional[int]) -> None:
+        self.max_memory = max_memory
+        self.used = 0
+
+    def allows(self, size: int) -> bool:
+        return self.max_memory is None or self.used + size <= self.max_memory
+
+
+class _ResultFileWriter:
+    """
+    Collects the content of a single result file. The content is kept in memory as long
+    as the memory budget allows, and is written to a file in the spill directory
+    otherwise.
+    """
+
+    def __init__(
+        self, name: str, budget: _MemoryBudget, spill_directory: Optional[str]
+    ) -> None:
+        self.name = name
+        self.budget = budget
+        self.spill_directory = spill_directory
+        self.buffer = bytearray()
+        self.file: Optional[BinaryIO] = None
+        self.path = ""
+        self.size = 0
+        if spill_directory is not None and budget.max_memory is None:
+            # without a memory limit, all files are spilled directly
+            self._spill()
+
+    def _spill(self) -> None:
+        assert self.spill_directory is not None
+        os.makedirs(self.spill_directory, exist_ok=True)
+        suffix = "_" + re.sub(r"[^\w.-]", "_", os.path.basename(self.name))
+        fd, self.path = tempfile.mkstemp(
+            suffix=suffix, prefix="utsp_", dir=self.spill_directory
+        )
+        self.file = os.fdopen(fd, "wb")
+        self.file.write(self.buffer)
+        self.budget.used -= len(self.buffer)
+        self.buffer = bytearray()
+
+    def write(self, data: bytes) -> None:
+        self.size += len(data)
+        if self.file is None and not self.budget.allows(len(data)):
+            if self.spill_directory is None:
+                raise MemoryError(
+                    f"Decoding the result file '{self.name}' exceeds the memory limit "
+                    f"of {self.budget.max_memory} bytes"
+                )
+            self._spill()
+        if self.file is not None:
+            self.file.write(data)
+        else:
+            self.buffer.extend(data)
+            self.budget.used += len(data)
+
+    def close(self) -> Union[bytes, SpilledFile]:
+        if self.file is not None:
+            self.file.close()
+            return SpilledFile(self.path, self.size)
+        return bytes(self.buffer)
+
+    def discard(self) -> None:
+        """Deletes the spill file of a result file that could not be decoded completely"""
+        if self.file is not None:
+            self.file.close()
+            SpilledFile(self.path, self.size).remove()
+
+
+class _StreamReader:
+    """
+    Reads json tokens from zlib-compressed data, decompressing only as much as needed.
+    Consumed text is dropped from the buffer whenever new text is added.
+    """
+
+    def __init__(self, data: bytes, chunk_size: int) -> None:
+        self._data = memoryview(data)
+        self._data_pos = 0
+        self._chunk_size = chunk_size
+        self._decompressor = zlib.decompressobj()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._finished = False
+        self.buffer = ""
+        self.pos = 0
+
+    def _decompress_chunk(self) -> Optional[str]:
+        """Returns the next chunk of text, or None at the end of the data"""
+        while not self._finished:
+            d = self._decompressor
+            if d.unconsumed_tail:
+                raw = d.decompress(d.unconsumed_tail, self._chunk_size)
+            elif self._data_pos < len(self._data):
+                chunk = self._data[self._data_pos : self._data_pos + self._chunk_size]
+                self._data_pos += len(chunk)
+                raw = d.decompress(chunk, self._chunk_size)
+            else:
+                raw = d.flush()
+                self._finished = True
+            text = self._text_decoder.decode(raw, self._finished)
+            if text:
+                return text
+        return None
+
+    def fill(self) -> bool:
+        """Appends more text to the buffer. Returns False at the end of the data."""
+        text = self._decompress_chunk()
+        if text is None:
+            return False
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+        return True
+
+    def _fill_or_fail(self) -> None:
+        if not self.fill():
+            raise ValueError("Unexpected end of result delivery")
+
+    def next_char(self, offset: int = 0) -> str:
+        """Skips whitespace at the current position and returns the first non-whitespace
+        character at or after the offset, without consuming it"""
+        while True:
+            idx = _skip_whitespace(self.buffer, self.pos)
+            if idx < len(self.buffer):
+                break
+            self._fill_or_fail()
+        self.pos = idx
+        idx += offset
+        while True:
+            idx = _skip_whitespace(self.buffer, idx)
+            if idx < len(self.buffer):
+                return self.buffer[idx]
+            offset_from_pos = idx - self.pos
+            self._fill_or_fail()
+            idx = self.pos + offset_from_pos
+
+    def expect(self, char: str) -> None:
+        if self.next_char() != char:
+            raise ValueError(f"Expected '{char}' in result delivery")
+        self.pos += 1
+
+    def read_string(self) -> str:
+        self.expect('"')
+        while True:
+            try:
+                value, self.pos = scanstring(self.buffer, self.pos)
+                return value
+            except JSONDecodeError:
+                self._fill_or_fail()
+
+    def read_value(self) -> Any:
+        self.next_char()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+                # a number at the end of the buffer might be incomplete, e.g. "12." of
+                # "12.5" is decoded as 12
+                complete = (
+                    end < len(self.buffer) and self.buffer[end] not in _NUMBER_CHARS
+                )
+                if complete or not self.fill():
+                    self.pos = end
+                    return value
+            except JSONDecodeError:
+                self._fill_or_fail()
+
+    def read_byte_array(self, writer: _ResultFileWriter) -> None:
+        self.expect("[")
+        while True:
+            end = self.buffer.find("]", self.pos)
+            if end >= 0:
+                writer.write(_parse_byte_values(self.buffer[self.pos : end]))
+                self.pos = end + 1
+                return
+            # parse all complete values and keep the rest for the next chunk
+            last_separator = self.buffer.rfind(",", self.pos)
+            if last_separator >= 0:
+                writer.write(_parse_byte_values(self.buffer[self.pos : last_separator]))
+                self.pos = last_separator + 1
+            self._fill_or_fail()
+
+    def read_base64_string(self, writer: _ResultFileWriter) -> None:
+        self.expect('"')
+        remainder = ""
+        while True:
+            end = self.buffer.find('"', self.pos)
+            text = self.buffer[self.pos : end if end >= 0 else len(self.buffer)]
+            if end < 0 and text.endswith("\\"):
+                # keep an escape sequence that is split between chunks together
+                text = text[:-1]
+            self.pos += len(text)
+            text = remainder + text.replace("\\", "")
+            usable = len(text) if end >= 0 else len(text) - len(text) % 4
+            writer.write(base64.b64decode(text[:usable]))
+            remainder = text[usable:]
+            if end >= 0:
+                self.pos = end + 1
+                return
+            self._fill_or_fail()
+
+
+def _read_result_files(
+    reader: _StreamReader, budget: _MemoryBudget, spill_directory: Optional[str]
+) -> Dict[str, Any]:
+    """Reads the data dict of a result delivery, one file at a time"""
+    data: Dict[str, Any] = {}
+    reader.expect("{")
+    if reader.next_char() == "}":
+        reader.pos += 1
+        return data
+    writer: Optional[_ResultFileWriter] = None
+    try:
+        while True:
+            name = reader.read_string()
+            reader.expect(":")
+            char = reader.next_char()
+            if char == '"':
+                writer = _ResultFileWriter(name, budget, spill_directory)
+                reader.read_base64_string(writer)
+                data[name] = writer.close()
+            elif char == "[" and (
+                reader.next_char(1).isdigit() or reader.next_char(1) == "]"
+            ):
+                writer = _ResultFileWriter(name, budget, spill_directory)
+                reader.read_byte_array(writer)
+                data[name] = writer.close()
+            else:
+                data[name] = reader.read_value()
+            writer = None
+            char = reader.next_char()
+            reader.pos += 1
+            if char == "}":
+                return data
+            if char != ",":
+                raise ValueError("Expected ',' or '}' in result delivery")
+    except BaseException:
+        # nobody receives the files of a delivery that could not be decoded
+        if writer is not None:
+            writer.discard()
+        _remove_spilled_files(data)
+        raise
+
+
+def _remove_spilled_files(data: Dict[str, Any]) -> None:
+    for value in data.values():
+        if isinstance(value, SpilledFile):
+            value.remove()
+
+
+def decompress_result_delivery(
+    data: bytes,
+    max_memory: Optional[int] = None,
+    spill_directory: Optional[str] = None,
+    chunk_size: int = 1 << 20,
+) -> ResultDelivery:
+    """
+    Decompresses and parses a result delivery incrementally. Result files are decoded one
+    chunk at a time, so that neither the decompressed json document nor intermediate
+    representations of the result files have to be kept in memory as a whole.
+
+    :param data: the compressed result delivery
+    :type data: bytes
+    :param max_memory: maximum number of bytes of result file contents to keep in memory,
+        defaults to None (no limit)
+    :type max_memory: Optional[int], optional
+    :param spill_directory: directory to write result files to that would exceed the
+        memory limit. If no memory limit is set, all result files are written to this
+        directory. Defaults to None
+    :type spill_directory: Optional[str], optional
+    :param chunk_size: number of bytes that are decompressed at a time, defaults to 1 MiB
+    :type chunk_size: int, optional
+    :raises MemoryError: if the memory limit is exceeded and no spill directory was set
+    :return: the result delivery; result files written to disk are represented by
+        SpilledFile objects. These files belong to the caller, who has to delete them
+        with ResultDelivery.remove_spilled_files when they are not needed anymore.
+    :rtype: ResultDelivery
+    """
+    reader = _StreamReader(data, chunk_size)
+    budget = _MemoryBudget(max_memory)
+    delivery_dict: Dict[str, Any] = {}
+    reader.expect("{")
+    if reader.next_char() == "}":
+        raise ValueError("Empty result delivery")
+    try:
+        while True:
+            key = reader.read_string()
+            reader.expect(":")
+            if key == "data":
+                delivery_dict[key] = _read_result_files(reader, budget, spill_directory)
+            else:
+                delivery_dict[key] = reader.read_value()
+            char = reader.next_char()
+            reader.pos += 1
+            if char == "}":
+                break
+            if char != ",":
+                raise ValueError("Expected ',' or '}' in result delivery")
+        original_request = TimeSeriesRequest.from_dict(delivery_dict["original_request"])  # type: ignore
+    except BaseException:
+        _remove_spilled_files(delivery_dict.get("data", {}))
+        raise
+    return ResultDelivery(original_request, delivery_dict.get("data", {}))
+
+
+class _DocumentSpan:
+    """A result file that is still encoded within the decompressed delivery document,
+    either as json list of integers or as base64 string"""
+
+    def __init__(self, document: str, start: int, end: int) -> None:
+        self.document = document
+        # start and end of the encoded file contents, without brackets or quotes
+        self.start = start
+        self.end = end
+        self.is_base64 = document[start - 1] == '"'
+
+    def _base64_content(self) -> str:
+        content = self.document[self.start : self.end]
+        # remove escape characters, e.g. of escaped slashes
+        return content.replace("\\", "") if "\\" in content else content
+
+    @property
+    def size(self) -> int:
+        if self.is_base64:
+            content = self._base64_content()
+            return len(content) * 3 // 4 - content.count("=", -2)
+        if self.start == self.end or self.document[self.start : self.end].isspace():
+            return 0
+        return self.document.count(",", self.start, self.end) + 1
+
+    def read(self) -> bytes:
+        if self.is_base64:
+            return base64.b64decode(self._base64_content())
+        return _parse_byte_values(self.document[self.start : self.end])
+
+
+def _decode_lazy_file(key: str, s: str, idx: int) -> Tuple[Any, int]:
+    """Locates an encoded result file in the document without decoding it"""
+    if s[idx] == '"':
+        end = s.find('"', idx + 1)
+        if end >= 0:
+            return _DocumentSpan(s, idx + 1, end), end + 1
+    elif s[idx] == "[":
+        first = _skip_whitespace(s, idx + 1)
+        end = s.find("]", first)
+        if end >= 0 and (s[first].isdigit() or first == end):
+            return _DocumentSpan(s, idx + 1, end), end + 1
+    value, end = _decoder.raw_decode(s, idx)
+    return (bytes(value) if isinstance(value, list) else value), end
+
+
+def _decode_lazy_data(key: str, s: str, idx: int) -> Tuple[Any, int]:
+    if s[idx] != "{":
+        return _decoder.raw_decode(s, idx)
+    return decode_object(s, idx, {"*": _decode_lazy_file})
+
+
+def _decompress_with_limit(data: bytes, max_memory: Optional[int]) -> bytes:
+    """Decompresses data, but stops with a MemoryError as soon as the decompressed data
+    exceeds the memory limit"""
+    if max_memory is None:
+        return zlib.decompress(data)
+    decompressor = zlib.decompressobj()
+    # decompress at most one byte more than allowed to detect exceeding the limit
+    decompressed = decompressor.decompress(data, max_memory + 1)
+    if not decompressor.unconsumed_tail:
+        decompressed += decompressor.flush()
+    if decompressor.unconsumed_tail or len(decompressed) > max_memory:
+        raise MemoryError(
+            f"Decompressing the result delivery exceeds the memory limit of "
+            f"{max_memory} bytes"
+        )
+    return decompressed
+
+
+def decompress_result_delivery_lazy(
+    data: bytes,
+    max_memory: Optional[int] = None,
+    spill_directory: Optional[str] = None,
+) -> LazyResultDelivery:
+    """
+    Decompresses a result delivery, but only locates the result files within the
+    decompressed document instead of decoding them. Each file is decoded when it is
+    accessed for the first time.
+
+    If a spill directory is set, the delivery is instead decoded incrementally, writing
+    the result files to disk, and each file is read from disk when it is accessed. The
+    caller has to delete these files with ResultDelivery.remove_spilled_files.
+
+    :param data: the compressed result delivery
+    :type data: bytes
+    :param max_memory: with a spill directory, the maximum number of bytes of result file
+        contents to keep in memory. Without a spill directory, the maximum size of the
+        decompressed document, which contains the encoded result files. Defaults to None
+        (no limit, or write all files to disk if a spill directory is set)
+    :type max_memory: Optional[int], optional
+    :param spill_directory: directory to write result files to, defaults to None
+    :type spill_directory: Optional[str], optional
+    :raises MemoryError: if no spill directory is set and the decompressed document
+        exceeds the memory limit
+    :return: the lazy result delivery
+    :rtype: LazyResultDelivery
+    """
+    if spill_directory is not None:
+        delivery = decompress_result_delivery(data, max_memory, spill_directory)
+        return LazyResultDelivery(delivery.original_request, delivery.data)
+    s = _decompress_with_limit(data, max_memory).decode()
+    delivery_dict, _ = decode_object(
+        s, _skip_whitespace(s, 0), {"data": _decode_lazy_data}
+    )
+    original_request = TimeSeriesRequest.from_dict(delivery_dict["original_request"])  # type: ignore
+    return LazyResultDelivery(original_request, delivery_dict.get("data", {}))
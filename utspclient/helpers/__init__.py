@@ -1 +1,25 @@
-from utspclient.helpers import lpg_helper, lpgdata, lpgpythonbindings
+"""
+Helpers for creating requests for the LoadProfileGenerator (LPG). The submodules are
+only imported when they are used, because the LPG bindings take long to import.
+"""
+
+import importlib
+from typing import Any, List
+
+_SUBMODULES = [
+    "lpg_catalog",
+    "lpg_helper",
+    "lpg_serialization",
+    "lpgdata",
+    "lpgpythonbindings",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_SUBMODULES))
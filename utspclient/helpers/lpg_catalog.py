@@ -0,0 +1,262 @@
+"""
+Prebuilt indices over the catalog classes in lpgdata, for looking up catalog entries by
+code, name or GUID and for filtering them by tags without scanning the catalog classes
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from utspclient.helpers import lpgdata
+
+if TYPE_CHECKING:
+    # the LPG bindings are only imported when the first index is built
+    from utspclient.helpers.lpgpythonbindings import JsonReference
+
+#: Matches the code at the beginning of the name of an LPG object, e.g. CHR01 or HT22
+CODE_PATTERN = re.compile(r"[A-Z]+\d+[A-Za-z]?\b")
+
+
+def get_entry_name(entry: Any) -> str:
+    """
+    Returns the full name of a catalog entry
+
+    :param entry: the catalog entry
+    :type entry: Any
+    :return: the name of the entry
+    :rtype: str
+    """
+    from utspclient.helpers import lpgpythonbindings as bindings
+
+    if isinstance(entry, (bindings.JsonReference, bindings.TemplatePersonEntry)):
+        return entry.Name or ""
+    return entry
+
+
+def get_entry_code(entry: Any) -> Optional[str]:
+    """
+    Returns the code of a catalog entry, e.g. CHR01 for the household "CHR01 Couple both at
+    Work". The code of a template person is the code of its household template.
+
+    :param entry: the catalog entry
+    :type entry: Any
+    :return: the code of the entry, or None if its name does not start with a code
+    :rtype: Optional[str]
+    """
+    from utspclient.helpers import lpgpythonbindings as bindings
+
+    if isinstance(entry, bindings.TemplatePersonEntry):
+        name = entry.TemplateName or ""
+    else:
+        name = get_entry_name(entry)
+    match = CODE_PATTERN.match(name)
+    return match.group() if match else None
+
+
+def get_parent_tags(tag: str) -> List[str]:
+    """
+    Returns a hierarchical tag together with all its parent tags, e.g.
+    "Living Pattern / Office Job" for "Living Pattern / Office Job / Early (5-7am)"
+
+    :param tag: the tag
+    :type tag: str
+    :return: the tag and its parents
+    :rtype: List[str]
+    """
+    parts = tag.split(" / ")
+    return [" / ".join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+
+class CatalogIndex:
+    """
+    Index over the entries of a catalog class from lpgdata. Entries can be looked up by
+    attribute name, full name, GUID or code, and filtered by the living pattern tags of
+    the template persons that belong to them.
+
+    Use get_catalog_index to get the shared index of a catalog class instead of creating
+    a new one.
+    """
+
+    def __init__(self, catalog: type) -> None:
+        """
+        Builds the index for a catalog class
+
+        :param catalog: the catalog class from lpgdata, e.g. lpgdata.Households
+        :type catalog: type
+        """
+        from utspclient.helpers import lpgpythonbindings as bindings
+
+        self.catalog = catalog
+        self.by_attribute: Dict[str, Any] = {
+            name: getattr(catalog, name) for name in vars(catalog)["__annotations__"]
+        }
+        self.by_name: Dict[str, Any] = {}
+        self.by_guid: Dict[str, Any] = {}
+        self.by_code: Dict[str, List[Any]] = {}
+        self.tags: Dict[str, FrozenSet[str]] = {}
+        tags_by_code = _get_tags_by_code()
+        for attribute, entry in self.by_attribute.items():
+            self.by_name[get_entry_name(entry)] = entry
+            if (
+                isinstance(entry, bindings.JsonReference)
+                and entry.Guid
+                and entry.Guid.StrVal
+            ):
+                self.by_guid[entry.Guid.StrVal] = entry
+            code = get_entry_code(entry)
+            if code is not None:
+                self.by_code.setdefault(code, []).append(entry)
+            if isinstance(entry, bindings.TemplatePersonEntry):
+                # a template person only has the tags of its own living pattern
+                self.tags[attribute] = frozenset(
+                    get_parent_tags(entry.LivingPattern or "")
+                )
+            elif code is not None:
+                self.tags[attribute] = tags_by_code.get(code, frozenset())
+        self._filter_results: Dict[FrozenSet[str], Tuple[Any, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.by_attribute)
+
+    def __contains__(self, key: str) -> bool:
+        return self.find(key) is not None
+
+    def find(self, key: str) -> Optional[Any]:
+        """
+        Looks up an entry by GUID, full name, attribute name or code, in this order. A
+        code is only resolved if it belongs to a single entry.
+
+        :param key: GUID, name, attribute name or code of the entry
+        :type key: str
+        :return: the entry, or None if no entry matches the key
+        :rtype: Optional[Any]
+        """
+        for entries in (self.by_guid, self.by_name, self.by_attribute):
+            entry = entries.get(key)
+            if entry is not None:
+                return entry
+        coded_entries = self.by_code.get(key)
+        if coded_entries is not None and len(coded_entries) == 1:
+            return coded_entries[0]
+        return None
+
+    def get(self, key: str) -> Any:
+        """
+        Looks up an entry like find, but raises an exception if no entry matches the key
+
+        :param key: GUID, name, attribute name or code of the entry
+        :type key: str
+        :return: the entry
+        :rtype: Any
+        """
+        entry = self.find(key)
+        if entry is None:
+            if len(self.by_code.get(key, [])) > 1:
+                raise KeyError(
+                    f"The code '{key}' is ambiguous in {self.catalog.__name__}"
+                )
+            raise KeyError(f"No entry '{key}' in {self.catalog.__name__}")
+        return entry
+
+    def get_by_code(self, code: str) -> List[Any]:
+        """
+        Returns all entries with the specified code, e.g. all template persons of a
+        household template
+
+        :param code: the code, e.g. CHR01
+        :type code: str
+        :return: the entries with the code
+        :rtype: List[Any]
+        """
+        return list(self.by_code.get(code, []))
+
+    def filter(self, *tags: str) -> Tuple[Any, ...]:
+        """
+        Returns all entries that have all of the specified tags, e.g. all households with
+        a retiree. A tag also matches all more specific tags, so
+        "Living Pattern / Office Job" matches "Living Pattern / Office Job / Early (5-7am)".
+        The results are cached.
+
+        :param tags: tags from lpgdata.LivingPatternTags
+        :type tags: str
+        :return: the matching entries
+        :rtype: Tuple[Any, ...]
+        """
+        key = frozenset(tags)
+        result = self._filter_results.get(key)
+        if result is None:
+            result = tuple(
+                self.by_attribute[attribute]
+                for attribute, entry_tags in self.tags.items()
+                if key <= entry_tags
+            )
+            self._filter_results[key] = result
+        return result
+
+
+_tags_by_code: Optional[Dict[str, FrozenSet[str]]] = None
+_indices: Dict[type, CatalogIndex] = {}
+_indices_lock = threading.RLock()
+
+
+def _get_tags_by_code() -> Dict[str, FrozenSet[str]]:
+    """Returns the living pattern tags of the template persons of each household code"""
+    global _tags_by_code
+    with _indices_lock:
+        if _tags_by_code is None:
+            tags: Dict[str, set] = {}
+            for name in vars(lpgdata.TemplatePersons)["__annotations__"]:
+                person = getattr(lpgdata.TemplatePersons, name)
+                code = get_entry_code(person)
+                if code is not None:
+                    tags.setdefault(code, set()).update(
+                        get_parent_tags(person.LivingPattern or "")
+                    )
+            _tags_by_code = {code: frozenset(t) for code, t in tags.items()}
+        return _tags_by_code
+
+
+def get_catalog_index(catalog: type) -> CatalogIndex:
+    """
+    Returns the index of a catalog class from lpgdata. The index is built on the first
+    call and shared afterwards.
+
+    :param catalog: the catalog class, e.g. lpgdata.Households
+    :type catalog: type
+    :return: the index of the catalog class
+    :rtype: CatalogIndex
+    """
+    index = _indices.get(catalog)
+    if index is None:
+        with _indices_lock:
+            index = _indices.get(catalog)
+            if index is None:
+                index = CatalogIndex(catalog)
+                _indices[catalog] = index
+    return index
+
+
+def find_households(*tags: str) -> Tuple[JsonReference, ...]:
+    """
+    Returns the predefined households that have all of the specified tags
+
+    :param tags: tags from lpgdata.LivingPatternTags
+    :type tags: str
+    :return: the matching households
+    :rtype: Tuple[JsonReference, ...]
+    """
+    return get_catalog_index(lpgdata.Households).filter(*tags)
+
+
+def get_household(key: str) -> JsonReference:
+    """
+    Returns a predefined household by its code, name or GUID
+
+    :param key: the code (e.g. CHR54), name or GUID of the household
+    :type key: str
+    :return: the reference to the household
+    :rtype: JsonReference
+    """
+    return get_catalog_index(lpgdata.Households).get(key)
@@ -1,29 +1,32 @@
 """
 Helper functions for creating requests for the LPG
 """
-import inspect
+
+from __future__ import annotations
+
 import random
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
 from utspclient.helpers import lpgdata
-from utspclient.helpers.lpgpythonbindings import (
-    HouseCreationAndCalculationJob,
-    HouseData,
-    HouseholdData,
-    HouseholdDataSpecificationType,
-    HouseholdNameSpecification,
-    JsonReference,
-)
+from utspclient.helpers.lpg_catalog import get_catalog_index, get_entry_code
+
+if TYPE_CHECKING:
+    # the LPG bindings are only imported when the first object is created
+    from utspclient.helpers.lpgpythonbindings import (
+        HouseCreationAndCalculationJob,
+        HouseData,
+        HouseholdData,
+        JsonReference,
+    )
 
 
 def collect_lpg_households() -> Dict[str, JsonReference]:
     """
     Collects the JsonReferences of all predefined LPG household
     """
-    members = inspect.getmembers(lpgdata.Households)
-    predefined_households = {
-        name: value for name, value in members if isinstance(value, JsonReference)
-    }
-    return predefined_households
+    return dict(get_catalog_index(lpgdata.Households).by_attribute)
 
 
 def create_default_house_data() -> HouseData:
@@ -84,7 +87,160 @@ def create_hh_data_from_number_and_size(
 
             persondata = lpgdata.PersonData(int(age), gender)
             hh_data.HouseholdDataPersonSpec.Persons.append(persondata)
-            households.append(hh_data)
+        households.append(hh_data)
+    return households
+
+
+def _get_templates_by_size(templates: Optional[Iterable[str]]) -> Dict[int, List[str]]:
+    """Groups household templates by their number of persons"""
+    template_persons = get_catalog_index(lpgdata.TemplatePersons)
+    if templates is None:
+        templates = get_catalog_index(lpgdata.HouseholdTemplates).by_attribute.values()
+    templates_by_size: Dict[int, List[str]] = {}
+    for template in templates:
+        code = get_entry_code(template)
+        size = len(template_persons.by_code.get(code, [])) if code else 0
+        if size > 0:
+            templates_by_size.setdefault(size, []).append(template)
+    return templates_by_size
+
+
+def create_population(
+    number_of_households: int,
+    household_sizes: Dict[int, float],
+    age_distribution: Optional[Dict[Tuple[int, int], float]] = None,
+    female_share: float = 0.5,
+    seed: Optional[int] = None,
+    by_template_name: bool = False,
+    templates: Optional[Iterable[str]] = None,
+    transportation_device_set: Optional[JsonReference] = None,
+    travel_route_set: Optional[JsonReference] = None,
+    charging_station_set: Optional[JsonReference] = None,
+) -> List[HouseholdData]:
+    """
+    Creates a synthetic population of households that can be added to HouseData objects
+    in LPG simulation configs. The household sizes, ages and genders of all persons are
+    drawn at once from the specified distributions, so that large populations can be
+    created quickly. The same seed always results in the same population.
+
+    :param number_of_households: the number of households to create
+    :type number_of_households: int
+    :param household_sizes: probabilities of the household sizes, as a dict mapping the
+        number of persons to its weight, e.g. {1: 0.4, 2: 0.35, 3: 0.1, 4: 0.15}
+    :type household_sizes: Dict[int, float]
+    :param age_distribution: probabilities of age groups, as a dict mapping the lowest
+        and the first excluded age of each group to its weight, e.g. {(0, 18): 0.2,
+        (18, 65): 0.6, (65, 90): 0.2}. Within a group, all ages are equally likely.
+        Defaults to None, which means all ages from 0 to 99 are equally likely.
+    :type age_distribution: Optional[Dict[Tuple[int, int], float]], optional
+    :param female_share: probability that a person is female, defaults to 0.5
+    :type female_share: float, optional
+    :param seed: seed for the random number generator, defaults to None
+    :type seed: Optional[int], optional
+    :param by_template_name: if True, each household is specified by a household
+        template with the drawn number of persons instead of by its persons, and the
+        age distribution and female share are not used, defaults to False
+    :type by_template_name: bool, optional
+    :param templates: names of the household templates to choose from, e.g. the
+        filtered entries of the HouseholdTemplates catalog. Defaults to None, which
+        means all templates in lpgdata.HouseholdTemplates.
+    :type templates: Optional[Iterable[str]], optional
+    :param transportation_device_set: transportation device set of all households,
+        defaults to None
+    :type transportation_device_set: Optional[JsonReference], optional
+    :param travel_route_set: travel route set of all households, defaults to None
+    :type travel_route_set: Optional[JsonReference], optional
+    :param charging_station_set: charging station set of all households, defaults to
+        None
+    :type charging_station_set: Optional[JsonReference], optional
+    :return: the list of HouseholdData objects
+    :rtype: List[HouseholdData]
+    """
+    from utspclient.helpers.lpgpythonbindings import (
+        Gender,
+        HouseholdData,
+        HouseholdDataPersonSpecification,
+        HouseholdDataSpecificationType,
+        HouseholdTemplateSpecification,
+        PersonData,
+    )
+
+    assert household_sizes, "No household sizes were specified"
+    assert 0 <= female_share <= 1, "The female share must be between 0 and 1"
+    rng = np.random.default_rng(seed)
+    size_values = np.array(list(household_sizes.keys()), dtype=np.int64)
+    assert (size_values > 0).all(), "Households must consist of at least one person"
+    size_weights = np.array(list(household_sizes.values()), dtype=np.float64)
+    sizes = rng.choice(
+        size_values, number_of_households, p=size_weights / size_weights.sum()
+    )
+
+    if by_template_name:
+        templates_by_size = _get_templates_by_size(templates)
+        for size in household_sizes:
+            if size not in templates_by_size:
+                raise Exception(f"There is no household template with {size} persons")
+        # list the templates of all sizes one after another, so that each household
+        # can pick one of the templates with the right size by its index
+        template_names: List[str] = []
+        first_by_size = np.zeros(size_values.max() + 1, dtype=np.int64)
+        counts_by_size = np.zeros(size_values.max() + 1, dtype=np.int64)
+        for size in household_sizes:
+            first_by_size[size] = len(template_names)
+            counts_by_size[size] = len(templates_by_size[size])
+            template_names.extend(templates_by_size[size])
+        choices = (rng.random(number_of_households) * counts_by_size[sizes]).astype(
+            np.int64
+        )
+        indices = (first_by_size[sizes] + choices).tolist()
+        template_specs: List[Optional[HouseholdTemplateSpecification]] = [
+            HouseholdTemplateSpecification(HouseholdTemplateName=template_names[i])
+            for i in indices
+        ]
+        person_specs: List[Optional[HouseholdDataPersonSpecification]] = [
+            None
+        ] * number_of_households
+        specification_type = HouseholdDataSpecificationType.ByTemplateName
+    else:
+        if age_distribution is None:
+            age_distribution = {(0, 100): 1}
+        age_bounds = np.array(list(age_distribution.keys()), dtype=np.int64)
+        assert (
+            age_bounds[:, 0] < age_bounds[:, 1]
+        ).all(), "Each age group must contain at least one age"
+        age_weights = np.array(list(age_distribution.values()), dtype=np.float64)
+        number_of_persons = int(sizes.sum())
+        age_groups = rng.choice(
+            len(age_bounds), number_of_persons, p=age_weights / age_weights.sum()
+        )
+        ages = rng.integers(age_bounds[age_groups, 0], age_bounds[age_groups, 1])
+        is_female = rng.random(number_of_persons) < female_share
+        genders = [Gender.Female if f else Gender.Male for f in is_female.tolist()]
+        # create all persons at once and split them into households afterwards
+        persons = list(map(PersonData, ages.tolist(), genders))
+        ends = np.cumsum(sizes).tolist()
+        person_specs = [
+            HouseholdDataPersonSpecification(persons[start:end])
+            for start, end in zip([0] + ends, ends)
+        ]
+        template_specs = [None] * number_of_households
+        specification_type = HouseholdDataSpecificationType.ByPersons
+
+    households = [
+        HouseholdData(
+            HouseholdDataPersonSpec=person_spec,
+            HouseholdTemplateSpec=template_spec,
+            UniqueHouseholdId=f"hh{index}",
+            Name=f"Household {index}",
+            TransportationDeviceSet=transportation_device_set,
+            TravelRouteSet=travel_route_set,
+            ChargingStationSet=charging_station_set,
+            HouseholdDataSpecification=specification_type,
+        )
+        for index, (person_spec, template_spec) in enumerate(
+            zip(person_specs, template_specs)
+        )
+    ]
     return households
 
 
@@ -95,7 +251,7 @@ def create_basic_lpg_config(
     enddate: str = None,
     external_resolution: str = None,
     geographic_location: JsonReference = None,
-    energy_intensity: str = lpgdata.EnergyIntensityType.Random,
+    energy_intensity: Optional[str] = None,
     transportation_device_set: JsonReference = None,
     travel_route_set: JsonReference = None,
     charging_station_set: JsonReference = None,
@@ -103,8 +259,19 @@ def create_basic_lpg_config(
 ) -> HouseCreationAndCalculationJob:
     """
     Creates a basic LPG request for a single household from the most relevant parameters, using a default
-    configuration for everything else.
+    configuration for everything else. The energy intensity defaults to
+    EnergyIntensityType.Random.
     """
+    from utspclient.helpers.lpgpythonbindings import (
+        EnergyIntensityType,
+        HouseCreationAndCalculationJob,
+        HouseholdData,
+        HouseholdDataSpecificationType,
+        HouseholdNameSpecification,
+    )
+
+    if energy_intensity is None:
+        energy_intensity = EnergyIntensityType.Random
     config = HouseCreationAndCalculationJob()
 
     # Set house data
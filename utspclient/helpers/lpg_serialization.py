@@ -0,0 +1,411 @@
+"""
+Fast serialization of the LPG binding classes. Instead of inspecting the fields of each
+object through dataclasses_json, a specialized function is generated and cached for each
+dataclass the first time an object of it is converted. The results are identical to
+those of the to_json/to_dict and from_json/from_dict methods of dataclasses_json.
+
+For creating many variants of the same config, ConfigTemplate serializes the config only
+once.
+"""
+
+import copy
+import dataclasses
+import json
+import re
+import threading
+import typing
+from collections.abc import Collection, Mapping
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Type, TypeVar
+from uuid import UUID, uuid4
+
+from dataclasses_json import cfg  # type: ignore
+
+T = TypeVar("T")
+
+Serializer = Callable[[Any], Dict[str, Any]]
+Deserializer = Callable[[Any], Any]
+
+# types whose values are contained unchanged in the result of to_dict; enum types are
+# added when they are encountered
+_PASSTHROUGH_TYPES = {str, int, float, bool, type(None)}
+
+_serializers: Dict[type, Serializer] = {}
+_deserializers: Dict[type, Deserializer] = {}
+_lock = threading.RLock()
+
+
+def _has_overrides(cls: type) -> bool:
+    """Checks if dataclasses_json is configured to treat any field of a class specially"""
+    if getattr(cls, "dataclass_json_config", None):
+        return True
+    encoders = cfg.global_config.encoders
+    decoders = cfg.global_config.decoders
+    return any(
+        field.metadata.get("dataclasses_json")
+        or field.type in encoders
+        or field.type in decoders
+        for field in dataclasses.fields(cls)
+    )
+
+
+def _encode_value(value: Any) -> Any:
+    """Converts a value like dataclasses_json does for the result of to_dict"""
+    value_type = type(value)
+    if value_type in _PASSTHROUGH_TYPES:
+        return value
+    serializer = _serializers.get(value_type)
+    if serializer is not None:
+        return serializer(value)
+    # shortcuts for the most common collections
+    if value_type is list:
+        return [
+            v if v.__class__ in _PASSTHROUGH_TYPES else _encode_value(v) for v in value
+        ]
+    if value_type is dict:
+        return {_encode_value(k): _encode_value(v) for k, v in value.items()}
+    if dataclasses.is_dataclass(value):
+        return get_serializer(value_type)(value)
+    if isinstance(value, Enum):
+        _PASSTHROUGH_TYPES.add(value_type)
+        return value
+    if isinstance(value, Mapping):
+        return {_encode_value(k): _encode_value(v) for k, v in value.items()}
+    if isinstance(value, Collection) and not isinstance(value, (str, bytes)):
+        return [_encode_value(v) for v in value]
+    encoder = cfg.global_config.encoders.get(value_type)
+    if encoder is not None:
+        return encoder(value)
+    return copy.deepcopy(value)
+
+
+def _encode_json_default(value: Any) -> Any:
+    """Converts values that the json module cannot encode, like dataclasses_json does"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, Collection):
+        return list(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_json_encoder = json.JSONEncoder(default=_encode_json_default)
+
+
+def _create_serializer(cls: type) -> Serializer:
+    """Generates the source code of a function that converts an object of a dataclass
+    to a dict and compiles it"""
+    if _has_overrides(cls) and hasattr(cls, "to_dict"):
+        return lambda obj: obj.to_dict(encode_json=False)
+    names = [field.name for field in dataclasses.fields(cls)]
+    lines = ["def serialize(obj, _encode=_encode_value, _types=_PASSTHROUGH_TYPES):"]
+    lines += [f"    v{i} = obj.{name}" for i, name in enumerate(names)]
+    lines.append("    return {")
+    lines += [
+        f"        {name!r}: v{i} if v{i}.__class__ in _types else _encode(v{i}),"
+        for i, name in enumerate(names)
+    ]
+    lines.append("    }")
+    namespace: Dict[str, Any] = {
+        "_encode_value": _encode_value,
+        "_PASSTHROUGH_TYPES": _PASSTHROUGH_TYPES,
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["serialize"]
+
+
+def get_serializer(cls: type) -> Serializer:
+    """
+    Returns the function that converts objects of a dataclass to dicts. The function is
+    generated on the first call for each class.
+
+    :param cls: the dataclass
+    :type cls: type
+    :return: the serializer function
+    :rtype: Serializer
+    """
+    serializer = _serializers.get(cls)
+    if serializer is None:
+        with _lock:
+            serializer = _serializers.get(cls)
+            if serializer is None:
+                serializer = _create_serializer(cls)
+                _serializers[cls] = serializer
+    return serializer
+
+
+def to_dict(obj: Any) -> Dict[str, Any]:
+    """
+    Converts a dataclass object to a dict, with the same result as its to_dict method
+
+    :param obj: the object to convert
+    :type obj: Any
+    :return: the dict representation of the object
+    :rtype: Dict[str, Any]
+    """
+    return get_serializer(type(obj))(obj)
+
+
+def to_json(obj: Any, **kwargs: Any) -> str:
+    """
+    Converts a dataclass object to JSON, with the same result as its to_json method
+
+    :param obj: the object to convert
+    :type obj: Any
+    :param kwargs: further arguments for json.dumps, e.g. indent
+    :return: the JSON representation of the object
+    :rtype: str
+    """
+    data = get_serializer(type(obj))(obj)
+    if kwargs:
+        return json.dumps(data, default=_encode_json_default, **kwargs)
+    return _json_encoder.encode(data)
+
+
+def _coerce(target_type: type) -> Deserializer:
+    return lambda value: (
+        value if isinstance(value, target_type) else target_type(value)
+    )
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _create_converter(annotation: Any) -> Deserializer:
+    """Creates a function that decodes a non-None value of the specified type like
+    dataclasses_json does"""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Union:
+        non_none_args = [arg for arg in args if arg is not type(None)]
+        if len(non_none_args) == 1:
+            return _create_converter(non_none_args[0])
+        return _identity
+    if not isinstance(origin, type):
+        origin = None
+    if origin is not None and issubclass(origin, Mapping):
+        key_converter = _create_converter(args[0]) if args else _identity
+        value_converter = _create_converter(args[1]) if args else _identity
+        return lambda value: {
+            key_converter(k): None if v is None else value_converter(v)
+            for k, v in value.items()
+        }
+    if origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+        return _identity
+    if origin in (list, set, frozenset, tuple, Collection):
+        item_converter = _create_converter(args[0]) if args else _identity
+        collection_type = list if origin is Collection else origin
+        return lambda value: collection_type(
+            None if v is None else item_converter(v) for v in value
+        )
+    if not isinstance(annotation, type):
+        return _identity
+    if dataclasses.is_dataclass(annotation):
+        # looked up on each call, because the class may refer to itself
+        return lambda value: (
+            value
+            if dataclasses.is_dataclass(value)
+            else get_deserializer(annotation)(value)
+        )
+    if issubclass(annotation, Enum):
+        return annotation
+    if issubclass(annotation, (int, float, str, bool)):
+        return _coerce(annotation)
+    return _identity
+
+
+def _create_deserializer(cls: type) -> Deserializer:
+    """Generates the source code of a function that creates an object of a dataclass
+    from a dict and compiles it"""
+    if _has_overrides(cls) and hasattr(cls, "from_dict"):
+        return lambda data: cls.from_dict(data)  # type: ignore
+    type_hints = typing.get_type_hints(cls)
+    namespace: Dict[str, Any] = {"cls": cls, "_missing": dataclasses.MISSING}
+    lines = [
+        "def deserialize(data):",
+        "    if isinstance(data, cls):",
+        "        return data",
+    ]
+    arguments = []
+    for i, field in enumerate(dataclasses.fields(cls)):
+        if not field.init:
+            continue
+        lines.append(f"    v{i} = data.get({field.name!r}, _missing)")
+        lines.append(f"    if v{i} is _missing:")
+        if field.default is not dataclasses.MISSING:
+            namespace[f"d{i}"] = field.default
+            lines.append(f"        v{i} = d{i}")
+        elif field.default_factory is not dataclasses.MISSING:
+            namespace[f"d{i}"] = field.default_factory
+            lines.append(f"        v{i} = d{i}()")
+        else:
+            lines.append(f"        raise KeyError({field.name!r})")
+        converter = _create_converter(type_hints[field.name])
+        if converter is not _identity:
+            namespace[f"c{i}"] = converter
+            lines.append(f"    if v{i} is not None:")
+            lines.append(f"        v{i} = c{i}(v{i})")
+        arguments.append(f"{field.name}=v{i}")
+    lines.append(f"    return cls({', '.join(arguments)})")
+    exec("\n".join(lines), namespace)
+    return namespace["deserialize"]
+
+
+def get_deserializer(cls: Type[T]) -> Callable[[Any], T]:
+    """
+    Returns the function that creates objects of a dataclass from dicts. The function is
+    generated on the first call for each class.
+
+    :param cls: the dataclass
+    :type cls: Type[T]
+    :return: the deserializer function
+    :rtype: Callable[[Any], T]
+    """
+    deserializer = _deserializers.get(cls)
+    if deserializer is None:
+        with _lock:
+            deserializer = _deserializers.get(cls)
+            if deserializer is None:
+                deserializer = _create_deserializer(cls)
+                _deserializers[cls] = deserializer
+    return deserializer
+
+
+def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
+    """
+    Creates a dataclass object from a dict, with the same result as the from_dict method
+    of the class
+
+    :param cls: the dataclass
+    :type cls: Type[T]
+    :param data: the dict representation of the object
+    :type data: Dict[str, Any]
+    :return: the object
+    :rtype: T
+    """
+    return get_deserializer(cls)(data)
+
+
+def from_json(cls: Type[T], text: str) -> T:
+    """
+    Creates a dataclass object from JSON, with the same result as the from_json method
+    of the class
+
+    :param cls: the dataclass
+    :type cls: Type[T]
+    :param text: the JSON representation of the object
+    :type text: str
+    :return: the object
+    :rtype: T
+    """
+    return get_deserializer(cls)(json.loads(text))
+
+
+#: Paths of the slots of a ConfigTemplate that can be referred to by name. A path consists
+#: of the field names and list indices leading to a value in a HouseCreationAndCalculationJob.
+SLOT_PATHS = {
+    "HouseholdReference": "House.Households.0.HouseholdNameSpec.HouseholdReference",
+    "HouseholdTemplateName": "House.Households.0.HouseholdTemplateSpec.HouseholdTemplateName",
+    "HouseTypeCode": "House.HouseTypeCode",
+    "StartDate": "CalcSpec.StartDate",
+    "EndDate": "CalcSpec.EndDate",
+    "RandomSeed": "CalcSpec.RandomSeed",
+    "EnergyIntensityType": "CalcSpec.EnergyIntensityType",
+    "ExternalTimeResolution": "CalcSpec.ExternalTimeResolution",
+    "GeographicLocation": "CalcSpec.GeographicLocation",
+    "TemperatureProfile": "CalcSpec.TemperatureProfile",
+    "CalcOptions": "CalcSpec.CalcOptions",
+}
+
+
+def _encode_json_value(value: Any) -> str:
+    """Returns the JSON representation of a value as it appears in the result of
+    to_json"""
+    return _json_encoder.encode(_encode_value(value))
+
+
+class ConfigTemplate:
+    """
+    Template for creating many variants of a config that only differ in a few values.
+    The config is serialized once, and each variant is created by inserting the JSON
+    representations of the new values into the slots of the serialized config. The
+    result is identical to changing the values in the config and calling its to_json
+    method.
+    """
+
+    def __init__(self, config: Any, slots: Iterable[str]) -> None:
+        """
+        Serializes a config and prepares the slots
+
+        :param config: the base config, e.g. a HouseCreationAndCalculationJob
+        :type config: Any
+        :param slots: the slots to create, either names from SLOT_PATHS or paths of
+            values in the config, e.g. "CalcSpec.InternalTimeResolution"
+        :type slots: Iterable[str]
+        :raises KeyError: if the config has no value at the path of a slot
+        :raises ValueError: if a slot refers to the same value as another slot or to a
+            value that contains it
+        """
+        data = to_dict(config)
+        # random marker, so that it cannot be confused with a value in the config
+        marker_prefix = f"\x00slot-{uuid4().hex}-"
+        self.slot_paths: Dict[str, str] = {}
+        self.defaults: Dict[str, str] = {}
+        for index, slot in enumerate(dict.fromkeys(slots)):
+            path = SLOT_PATHS.get(slot, slot)
+            # a slot must not be inside the value of another slot
+            prefix = f"{path}."
+            for other_slot, other_path in self.slot_paths.items():
+                other_prefix = f"{other_path}."
+                if prefix.startswith(other_prefix) or other_prefix.startswith(prefix):
+                    raise ValueError(
+                        f"The slots '{other_slot}' and '{slot}' overlap in the config"
+                    )
+            container: Any = data
+            keys: List[Any] = [int(k) if k.isdigit() else k for k in path.split(".")]
+            try:
+                for key in keys[:-1]:
+                    container = container[key]
+                self.defaults[slot] = _json_encoder.encode(container[keys[-1]])
+            except (KeyError, IndexError, TypeError):
+                raise KeyError(f"The config has no value at '{path}'") from None
+            container[keys[-1]] = f"{marker_prefix}{index}"
+            self.slot_paths[slot] = path
+        # split the serialized config at the markers
+        marker_pattern = re.escape(json.dumps(marker_prefix)[:-1]) + r'(\d+)"'
+        pieces = re.split(marker_pattern, _json_encoder.encode(data))
+        slot_names = list(self.slot_paths)
+        self._parts: List[str] = pieces[::2]
+        self._order: List[str] = [slot_names[int(i)] for i in pieces[1::2]]
+        if sorted(self._order) != sorted(slot_names):
+            raise ValueError("The slot markers were not found in the serialized config")
+
+    def render(self, **values: Any) -> str:
+        """
+        Creates the JSON representation of a variant of the config
+
+        :param values: the values of the slots of the variant. Slots without a value
+            keep the value of the base config.
+        :return: the JSON representation of the variant
+        :rtype: str
+        :raises KeyError: if a value is given for a slot that the template does not have
+        """
+        unknown_slots = values.keys() - self.defaults.keys()
+        if unknown_slots:
+            raise KeyError(f"Unknown slots: {', '.join(sorted(unknown_slots))}")
+        pieces = [self._parts[0]]
+        for slot, part in zip(self._order, self._parts[1:]):
+            if slot in values:
+                pieces.append(_encode_json_value(values[slot]))
+            else:
+                pieces.append(self.defaults[slot])
+            pieces.append(part)
+        return "".join(pieces)
@@ -0,0 +1,496 @@
+"""
+Pipeline for processing large numbers of requests, in which submitting, polling,
+downloading and decoding the results and passing them on to a sink happen concurrently
+in separate stages
+"""
+
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+from concurrent import futures
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+
+from utspclient.cache import get_request_hash
+from utspclient.client import UTSPClient, decompress_result_data
+from utspclient.datastructures import (
+    CalculationStatus,
+    RestReply,
+    ResultDelivery,
+    TimeSeriesRequest,
+)
+from utspclient.polling import get_providername
+
+logger = logging.getLogger(__name__)
+
+#: Receives each request together with its decoded results
+Sink = Callable[[str, ResultDelivery], None]
+#: Receives each request whose processing failed together with the error
+ErrorSink = Callable[[str, Exception], None]
+
+FINISHED_STATUSES = (CalculationStatus.INDATABASE, CalculationStatus.CALCULATIONFAILED)
+
+# signals the worker threads of a stage to stop
+_STOP = None
+# time in seconds after which blocked worker threads check whether the pipeline was stopped
+_STOP_CHECK_INTERVAL = 0.1
+
+
+@dataclass
+class _PipelineEntry:
+    """A request that is processed by the pipeline"""
+
+    request: str
+    providername: str
+    reply: Optional[RestReply] = None
+    delivery: Optional[ResultDelivery] = None
+    attempt: int = 0
+    # number of failed status checks or downloads in a row
+    errors: int = 0
+    start_time: float = field(default_factory=time.time)
+
+
+class Pipeline:
+    """
+    Processes requests in concurrent stages that are connected by bounded queues:
+
+    1. submitters send the requests to the server in batches
+    2. a single scheduler thread checks the statuses of the submitted requests when they
+       are due according to the polling policy of the client, using bulk status
+       requests if the server supports them
+    3. downloaders fetch the results of finished requests
+    4. decoders decompress and decode the results, in threads or in separate processes
+    5. the sink receives the decoded results, e.g. for writing them to disk
+
+    The number of requests in the pipeline at the same time is limited, and each stage
+    blocks when the queue to the next stage is full, so that memory usage does not grow
+    when a stage is slower than the previous ones.
+
+    Status checks and downloads that fail, e.g. because of a dropped connection, are
+    retried with the delays of the polling policy. Only when too many of them failed in
+    a row for a request, the request fails.
+    """
+
+    def __init__(
+        self,
+        client: UTSPClient,
+        sink: Sink,
+        url: Optional[str] = None,
+        submitters: int = 2,
+        downloaders: int = 4,
+        decoders: int = 2,
+        use_processes: bool = False,
+        max_in_flight: int = 1000,
+        queue_size: int = 100,
+        batch_size: int = 100,
+        error_sink: Optional[ErrorSink] = None,
+        max_retries: int = 5,
+    ) -> None:
+        """
+        Creates a new pipeline
+
+        :param client: the client to use for sending requests
+        :type client: UTSPClient
+        :param sink: function that receives each request with its decoded results. It is
+            always called from the same thread.
+        :type sink: Sink
+        :param url: URL of the profile request endpoint, defaults to the client url
+        :type url: Optional[str], optional
+        :param submitters: number of threads submitting requests, defaults to 2
+        :type submitters: int, optional
+        :param downloaders: number of threads downloading results, defaults to 4
+        :type downloaders: int, optional
+        :param decoders: number of threads or processes decoding results, defaults to 2
+        :type decoders: int, optional
+        :param use_processes: whether to decode results in separate processes instead of
+            threads, defaults to False
+        :type use_processes: bool, optional
+        :param max_in_flight: maximum number of requests in the pipeline at the same time,
+            defaults to 1000
+        :type max_in_flight: int, optional
+        :param queue_size: maximum number of items waiting between two stages, defaults
+            to 100
+        :type queue_size: int, optional
+        :param batch_size: number of requests that are submitted together, defaults to 100
+        :type batch_size: int, optional
+        :param error_sink: function that receives each request whose calculation or
+            processing failed, with the error. Defaults to None, in which case the
+            errors are collected in the errors attribute.
+        :type error_sink: Optional[ErrorSink], optional
+        :param max_retries: number of times a failed status check or download of a
+            request is retried before the request fails, defaults to 5
+        :type max_retries: int, optional
+        """
+        assert min(submitters, downloaders, decoders) > 0, "Each stage needs a worker"
+        self.client = client
+        self.sink = sink
+        self.url = url
+        self.submitters = submitters
+        self.downloaders = downloaders
+        self.decoders = decoders
+        self.use_processes = use_processes
+        self.max_in_flight = max_in_flight
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.error_sink = error_sink
+        self.max_retries = max_retries
+        self.errors: List[Tuple[str, Exception]] = []
+        self.completed = 0
+
+    def run(self, requests: Iterable[Union[str, TimeSeriesRequest]]) -> int:
+        """
+        Processes the requests and waits until the results of all of them were passed to
+        the sink or their processing failed
+
+        :param requests: the requests to process
+        :type requests: Iterable[Union[str, TimeSeriesRequest]]
+        :return: the number of requests whose results were passed to the sink
+        :rtype: int
+        """
+        self.errors = []
+        self.completed = 0
+        self._in_flight = threading.BoundedSemaphore(self.max_in_flight)
+        self._submit_queue: "queue.Queue[Optional[List[_PipelineEntry]]]" = queue.Queue(
+            self.queue_size
+        )
+        self._download_queue: "queue.Queue[Optional[_PipelineEntry]]" = queue.Queue(
+            self.queue_size
+        )
+        self._decode_queue: "queue.Queue[Optional[_PipelineEntry]]" = queue.Queue(
+            self.queue_size
+        )
+        self._sink_queue: "queue.Queue[Optional[_PipelineEntry]]" = queue.Queue(
+            self.queue_size
+        )
+        self._poll_queue: List[Tuple[float, int, _PipelineEntry]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._process_pool = (
+            # the process pool module is only imported when it is used
+            futures.ProcessPoolExecutor(self.decoders) if self.use_processes else None
+        )
+        stages = [
+            (self._submit_loop, self.submitters),
+            (self._poll_loop, 1),
+            (self._download_loop, self.downloaders),
+            (self._decode_loop, self.decoders),
+            (self._sink_loop, 1),
+        ]
+        threads = [
+            threading.Thread(target=target, name=f"UTSPPipeline-{target.__name__}")
+            for target, count in stages
+            for _ in range(count)
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        try:
+            self._feed(requests)
+            # wait until all requests have left the pipeline
+            for _ in range(self.max_in_flight):
+                self._in_flight.acquire()
+        finally:
+            self._stop(threads)
+        return self.completed
+
+    def _feed(self, requests: Iterable[Union[str, TimeSeriesRequest]]) -> None:
+        """Passes the requests to the submitters in batches"""
+        batch: List[_PipelineEntry] = []
+        for request in requests:
+            if not self._in_flight.acquire(blocking=False):
+                # the pipeline is full: submit the waiting requests before blocking
+                if batch:
+                    self._submit_queue.put(batch)
+                    batch = []
+                self._in_flight.acquire()
+            providername = get_providername(request)
+            if isinstance(request, TimeSeriesRequest):
+                request = request.to_json()  # type: ignore
+            entry = _PipelineEntry(request, providername)  # type: ignore
+            try:
+                entry.delivery = self.client.get_cached_result(request)
+            except Exception as e:
+                self._fail(entry, e)
+                continue
+            if entry.delivery is not None:
+                self._sink_queue.put(entry)
+                continue
+            batch.append(entry)
+            if len(batch) >= self.batch_size:
+                self._submit_queue.put(batch)
+                batch = []
+        if batch:
+            self._submit_queue.put(batch)
+
+    def _stop(self, threads: List[threading.Thread]) -> None:
+        """Stops all worker threads. If the pipeline is stopped because of an error,
+        the requests that are still in the pipeline are dropped."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        # wake up idle workers right away; workers that are busy or blocked by a full
+        # queue notice that the pipeline was stopped within the stop check interval
+        for items, count in [
+            (self._submit_queue, self.submitters),
+            (self._download_queue, self.downloaders),
+            (self._decode_queue, self.decoders),
+            (self._sink_queue, 1),
+        ]:
+            for _ in range(count):
+                try:
+                    items.put_nowait(_STOP)  # type: ignore
+                except queue.Full:
+                    break
+        for thread in threads:
+            thread.join()
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+
+    def _get(self, items: "queue.Queue[Any]") -> Any:
+        """Takes the next item from the queue of a stage, or returns _STOP when the
+        pipeline is stopped"""
+        while not self._stopped:
+            try:
+                return items.get(timeout=_STOP_CHECK_INTERVAL)
+            except queue.Empty:
+                pass
+        return _STOP
+
+    def _put(self, items: "queue.Queue[Any]", item: Any) -> None:
+        """Puts an item into the queue of a stage, or drops it when the pipeline is
+        stopped"""
+        while not self._stopped:
+            try:
+                items.put(item, timeout=_STOP_CHECK_INTERVAL)
+                return
+            except queue.Full:
+                pass
+
+    def _fail(self, entry: _PipelineEntry, error: Exception) -> None:
+        """Reports a failed request and removes it from the pipeline"""
+        try:
+            if self.error_sink is not None:
+                self.error_sink(entry.request, error)
+            else:
+                self.errors.append((entry.request, error))
+        except Exception as sink_error:
+            self.errors.append((entry.request, sink_error))
+        finally:
+            self._in_flight.release()
+
+    def _retry(self, entry: _PipelineEntry, error: Exception) -> None:
+        """Schedules another status check of a request after a failed status check or
+        download, or fails the request if too many of them failed in a row"""
+        entry.errors += 1
+        if entry.errors > self.max_retries:
+            self._fail(entry, error)
+            return
+        logger.warning(
+            "Status check failed, retry %d of %d: %s",
+            entry.errors,
+            self.max_retries,
+            error,
+        )
+        self._schedule(entry)
+
+    def _schedule(self, entry: _PipelineEntry, delay: Optional[float] = None) -> None:
+        """Schedules the next status check of a request, by default according to the
+        polling policy of the client"""
+        if delay is None:
+            delay = self.client.polling_policy.get_delay(
+                entry.providername, entry.attempt
+            )
+            entry.attempt += 1
+        with self._condition:
+            item = (time.time() + delay, next(self._counter), entry)
+            heapq.heappush(self._poll_queue, item)
+            self._condition.notify()
+
+    def _handle_reply(self, entry: _PipelineEntry, reply: RestReply) -> None:
+        """Passes a request on to the next stage depending on its status"""
+        entry.reply = reply
+        if reply.status not in FINISHED_STATUSES:
+            entry.errors = 0
+            self._schedule(entry)
+            return
+        if reply.status == CalculationStatus.INDATABASE and entry.attempt > 0:
+            # learn how long the calculation took for polling future requests
+            self.client.polling_policy.record_duration(
+                entry.providername, time.time() - entry.start_time
+            )
+        if reply.status == CalculationStatus.INDATABASE and not reply.result_delivery:
+            # only the status is known, the results still have to be downloaded
+            self._put(self._download_queue, entry)
+        else:
+            self._put(self._decode_queue, entry)
+
+    def _submit_loop(self) -> None:
+        while True:
+            batch = self._get(self._submit_queue)
+            if batch is _STOP:
+                return
+            try:
+                replies = self.client.send_requests(
+                    [entry.request for entry in batch], self.url
+                )
+            except Exception as e:
+                for entry in batch:
+                    self._fail(entry, e)
+                continue
+            for entry, reply in zip(batch, replies):
+                try:
+                    if reply.status == CalculationStatus.UNKNOWN:
+                        raise Exception("The server did not accept the request")
+                    self._handle_reply(entry, reply)
+                except Exception as e:
+                    self._fail(entry, e)
+
+    def _next_due_entries(self) -> Optional[List[_PipelineEntry]]:
+        """Waits until at least one request is due for a status check and returns all
+        due requests, or None when stopped"""
+        with self._condition:
+            while not self._stopped:
+                if not self._poll_queue:
+                    self._condition.wait()
+                    continue
+                wait_time = self._poll_queue[0][0] - time.time()
+                if wait_time > 0:
+                    self._condition.wait(wait_time)
+                    continue
+                now = time.time()
+                entries = []
+                while self._poll_queue and self._poll_queue[0][0] <= now:
+                    entries.append(heapq.heappop(self._poll_queue)[2])
+                return entries
+        return None
+
+    def _poll_loop(self) -> None:
+        while True:
+            entries = self._next_due_entries()
+            if entries is None:
+                return
+            hashed_entries = [e for e in entries if e.reply and e.reply.request_hash]
+            other_entries = [
+                e for e in entries if not (e.reply and e.reply.request_hash)
+            ]
+            if self.client.bulk_status_supported is False:
+                hashed_entries, other_entries = [], entries
+            elif self.client.bulk_status_supported is None and hashed_entries:
+                # find out whether bulk status requests are supported using one request
+                for entry in hashed_entries[1:]:
+                    self._schedule(entry, 0)
+                hashed_entries = hashed_entries[:1]
+            # stay within the poll budget
+            for entry in other_entries:
+                self.client.poll_budget.wait()
+                # the downloaders check the status of each of these requests
+                self._put(self._download_queue, entry)
+            if not hashed_entries:
+                continue
+            self.client.poll_budget.wait()
+            try:
+                statuses = self.client.get_statuses(
+                    [e.reply.request_hash for e in hashed_entries], self.url  # type: ignore
+                )
+            except Exception as e:
+                for entry in hashed_entries:
+                    if self.client.bulk_status_supported is False:
+                        # the downloaders check the status instead
+                        self._schedule(entry, 0)
+                    else:
+                        self._retry(entry, e)
+                continue
+            unknown_entries = []
+            for entry, status in zip(hashed_entries, statuses):
+                try:
+                    reply = RestReply(
+                        None, CalculationStatus(int(status)), entry.reply.request_hash  # type: ignore
+                    )
+                    if reply.status == CalculationStatus.UNKNOWN:
+                        # the server does not know the request (anymore), just like in
+                        # UTSPClient.poll it has to be submitted again
+                        unknown_entries.append(entry)
+                    else:
+                        self._handle_reply(entry, reply)
+                except Exception as e:
+                    self._fail(entry, e)
+            if unknown_entries:
+                self._put(self._submit_queue, unknown_entries)
+
+    def _download_loop(self) -> None:
+        while True:
+            entry = self._get(self._download_queue)
+            if entry is _STOP:
+                return
+            try:
+                if entry.reply is None:
+                    reply = self.client.send_request(entry.request, self.url)
+                else:
+                    reply = self.client.poll(entry.request, entry.reply, self.url)
+                if reply.status == CalculationStatus.INDATABASE and (
+                    not reply.result_delivery
+                ):
+                    # the results were not included in the status reply
+                    reply = self.client.send_request(entry.request, self.url)
+                if reply.status == CalculationStatus.INDATABASE and (
+                    not reply.result_delivery
+                ):
+                    raise Exception("No time series was delivered")
+            except Exception as e:
+                self._retry(entry, e)
+                continue
+            try:
+                self._handle_reply(entry, reply)
+            except Exception as e:
+                self._fail(entry, e)
+
+    def _decode(self, entry: _PipelineEntry) -> ResultDelivery:
+        """Decodes the results of a finished request"""
+        reply: RestReply = entry.reply  # type: ignore
+        if self._process_pool is None or reply.status != CalculationStatus.INDATABASE:
+            delivery = self.client.get_result(reply, entry.request)
+        else:
+            delivery = self._process_pool.submit(
+                decompress_result_data,
+                reply.result_delivery,  # type: ignore
+                self.client.max_result_memory,
+                self.client.spill_directory,
+            ).result()
+            request_hash = get_request_hash(entry.request)
+            if self.client.cache is not None:
+                self.client.cache.put(request_hash, reply.result_delivery)  # type: ignore
+            if self.client.memory_cache is not None:
+                self.client.memory_cache.put(request_hash, delivery)
+        assert delivery is not None, "No time series was delivered"
+        return delivery
+
+    def _decode_loop(self) -> None:
+        while True:
+            entry = self._get(self._decode_queue)
+            if entry is _STOP:
+                return
+            try:
+                entry.delivery = self._decode(entry)
+            except Exception as e:
+                self._fail(entry, e)
+                continue
+            # the compressed data is not needed anymore
+            entry.reply = None
+            self._put(self._sink_queue, entry)
+
+    def _sink_loop(self) -> None:
+        while True:
+            entry = self._get(self._sink_queue)
+            if entry is _STOP:
+                return
+            try:
+                self.sink(entry.request, entry.delivery)  # type: ignore
+            except Exception as e:
+                self._fail(entry, e)
+                continue
+            self.completed += 1
+            self._in_flight.release()
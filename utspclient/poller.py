@@ -0,0 +1,260 @@
+"""
+Background poller that checks the statuses of many outstanding requests from a single
+thread
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple, Union
+
+from utspclient.datastructures import (
+    CalculationStatus,
+    RestReply,
+    ResultDelivery,
+    TimeSeriesRequest,
+)
+from utspclient.polling import get_providername
+
+if TYPE_CHECKING:
+    from utspclient.client import UTSPClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PollEntry:
+    """An outstanding request that is tracked by the poller"""
+
+    request: str
+    url: Optional[str]
+    providername: str
+    future: "Future[ResultDelivery]"
+    reply: Optional[RestReply] = None
+    attempt: int = 0
+    # number of failed status checks in a row
+    errors: int = 0
+    start_time: float = field(default_factory=time.time)
+    on_status: Optional[Callable[[RestReply], None]] = None
+
+
+class BackgroundPoller:
+    """
+    Tracks any number of outstanding requests and checks their statuses from a single
+    background thread. The requests are polled in the order in which they are due
+    according to the polling policy of the client, and the total number of status
+    checks per second is limited by the poll budget of the client, independent of the
+    number of tracked requests.
+
+    For each tracked request a future is returned that is resolved as soon as the
+    results are available or the calculation failed. Finished replies are handed to a
+    small pool of worker threads that decode the results and resolve the futures, so
+    that the polling thread only checks statuses.
+
+    Status checks that fail, e.g. because of a dropped connection, are retried with the
+    delays of the polling policy. Only when too many checks of a request failed in a
+    row, the future of the request is resolved with the error.
+    """
+
+    def __init__(
+        self,
+        client: "UTSPClient",
+        result_workers: int = 2,
+        max_retries: int = 5,
+    ) -> None:
+        """
+        Creates a new poller. The background thread is started when the first request is
+        tracked.
+
+        :param client: the client to use for sending requests. The status checks count
+            towards the poll budget of the client.
+        :type client: UTSPClient
+        :param result_workers: number of threads for decoding the results of finished
+            requests, defaults to 2
+        :type result_workers: int, optional
+        :param max_retries: number of times a failed status check of a request is
+            retried before the request fails, defaults to 5
+        :type max_retries: int, optional
+        """
+        assert result_workers > 0, "At least one result worker is needed"
+        self.client = client
+        self.max_retries = max_retries
+        self._queue: List[Tuple[float, int, _PollEntry]] = []
+        # tie breaker for entries with the same due time
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        # the worker threads are only started when the first result is decoded
+        self._result_executor = ThreadPoolExecutor(
+            result_workers, thread_name_prefix="UTSPResultWorker"
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of tracked requests"""
+        with self._condition:
+            return len(self._queue)
+
+    def track(
+        self,
+        request: Union[str, TimeSeriesRequest],
+        reply: Optional[RestReply] = None,
+        url: Optional[str] = None,
+        on_status: Optional[Callable[[RestReply], None]] = None,
+    ) -> "Future[ResultDelivery]":
+        """
+        Starts tracking a request. If no reply is passed, the request has not been
+        submitted yet and is submitted by the poller.
+
+        :param request: the request to track
+        :type request: Union[str, TimeSeriesRequest]
+        :param reply: the reply received when submitting the request, defaults to None
+        :type reply: Optional[RestReply], optional
+        :param url: URL the request is submitted to, defaults to the client url
+        :type url: Optional[str], optional
+        :param on_status: function that is called on the polling thread with each reply
+            that has a new status, defaults to None. It must return quickly.
+        :type on_status: Optional[Callable[[RestReply], None]], optional
+        :return: a future for the result of the request
+        :rtype: Future[ResultDelivery]
+        """
+        providername = get_providername(request)
+        if isinstance(request, TimeSeriesRequest):
+            request = request.to_json()  # type: ignore
+        future: "Future[ResultDelivery]" = Future()
+        entry = _PollEntry(
+            request, url, providername, future, reply, on_status=on_status  # type: ignore
+        )
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError("The poller has already been stopped")
+        delay = 0.0
+        if reply is not None:
+            if self._finish(entry, reply):
+                return future
+            delay = self.client.polling_policy.get_delay(providername, 0)
+            entry.attempt = 1
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError("The poller has already been stopped")
+            self._schedule(entry, time.time() + delay)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="UTSPPoller", daemon=True
+                )
+                self._thread.start()
+        return future
+
+    def stop(self) -> None:
+        """Stops the background thread and cancels the futures of all tracked requests.
+        Results that are already being decoded are still delivered."""
+        with self._condition:
+            self._stopped = True
+            entries = [entry for _, _, entry in self._queue]
+            self._queue.clear()
+            self._condition.notify_all()
+        for entry in entries:
+            entry.future.cancel()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        # don't wait for the workers, stop might be called from a future callback
+        self._result_executor.shutdown(wait=False)
+
+    def _schedule(self, entry: _PollEntry, due_time: float) -> None:
+        # must be called while holding the condition lock
+        heapq.heappush(self._queue, (due_time, next(self._counter), entry))
+        self._condition.notify()
+
+    def _next_entry(self) -> Optional[_PollEntry]:
+        """Waits until the next request is due and returns it, or None when stopped"""
+        with self._condition:
+            while not self._stopped:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                wait_time = self._queue[0][0] - time.time()
+                if wait_time > 0:
+                    self._condition.wait(wait_time)
+                    continue
+                return heapq.heappop(self._queue)[2]
+        return None
+
+    def _run(self) -> None:
+        while True:
+            entry = self._next_entry()
+            if entry is None:
+                return
+            if entry.future.cancelled():
+                continue
+            self.client.poll_budget.wait()
+            try:
+                if entry.reply is None:
+                    reply = self.client.send_request(entry.request, entry.url)
+                else:
+                    reply = self.client.poll(entry.request, entry.reply, entry.url)
+                if self._finish(entry, reply):
+                    continue
+                entry.errors = 0
+            except Exception as e:
+                entry.errors += 1
+                if entry.errors > self.max_retries:
+                    if entry.future.set_running_or_notify_cancel():
+                        entry.future.set_exception(e)
+                    continue
+                logger.warning(
+                    "Status check failed, retry %d of %d: %s",
+                    entry.errors,
+                    self.max_retries,
+                    e,
+                )
+            delay = self.client.polling_policy.get_delay(
+                entry.providername, entry.attempt
+            )
+            entry.attempt += 1
+            with self._condition:
+                if self._stopped:
+                    entry.future.cancel()
+                    return
+                self._schedule(entry, time.time() + delay)
+
+    def _finish(self, entry: _PollEntry, reply: RestReply) -> bool:
+        """
+        Stores the new reply of a request and passes it to the result workers if the
+        calculation is finished
+
+        :return: True if the request is finished, else False
+        """
+        previous_reply = entry.reply
+        entry.reply = reply
+        if entry.on_status is not None and (
+            previous_reply is None or previous_reply.status != reply.status
+        ):
+            entry.on_status(reply)
+        if reply.status not in [
+            CalculationStatus.INDATABASE,
+            CalculationStatus.CALCULATIONFAILED,
+        ]:
+            return False
+        if reply.status == CalculationStatus.INDATABASE and entry.attempt > 0:
+            # learn how long the calculation took for polling future requests
+            self.client.polling_policy.record_duration(
+                entry.providername, time.time() - entry.start_time
+            )
+        self._result_executor.submit(self._resolve, entry, reply)
+        return True
+
+    def _resolve(self, entry: _PollEntry, reply: RestReply) -> None:
+        """Gets the results of a finished request and resolves its future. Runs on one
+        of the result workers."""
+        if not entry.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self.client.get_result(reply, entry.request)
+            assert result is not None, "No time series was delivered"
+            entry.future.set_result(result)
+        except Exception as e:
+            entry.future.set_exception(e)
@@ -0,0 +1,174 @@
+"""
+Polling policies that determine how often the status of a request is checked while
+waiting for its results
+"""
+
+import json
+import math
+import random
+import threading
+import time
+from typing import Dict, Optional, Union
+
+from utspclient.datastructures import TimeSeriesRequest
+
+
+def get_providername(request: Union[str, TimeSeriesRequest]) -> str:
+    """
+    Returns the name of the provider a request is meant for
+
+    :param request: the request, either as object or as json string
+    :type request: Union[str, TimeSeriesRequest]
+    :return: the provider name, or an empty string if it could not be determined
+    :rtype: str
+    """
+    if isinstance(request, TimeSeriesRequest):
+        return request.providername
+    try:
+        return json.loads(request).get("providername", "")
+    except (ValueError, AttributeError):
+        return ""
+
+
+class PollingPolicy:
+    """
+    Polling policy with exponential backoff and jitter. The policy additionally learns
+    how long requests for each provider (e.g. "lpg", "hisim", "smelpg") usually take
+    until their results are available, so that the first status check after submitting
+    a request can be scheduled shortly before the expected completion time. Checking
+    slightly early allows the learned durations to decrease again, too.
+
+    The policy is thread-safe and can be shared between clients.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 1,
+        factor: float = 2,
+        max_delay: float = 60,
+        jitter: float = 0.1,
+        learn_durations: bool = True,
+        smoothing: float = 0.2,
+        first_check_share: float = 0.8,
+    ) -> None:
+        """
+        Creates a new polling policy
+
+        :param initial_delay: delay before the first status check in seconds, if no duration
+            was learned for the provider yet, defaults to 1
+        :type initial_delay: float, optional
+        :param factor: factor by which the delay increases with each status check, defaults to 2
+        :type factor: float, optional
+        :param max_delay: maximum delay between two status checks in seconds, defaults to 60
+        :type max_delay: float, optional
+        :param jitter: maximum relative random deviation of each delay, so that the status
+            checks of requests submitted at the same time are spread out, defaults to 0.1
+        :type jitter: float, optional
+        :param learn_durations: whether to learn the durations of each provider, defaults to True
+        :type learn_durations: bool, optional
+        :param smoothing: weight of a new observation in the exponential moving average of the
+            durations, defaults to 0.2
+        :type smoothing: float, optional
+        :param first_check_share: share of the expected duration after which the first status
+            check is done, defaults to 0.8
+        :type first_check_share: float, optional
+        """
+        assert initial_delay > 0, "The initial delay must be positive"
+        assert factor >= 1, "The backoff factor must not be smaller than 1"
+        assert 0 <= jitter < 1, "The jitter must be in [0, 1)"
+        assert 0 < smoothing <= 1, "The smoothing factor must be in (0, 1]"
+        assert 0 < first_check_share <= 1, "The first check share must be in (0, 1]"
+        self.initial_delay = initial_delay
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.learn_durations = learn_durations
+        self.smoothing = smoothing
+        self.first_check_share = first_check_share
+        self._durations: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def expected_duration(self, providername: str) -> Optional[float]:
+        """
+        Returns the learned duration until results of the provider are available
+
+        :param providername: name of the provider
+        :type providername: str
+        :return: the expected duration in seconds, or None if nothing was learned yet
+        :rtype: Optional[float]
+        """
+        with self._lock:
+            return self._durations.get(providername.lower())
+
+    def record_duration(self, providername: str, duration: float) -> None:
+        """
+        Adds an observed duration from submission of a request until its results were
+        available
+
+        :param providername: name of the provider
+        :type providername: str
+        :param duration: the observed duration in seconds
+        :type duration: float
+        """
+        if not self.learn_durations or not providername:
+            return
+        key = providername.lower()
+        with self._lock:
+            old = self._durations.get(key)
+            if old is None:
+                self._durations[key] = duration
+            else:
+                self._durations[key] = old + self.smoothing * (duration - old)
+
+    def get_delay(self, providername: str, attempt: int) -> float:
+        """
+        Returns the time to wait before the next status check of a request
+
+        :param providername: name of the provider that processes the request
+        :type providername: str
+        :param attempt: number of status checks already done since submission
+        :type attempt: int
+        :return: the delay in seconds
+        :rtype: float
+        """
+        expected = self.expected_duration(providername) if attempt == 0 else None
+        if expected is not None:
+            delay = max(expected * self.first_check_share, self.initial_delay)
+        else:
+            if self.factor > 1 and self.max_delay > self.initial_delay:
+                # stop growing the exponent once the maximum delay is reached, so that
+                # long waits do not overflow
+                max_attempt = math.log(self.max_delay / self.initial_delay, self.factor)
+                attempt = min(attempt, math.ceil(max_attempt))
+            else:
+                attempt = 0
+            delay = min(self.initial_delay * self.factor**attempt, self.max_delay)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class PollBudget:
+    """
+    Limits the number of status checks per second across all threads that share the
+    budget. Each caller is assigned the next free time slot and waits until it is due.
+    """
+
+    def __init__(self, max_polls_per_second: float) -> None:
+        """
+        Creates a new poll budget
+
+        :param max_polls_per_second: maximum number of status checks per second
+        :type max_polls_per_second: float
+        """
+        assert max_polls_per_second > 0, "The poll budget must be positive"
+        self.min_interval = 1 / max_polls_per_second
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Waits until the next status check is allowed"""
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
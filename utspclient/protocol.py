@@ -0,0 +1,404 @@
+"""
+Parts of the UTSP protocol that are shared by the synchronous and the asynchronous
+client: endpoints and headers, building request bodies, interpreting replies and
+negotiating optional server features. The clients only add the HTTP transport.
+"""
+
+import base64
+import dataclasses
+import gzip
+import hashlib
+import json
+import zlib
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Union
+from urllib.parse import urljoin
+
+import numpy as np
+from utspclient.cache import DecodedResultCache, ResultCache
+from utspclient.datastructures import CalculationStatus, RestReply, TimeSeriesRequest
+from utspclient.decoding import parse_rest_replies, parse_rest_reply
+from utspclient.polling import PollingPolicy
+
+#: Endpoint for lightweight status requests that only carry the request hash. It is
+#: resolved relative to the URL the request was submitted to.
+STATUS_BY_HASH_ENDPOINT = "requeststatusbyhash"
+
+#: HTTP status codes with which a server signals that it does not provide an endpoint
+ENDPOINT_NOT_SUPPORTED_CODES = (404, 405, 501)
+
+#: Endpoint for querying the statuses of many requests at once, resolved relative to the
+#: URL of the profile request endpoint. It receives a json list of request hashes and
+#: returns the status codes in the same order, either as json list of integers or as
+#: raw bytes with one byte per status code.
+BULK_STATUS_ENDPOINT = "requeststatusbulk"
+
+#: Endpoint for submitting a batch of requests at once, resolved relative to the URL of
+#: the profile request endpoint. It receives a json list of requests and returns a json
+#: list with the replies in the same order.
+BATCH_ENDPOINT = "profilerequestbatch"
+
+#: Endpoints of the input file store of the server, resolved relative to the URL the
+#: request is sent to. The check endpoint receives a json list of sha256 hashes of file
+#: contents and returns the list of hashes that are not stored yet. The upload endpoint
+#: receives the raw content of a single file, with its hash in the CONTENT_HASH_HEADER.
+INPUT_FILE_CHECK_ENDPOINT = "inputfilecheck"
+INPUT_FILE_UPLOAD_ENDPOINT = "inputfileupload"
+CONTENT_HASH_HEADER = "UTSP-Content-Hash"
+
+#: Content encodings that can be used for compressing request bodies
+REQUEST_ENCODINGS = ("gzip", "deflate")
+
+#: HTTP status codes with which a server rejects a compressed request body
+ENCODING_NOT_SUPPORTED_CODES = (400, 415)
+
+#: Headers for negotiating a binary transfer of result data. Servers that support it can
+#: either send the result data as raw response body, with the remaining reply fields in
+#: the REPLY_HEADERS, or base64-encoded inside the json reply. Other servers ignore these
+#: headers and send the result data as json list of integers.
+BINARY_RESULT_HEADERS = {
+    "Accept": "application/octet-stream, application/json;q=0.9",
+    "UTSP-Result-Encoding": "base64",
+}
+#: Headers containing the reply fields if the result data is the raw response body
+STATUS_HEADER = "UTSP-Status"
+REQUEST_HASH_HEADER = "UTSP-Request-Hash"
+INFO_HEADER = "UTSP-Info"
+
+#: Headers for posting json bodies
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def compress_request_body(body: bytes, encoding: str) -> bytes:
+    """
+    Compresses the body of a request
+
+    :param body: the uncompressed body
+    :type body: bytes
+    :param encoding: the content encoding to use, one of REQUEST_ENCODINGS
+    :type encoding: str
+    :return: the compressed body
+    :rtype: bytes
+    """
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    if encoding == "deflate":
+        return zlib.compress(body)
+    raise Exception(f"Unsupported content encoding: {encoding}")
+
+
+def has_input_files(request: str) -> bool:
+    """
+    Checks whether a request contains inline input files
+
+    :param request: the request as json string
+    :type request: str
+    :return: True if the request contains input files, else False
+    :rtype: bool
+    """
+    # quick check for the representation created by TimeSeriesRequest.to_json, which is
+    # unambiguous because quotes within strings are escaped
+    if '"input_files": {}' in request:
+        return False
+    return bool(json.loads(request).get("input_files"))
+
+
+def reference_input_files(
+    request: TimeSeriesRequest,
+) -> Tuple[TimeSeriesRequest, Dict[str, bytes]]:
+    """
+    Replaces the inline input files of a request by references to their content hashes
+
+    :param request: the request
+    :type request: TimeSeriesRequest
+    :return: a copy of the request with input file references instead of input files, and
+        the contents of the input files by hash
+    :rtype: Tuple[TimeSeriesRequest, Dict[str, bytes]]
+    """
+    contents: Dict[str, bytes] = {}
+    references = dict(request.input_file_references)
+    for name, encoded_content in request.input_files.items():
+        content = base64.b64decode(encoded_content)
+        content_hash = hashlib.sha256(content).hexdigest()
+        contents[content_hash] = content
+        references[name] = content_hash
+    referencing_request = dataclasses.replace(
+        request, input_files={}, input_file_references=references
+    )
+    return referencing_request, contents
+
+
+def get_upload_headers(content_hash: str) -> Dict[str, str]:
+    """Returns the headers for uploading an input file to the input file store"""
+    return {
+        "Content-Type": "application/octet-stream",
+        CONTENT_HASH_HEADER: content_hash,
+    }
+
+
+def parse_reply(headers: Mapping[str, str], body: bytes) -> RestReply:
+    """
+    Creates a RestReply object from a response of the utsp server. Supports raw binary
+    result data as well as json replies.
+
+    :param headers: headers of the response
+    :type headers: Mapping[str, str]
+    :param body: body of the response
+    :type body: bytes
+    :return: the reply object
+    :rtype: RestReply
+    """
+    if headers.get("Content-Type", "").startswith("application/octet-stream"):
+        return RestReply(
+            body,
+            CalculationStatus(int(headers[STATUS_HEADER])),
+            headers.get(REQUEST_HASH_HEADER, ""),
+            headers.get(INFO_HEADER),
+        )
+    # don't use dataclasses_json here, it has bug regarding bytes
+    return parse_rest_reply(body)
+
+
+def parse_batch_replies(body: bytes, count: int) -> List[RestReply]:
+    """
+    Parses the reply to a batch of requests
+
+    :param body: body of the response
+    :type body: bytes
+    :param count: the number of requests in the batch
+    :type count: int
+    :raises Exception: if the number of replies does not match the number of requests
+    :return: the replies, in the same order as the requests
+    :rtype: List[RestReply]
+    """
+    replies = parse_rest_replies(body)
+    if len(replies) != count:
+        raise Exception(f"Received {len(replies)} replies for {count} requests")
+    return replies
+
+
+def parse_status_vector(headers: Mapping[str, str], body: bytes) -> np.ndarray:
+    """
+    Parses the reply to a bulk status request
+
+    :param headers: headers of the response
+    :type headers: Mapping[str, str]
+    :param body: body of the response
+    :type body: bytes
+    :return: the status codes as int8 array
+    :rtype: np.ndarray
+    """
+    if headers.get("Content-Type", "").startswith("application/octet-stream"):
+        return np.frombuffer(body, dtype=np.int8)
+    return np.array(json.loads(body), dtype=np.int8)
+
+
+def parse_bulk_statuses(
+    headers: Mapping[str, str], body: bytes, count: int
+) -> np.ndarray:
+    """Parses the reply to a bulk status request for the specified number of hashes,
+    see :func:`parse_status_vector`"""
+    statuses = parse_status_vector(headers, body)
+    if len(statuses) != count:
+        raise Exception(f"Received {len(statuses)} statuses for {count} requests")
+    return statuses
+
+
+def check_status(status_code: int) -> None:
+    """Raises an exception if the HTTP status code of a response signals an error"""
+    if status_code >= 400:
+        raise Exception(f"Received error code: {status_code}")
+
+
+def is_endpoint_supported(status_code: int) -> bool:
+    """
+    Checks the response of an endpoint that not all servers provide
+
+    :param status_code: HTTP status code of the response
+    :type status_code: int
+    :raises Exception: if the server reported another error
+    :return: False if the server does not provide the endpoint, else True
+    :rtype: bool
+    """
+    if status_code in ENDPOINT_NOT_SUPPORTED_CODES:
+        return False
+    check_status(status_code)
+    return True
+
+
+def get_status_code(reply: Optional[RestReply]) -> int:
+    """Returns the status code of a reply to a status request by hash, which is None if
+    the server does not support them"""
+    if reply is None:
+        raise Exception("The server does not support status requests by hash")
+    return reply.status.value
+
+
+def is_complete_status_reply(reply: RestReply) -> bool:
+    """
+    Checks whether the reply to a status request by hash can be used instead of the
+    reply to the full request
+
+    :param reply: the reply to the status request
+    :type reply: RestReply
+    :return: False if the full request has to be sent, because the server does not know
+        the hash anymore or did not include the results of a finished request
+    :rtype: bool
+    """
+    return reply.status != CalculationStatus.UNKNOWN and (
+        reply.status != CalculationStatus.INDATABASE or bool(reply.result_delivery)
+    )
+
+
+class ClientBase:
+    """
+    Settings and negotiated server features shared by
+    :class:`utspclient.client.UTSPClient` and
+    :class:`utspclient.async_client.AsyncUTSPClient`, and the parts of the protocol that
+    do not send HTTP requests. Servers are assumed to support each optional feature
+    until they reject it once.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        poll_by_hash: bool,
+        polling_policy: Optional[PollingPolicy],
+        binary_results: bool,
+        max_result_memory: Optional[int],
+        spill_directory: Optional[str],
+        lazy_results: bool,
+        cache: Optional[ResultCache],
+        memory_cache: Optional[DecodedResultCache],
+        request_compression: Optional[str],
+        compression_threshold: int,
+        upload_input_files: bool,
+        batch_size: int,
+    ) -> None:
+        assert (
+            request_compression is None or request_compression in REQUEST_ENCODINGS
+        ), f"Unsupported content encoding: {request_compression}"
+        self.url = url
+        self.api_key = api_key
+        self.poll_by_hash = poll_by_hash
+        self.polling_policy = polling_policy or PollingPolicy()
+        self.binary_results = binary_results
+        self.max_result_memory = max_result_memory
+        self.spill_directory = spill_directory
+        self.lazy_results = lazy_results
+        self.cache = cache
+        self.memory_cache = memory_cache
+        self.request_compression = request_compression
+        self.compression_threshold = compression_threshold
+        # None until it is known whether the server accepts compressed request bodies
+        self.request_compression_supported: Optional[bool] = None
+        self.upload_input_files = upload_input_files
+        # None until it is known whether the server provides an input file store
+        self.input_file_store_supported: Optional[bool] = None
+        # input files known to be stored on the server, as (url, content hash) tuples
+        self._stored_input_files: Set[Tuple[str, str]] = set()
+        self.batch_size = batch_size
+        # None until it is known whether the server supports batches of requests
+        self.batch_supported: Optional[bool] = None
+        # None until it is known whether the server supports bulk status requests
+        self.bulk_status_supported: Optional[bool] = None
+        # None until it is known whether the server supports status requests by hash
+        self.status_by_hash_supported: Optional[bool] = None
+
+    def resolve_url(self, url: Optional[str] = None) -> str:
+        """
+        Returns the absolute URL for an endpoint
+
+        :param url: absolute URL or URL relative to the client url, defaults to the client url
+        :type url: Optional[str], optional
+        :return: the absolute URL
+        :rtype: str
+        """
+        if not url:
+            return self.url
+        return urljoin(self.url, url)
+
+    def _get_session_headers(self) -> Dict[str, str]:
+        """Returns the headers that are sent with every HTTP request"""
+        headers = {"Authorization": self.api_key}
+        if self.binary_results:
+            headers.update(BINARY_RESULT_HEADERS)
+        return headers
+
+    def _reference_input_files(
+        self, request: Union[str, TimeSeriesRequest]
+    ) -> Tuple[str, Optional[str], Dict[str, bytes]]:
+        """
+        Prepares sending a request to the server. If input files are uploaded to the
+        input file store, the request can be replaced by a request that only references
+        them, once the files are stored.
+
+        :return: the json representation of the request, the json representation of
+            the referencing request or None if no files are uploaded, and the contents
+            of the files to upload by hash
+        """
+        if isinstance(request, TimeSeriesRequest):
+            request = request.to_json()  # type: ignore
+        if (
+            not self.upload_input_files
+            or self.input_file_store_supported is False
+            or not has_input_files(request)  # type: ignore
+        ):
+            return request, None, {}  # type: ignore
+        referencing_request, contents = reference_input_files(
+            TimeSeriesRequest.from_json(request)  # type: ignore
+        )
+        return request, referencing_request.to_json(), contents  # type: ignore
+
+    def _get_unstored_input_files(
+        self, contents: Dict[str, bytes], url: str
+    ) -> List[str]:
+        """Returns the hashes of the input files that are not known to be stored on the
+        server yet"""
+        return [h for h in contents if (url, h) not in self._stored_input_files]
+
+    def _record_stored_input_files(self, url: str, content_hashes: List[str]) -> None:
+        self._stored_input_files.update((url, h) for h in content_hashes)
+
+    def _encode_json(self, value: Any) -> Tuple[bytes, Optional[bytes]]:
+        """Returns the body for posting a value as json, and the compressed body if it
+        is large enough and the server might accept it, else None"""
+        body = json.dumps(value).encode("utf-8")
+        if (
+            self.request_compression is None
+            or self.request_compression_supported is False
+            or len(body) < self.compression_threshold
+        ):
+            return body, None
+        return body, compress_request_body(body, self.request_compression)
+
+    def _get_compressed_json_headers(self) -> Dict[str, str]:
+        """Returns the headers for posting a compressed json body"""
+        assert self.request_compression is not None
+        return {**JSON_HEADERS, "Content-Encoding": self.request_compression}
+
+    def _retry_uncompressed(self, status_code: int) -> bool:
+        """Records whether the server accepted a compressed body. Returns True if the
+        server might not accept compressed bodies, so that the body has to be sent again
+        uncompressed."""
+        if (
+            self.request_compression_supported is None
+            and status_code in ENCODING_NOT_SUPPORTED_CODES
+        ):
+            return True
+        if status_code < 400:
+            self.request_compression_supported = True
+        return False
+
+    def _record_uncompressed_retry(self, status_code: int) -> None:
+        """Records the response to a body that was sent again uncompressed"""
+        if status_code < 400:
+            self.request_compression_supported = False
+
+    def _can_poll_by_hash(self, reply: RestReply) -> bool:
+        """Checks whether the status of a submitted request can be requested by hash"""
+        return bool(
+            self.poll_by_hash
+            and reply.request_hash
+            and self.status_by_hash_supported is not False
+        )